@@ -12,21 +12,7 @@ from alembic import context
 import os
 from app.db.base import Base
 # Import models to ensure they are registered with Base.metadata
-from app.models import (
-    user,
-    student,
-    trainer,
-    session,
-    attendance,
-    notification,
-    notification_preferences,
-    chatbot,
-    facial_embedding,
-    admin_message,
-    smart_attendance,
-    audit_log,
-    webhook,
-)
+import app.models  # noqa: F401
 
 # This is the Alembic Config object
 config = context.config
@@ -38,6 +24,14 @@ if config.config_file_name is not None:
 # Set target metadata for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip models mapped onto views; migrations manage those by hand."""
+    if type_ == "table" and object.info.get("is_view"):
+        return False
+    return True
+
+
 # Get database URL from environment
 database_url = os.environ.get(
     "DATABASE_URL",
@@ -49,6 +43,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=database_url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -72,6 +67,7 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
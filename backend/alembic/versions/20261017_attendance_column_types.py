@@ -0,0 +1,85 @@
+"""Narrow attendance_records column types
+
+Revision ID: 20261017_attendance_types
+Revises: 20261017_attendance_status_idx
+Create Date: 2026-10-17
+
+Why:
+- facial_confidence and percentage are model outputs/ratios that never needed
+  decimal arithmetic; NUMERIC is variable-width software decimal, DOUBLE
+  PRECISION is a fixed 8-byte native float.
+- late_minutes fits in SMALLINT (max 32767 minutes).
+- id is widened to BIGINT since attendance_records is the highest-cardinality
+  table and grows with every session x student.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_attendance_types"
+down_revision = "20261017_attendance_status_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "attendance_records",
+        "id",
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+    )
+    op.execute("ALTER SEQUENCE IF EXISTS attendance_records_id_seq AS BIGINT")
+    op.alter_column(
+        "attendance_records",
+        "facial_confidence",
+        existing_type=sa.Numeric(5, 4),
+        type_=sa.Float(),
+        postgresql_using="facial_confidence::double precision",
+    )
+    op.alter_column(
+        "attendance_records",
+        "percentage",
+        existing_type=sa.Numeric(5, 2),
+        type_=sa.Float(),
+        postgresql_using="percentage::double precision",
+    )
+    op.alter_column(
+        "attendance_records",
+        "late_minutes",
+        existing_type=sa.Integer(),
+        type_=sa.SmallInteger(),
+        postgresql_using="LEAST(late_minutes, 32767)::smallint",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "attendance_records",
+        "late_minutes",
+        existing_type=sa.SmallInteger(),
+        type_=sa.Integer(),
+    )
+    op.alter_column(
+        "attendance_records",
+        "percentage",
+        existing_type=sa.Float(),
+        type_=sa.Numeric(5, 2),
+        postgresql_using="round(percentage::numeric, 2)",
+    )
+    op.alter_column(
+        "attendance_records",
+        "facial_confidence",
+        existing_type=sa.Float(),
+        type_=sa.Numeric(5, 4),
+        postgresql_using="round(facial_confidence::numeric, 4)",
+    )
+    op.execute("ALTER SEQUENCE IF EXISTS attendance_records_id_seq AS INTEGER")
+    op.alter_column(
+        "attendance_records",
+        "id",
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+    )
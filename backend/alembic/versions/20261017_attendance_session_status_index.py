@@ -0,0 +1,55 @@
+"""Replace ix_attendance_session with a partial (session_id, status) index
+
+Revision ID: 20261017_attendance_status_idx
+Revises: n8n_integration_001
+Create Date: 2026-10-17
+
+Why:
+- ix_attendance_session is redundant: ix_attendance_session_student already
+  serves session_id lookups through its leading column.
+- Session roster queries filter on (session_id, status) for non-deleted rows,
+  which the partial index answers directly.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_attendance_status_idx"
+down_revision = "n8n_integration_001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_attendance_session_status_active",
+            "attendance_records",
+            ["session_id", "status"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_attendance_session",
+            table_name="attendance_records",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_attendance_session",
+            "attendance_records",
+            ["session_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_attendance_session_status_active",
+            table_name="attendance_records",
+            postgresql_concurrently=True,
+        )
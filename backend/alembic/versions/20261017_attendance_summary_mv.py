@@ -0,0 +1,52 @@
+"""Materialized per-day attendance counts per student
+
+Revision ID: 20261017_attendance_summary_mv
+Revises: 20261017_jsonb_gin_smart_logs
+Create Date: 2026-10-17
+
+Why:
+- The student attendance summary loaded every attendance record in the
+  window and counted statuses in Python on each request.
+- attendance_summary_mv holds one row per (student, day) with status counts,
+  so a summary sums at most `days` index-adjacent rows. The app refreshes it
+  CONCURRENTLY every few minutes (readers are not blocked), which needs the
+  unique index below.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_attendance_summary_mv"
+down_revision = "20261017_jsonb_gin_smart_logs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW attendance_summary_mv AS
+        SELECT
+            student_id,
+            marked_at::date AS day,
+            count(*)::int AS total_sessions,
+            (count(*) FILTER (WHERE status = 'present'))::int AS present,
+            (count(*) FILTER (WHERE status = 'absent'))::int AS absent,
+            (count(*) FILTER (WHERE status = 'late'))::int AS late,
+            (count(*) FILTER (WHERE status = 'excused'))::int AS excused
+        FROM attendance_records
+        WHERE marked_at IS NOT NULL
+        GROUP BY student_id, marked_at::date
+        """
+    )
+    op.create_index(
+        "ix_attendance_summary_mv_student_day",
+        "attendance_summary_mv",
+        ["student_id", "day"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW attendance_summary_mv")
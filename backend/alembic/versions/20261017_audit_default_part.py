@@ -0,0 +1,39 @@
+"""Add a DEFAULT partition to audit_logs
+
+Revision ID: 20261017_audit_default_part
+Revises: 20261017_coords_microdegrees
+Create Date: 2026-10-17
+
+Why:
+- audit_logs only had daily range partitions premade by the app's hourly
+  maintenance job. If that job failed or the app was down past the premade
+  horizon, every audited request failed with "no partition of relation found
+  for row".
+- The DEFAULT partition takes such rows instead. When the maintenance job
+  creates the missing day, it moves them into that day's partition
+  (app.db.partitioning.attach_partition_statements).
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_audit_default_part"
+down_revision = "20261017_coords_microdegrees"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+
+def downgrade() -> None:
+    # Rows in the DEFAULT partition have no range partition to go back to
+    op.execute(
+        "DO $$ BEGIN "
+        "IF EXISTS (SELECT 1 FROM audit_logs_default) THEN "
+        "RAISE EXCEPTION 'audit_logs_default holds rows outside every daily partition'; "
+        "END IF; END $$"
+    )
+    op.execute("DROP TABLE audit_logs_default")
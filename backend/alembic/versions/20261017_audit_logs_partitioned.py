@@ -0,0 +1,127 @@
+"""Partition audit_logs by day on timestamp
+
+Revision ID: 20261017_audit_logs_partitioned
+Revises: 20261017_jsonb_audit_chatbot
+Create Date: 2026-10-17
+
+Why:
+- audit_logs is append-only and high volume. GDPR retention deleted old rows
+  with DELETE ... WHERE timestamp < cutoff, which scans the whole table and
+  leaves bloat behind; recent-activity queries share B-trees with years of
+  history.
+- A native RANGE partition per day lets the planner prune to recent days and
+  turns retention into DETACH PARTITION + DROP (app.db.partitioning).
+
+The primary key becomes (id, timestamp) as PostgreSQL requires the partition
+key in unique constraints. Existing rows are copied into daily partitions
+covering their time range; future partitions are premade by the app's
+partition maintenance job.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_audit_logs_partitioned"
+down_revision = "20261017_jsonb_audit_chatbot"
+branch_labels = None
+depends_on = None
+
+
+COLUMNS_DDL = """
+    id INTEGER NOT NULL DEFAULT nextval('audit_logs_id_seq'),
+    user_id INTEGER NOT NULL,
+    user_role VARCHAR(20),
+    user_email VARCHAR(255),
+    action_type VARCHAR(50) NOT NULL,
+    action_description TEXT,
+    resource_type VARCHAR(50),
+    resource_id INTEGER,
+    ip_address VARCHAR(45),
+    user_agent VARCHAR(512),
+    request_method VARCHAR(10),
+    request_path VARCHAR(512),
+    old_values JSONB,
+    new_values JSONB,
+    meta JSONB,
+    success VARCHAR(20),
+    error_message TEXT,
+    timestamp TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    retention_days INTEGER
+"""
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_audit_logs_id", "audit_logs", ["id"])
+    op.create_index("ix_audit_user_action", "audit_logs", ["user_id", "action_type"])
+    op.create_index("ix_audit_timestamp", "audit_logs", ["timestamp"])
+    op.create_index("ix_audit_resource", "audit_logs", ["resource_type", "resource_id"])
+    op.create_index(
+        "ix_audit_meta_gin",
+        "audit_logs",
+        ["meta"],
+        postgresql_using="gin",
+        postgresql_ops={"meta": "jsonb_path_ops"},
+    )
+
+
+# Daily partitions created ahead of today
+PREMAKE_DAYS = 4
+
+
+def _partition_statements(first):
+    """Daily partitions from ``first`` (default today) through the premake horizon."""
+    today = datetime.now(timezone.utc).date()
+    day = first or today
+    statements = []
+    while day <= today + timedelta(days=PREMAKE_DAYS):
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS audit_logs_p{day:%Y%m%d} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{day.isoformat()} 00:00:00+00') "
+            f"TO ('{(day + timedelta(days=1)).isoformat()} 00:00:00+00')"
+        )
+        day += timedelta(days=1)
+    return statements
+
+
+def _oldest_day():
+    if context.is_offline_mode():
+        return None
+    oldest = op.get_bind().execute(sa.text("SELECT min(timestamp) FROM audit_logs_legacy")).scalar()
+    return oldest.astimezone(timezone.utc).date() if oldest is not None else None
+
+
+def upgrade() -> None:
+    # Keep the id sequence alive while the old table is swapped out
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY NONE")
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_legacy")
+    op.execute("ALTER INDEX audit_logs_pkey RENAME TO audit_logs_legacy_pkey")
+
+    op.execute(
+        f"CREATE TABLE audit_logs ({COLUMNS_DDL}, PRIMARY KEY (id, timestamp)) "
+        "PARTITION BY RANGE (timestamp)"
+    )
+    for statement in _partition_statements(_oldest_day()):
+        op.execute(statement)
+
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_legacy")
+    op.execute("DROP TABLE audit_logs_legacy")
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY NONE")
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute("ALTER INDEX audit_logs_pkey RENAME TO audit_logs_partitioned_pkey")
+
+    op.execute(f"CREATE TABLE audit_logs ({COLUMNS_DDL}, PRIMARY KEY (id))")
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned")
+    op.execute("DROP TABLE audit_logs_partitioned")
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+
+    _create_indexes()
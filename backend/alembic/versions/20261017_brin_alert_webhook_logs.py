@@ -0,0 +1,53 @@
+"""BRIN indexes on webhook, alert and fraud log timestamps
+
+Revision ID: 20261017_brin_alert_webhook_logs
+Revises: 20261017_confidence_basis_points
+Create Date: 2026-10-17
+
+Why:
+- webhook_logs, attendance_alerts and fraud_detections are append-only, so
+  created_at follows insertion order. Their history is only read by time
+  range (dashboards, exports), which a BRIN index serves at a tiny fraction
+  of a B-tree's size and insert cost.
+- The (webhook_id, created_at) B-tree is replaced by a plain webhook_id
+  B-tree plus the BRIN index. The partial unacknowledged/unresolved indexes
+  still serve the open-item lists.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_brin_alert_webhook_logs"
+down_revision = "20261017_confidence_basis_points"
+branch_labels = None
+depends_on = None
+
+
+BRIN_INDEXES = (
+    ("ix_webhook_logs_created_at_brin", "webhook_logs", "created_at"),
+    ("ix_attendance_alerts_created_at_brin", "attendance_alerts", "created_at"),
+    ("ix_fraud_detections_created_at_brin", "fraud_detections", "created_at"),
+)
+
+
+def upgrade() -> None:
+    op.drop_index("ix_webhook_logs_webhook_created", table_name="webhook_logs")
+    op.create_index("ix_webhook_logs_webhook_id", "webhook_logs", ["webhook_id"])
+
+    for name, table, column in BRIN_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in BRIN_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    op.drop_index("ix_webhook_logs_webhook_id", table_name="webhook_logs")
+    op.create_index("ix_webhook_logs_webhook_created", "webhook_logs", ["webhook_id", "created_at"])
@@ -0,0 +1,53 @@
+"""BRIN indexes on append-only log timestamps
+
+Revision ID: 20261017_brin_log_timestamps
+Revises: 20261017_unread_covering_idx
+Create Date: 2026-10-17
+
+Why:
+- audit_logs.timestamp, facial_verification_logs.created_at and
+  smart_attendance_logs.created_at are written in insertion order and only
+  scanned by range (retention, dashboards). A BRIN index stores one summary
+  per block range and is orders of magnitude smaller than a B-tree, leaving
+  shared_buffers for hot data.
+- None of these columns is used for point lookups, so the timestamp B-trees
+  are dropped.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_brin_log_timestamps"
+down_revision = "20261017_unread_covering_idx"
+branch_labels = None
+depends_on = None
+
+
+BRIN_INDEXES = (
+    ("ix_audit_timestamp_brin", "audit_logs", "timestamp"),
+    ("ix_facial_verification_logs_created_at_brin", "facial_verification_logs", "created_at"),
+    ("ix_smart_attendance_logs_created_at_brin", "smart_attendance_logs", "created_at"),
+)
+
+
+def upgrade() -> None:
+    op.drop_index("ix_audit_timestamp", table_name="audit_logs")
+    op.drop_index("ix_facial_verification_logs_created_at", table_name="facial_verification_logs")
+
+    for name, table, column in BRIN_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in BRIN_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    op.create_index("ix_facial_verification_logs_created_at", "facial_verification_logs", ["created_at"])
+    op.create_index("ix_audit_timestamp", "audit_logs", ["timestamp"])
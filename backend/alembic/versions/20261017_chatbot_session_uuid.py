@@ -0,0 +1,56 @@
+"""Store chatbot_conversations.session_id as a native UUID
+
+Revision ID: 20261017_chatbot_session_uuid
+Revises: 20261017_message_thread_pair
+Create Date: 2026-10-17
+
+Why:
+- session_id was a VARCHAR(100) built as "<user_id>_<timestamp>", with a
+  unique B-tree over the text. A uuid key is 16 bytes instead of ~25-36, and
+  compares as a fixed-width value on conversation lookups.
+- The id is now generated by the database (gen_random_uuid(), built in since
+  PostgreSQL 13), so the app no longer builds it.
+
+Existing non-UUID values are replaced with fresh UUIDs; nothing outside the
+row referenced the old text.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_chatbot_session_uuid"
+down_revision = "20261017_message_thread_pair"
+branch_labels = None
+depends_on = None
+
+
+UUID_PATTERN = "^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE chatbot_conversations SET session_id = gen_random_uuid()::text "
+        f"WHERE session_id IS NULL OR session_id !~ '{UUID_PATTERN}'"
+    )
+    op.alter_column(
+        "chatbot_conversations",
+        "session_id",
+        existing_type=sa.String(length=100),
+        type_=postgresql.UUID(as_uuid=True),
+        server_default=sa.text("gen_random_uuid()"),
+        postgresql_using="session_id::uuid",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "chatbot_conversations",
+        "session_id",
+        existing_type=postgresql.UUID(as_uuid=True),
+        type_=sa.String(length=100),
+        server_default=None,
+        postgresql_using="session_id::text",
+    )
@@ -0,0 +1,56 @@
+"""INCLUDE covering columns on the session/student check-in indexes
+
+Revision ID: 20261017_checkin_covering_idx
+Revises: 20261017_open_item_partial_idx
+Create Date: 2026-10-17
+
+Why:
+- The hot lookup on self_checkins and teams_participation is "the row for
+  this attendance session and student", followed by reading its status or
+  engagement figures. The plain (attendance_session_id, student_id) B-trees
+  forced a heap fetch for every such lookup.
+- Storing those columns in the index leaves (INCLUDE, PostgreSQL 11+) lets
+  the planner answer them with index-only scans. teams_participation has no
+  status column, so only presence_percentage and engagement_score are
+  included there.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_checkin_covering_idx"
+down_revision = "20261017_open_item_partial_idx"
+branch_labels = None
+depends_on = None
+
+
+COVERING_INDEXES = (
+    (
+        "ix_self_checkins_session_student",
+        "self_checkins",
+        ["status", "face_confidence", "liveness_passed"],
+    ),
+    (
+        "ix_teams_participation_session_student",
+        "teams_participation",
+        ["presence_percentage", "engagement_score"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, table, include in COVERING_INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(
+            name,
+            table,
+            ["attendance_session_id", "student_id"],
+            postgresql_include=include,
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in COVERING_INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, ["attendance_session_id", "student_id"])
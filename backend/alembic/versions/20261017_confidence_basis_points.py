@@ -0,0 +1,57 @@
+"""Store face confidence scores as SMALLINT basis points
+
+Revision ID: 20261017_confidence_basis_points
+Revises: 20261017_message_participants
+Create Date: 2026-10-17
+
+Why:
+- self_checkins.face_confidence was NUMERIC(3,2) (variable length, decoded to
+  Decimal) and attendance_records.facial_confidence a DOUBLE PRECISION
+  (8 bytes). Both hold a 0..1 ratio.
+- SMALLINT basis points (0..10000) take 2 bytes and keep more precision than
+  NUMERIC(3,2). The ORM maps them to floats through app.db.types.BasisPoints.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_confidence_basis_points"
+down_revision = "20261017_message_participants"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "self_checkins",
+        "face_confidence",
+        existing_type=sa.Numeric(3, 2),
+        type_=sa.SmallInteger(),
+        postgresql_using="round(face_confidence * 10000)::smallint",
+    )
+    op.alter_column(
+        "attendance_records",
+        "facial_confidence",
+        existing_type=sa.Float(),
+        type_=sa.SmallInteger(),
+        postgresql_using="round(facial_confidence * 10000)::smallint",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "attendance_records",
+        "facial_confidence",
+        existing_type=sa.SmallInteger(),
+        type_=sa.Float(),
+        postgresql_using="facial_confidence / 10000.0",
+    )
+    op.alter_column(
+        "self_checkins",
+        "face_confidence",
+        existing_type=sa.SmallInteger(),
+        type_=sa.Numeric(3, 2),
+        postgresql_using="round(face_confidence / 10000.0, 2)",
+    )
@@ -0,0 +1,52 @@
+"""Store classroom and check-in coordinates as integer microdegrees
+
+Revision ID: 20261017_coords_microdegrees
+Revises: 20261017_students_enrollment_idx
+Create Date: 2026-10-17
+
+Why:
+- attendance_sessions.classroom_lat/lng and self_checkins.checkin_lat/lng
+  were NUMERIC(10, 8) / NUMERIC(11, 8): variable-length values of up to 14
+  bytes, using decimal arithmetic.
+- GPS fixes are only good to a few meters. Microdegrees (degrees * 1e6,
+  about 11 cm) fit in a 4-byte INTEGER, and the radius check becomes integer
+  math.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_coords_microdegrees"
+down_revision = "20261017_students_enrollment_idx"
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = [
+    ("attendance_sessions", "classroom_lat", 10),
+    ("attendance_sessions", "classroom_lng", 11),
+    ("self_checkins", "checkin_lat", 10),
+    ("self_checkins", "checkin_lng", 11),
+]
+
+
+def upgrade() -> None:
+    for table, column, _ in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Integer(),
+            postgresql_using=f"round({column} * 1000000)::integer",
+        )
+
+
+def downgrade() -> None:
+    for table, column, precision in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Numeric(precision, 8),
+            postgresql_using=f"({column} / 1000000.0)::numeric({precision}, 8)",
+        )
@@ -0,0 +1,40 @@
+"""Store facial_embeddings.image_hash as raw bytea digest
+
+Revision ID: 20261017_image_hash_bytea
+Revises: 20261017_embedding_controle_idx
+Create Date: 2026-10-17
+
+Why:
+- image_hash held a SHA-256 as 64 hex characters. The raw 32-byte digest
+  halves the column and the ix_embeddings_image_hash key size.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_image_hash_bytea"
+down_revision = "20261017_embedding_controle_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "facial_embeddings",
+        "image_hash",
+        existing_type=sa.String(length=64),
+        type_=sa.LargeBinary(length=32),
+        postgresql_using="decode(image_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "facial_embeddings",
+        "image_hash",
+        existing_type=sa.LargeBinary(length=32),
+        type_=sa.String(length=64),
+        postgresql_using="encode(image_hash, 'hex')",
+    )
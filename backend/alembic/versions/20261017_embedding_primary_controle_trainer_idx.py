@@ -0,0 +1,38 @@
+"""Index primary facial embeddings per student and controles.trainer_id
+
+Revision ID: 20261017_embedding_controle_idx
+Revises: 20261017_notification_prefs_user_pk
+Create Date: 2026-10-17
+
+Why:
+- Lookups of a student's primary embedding filter on
+  student_id AND is_primary = true. A partial index over primary rows holds
+  exactly that working set, with no recheck of is_primary.
+- controles.trainer_id is a foreign key (ON DELETE SET NULL) without an
+  index, so deleting a trainer sequentially scans controles.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_embedding_controle_idx"
+down_revision = "20261017_notification_prefs_user_pk"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_embeddings_student_primary",
+        "facial_embeddings",
+        ["student_id"],
+        postgresql_where=sa.text("is_primary = true"),
+    )
+    op.create_index("ix_controles_trainer", "controles", ["trainer_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_controles_trainer", table_name="controles")
+    op.drop_index("ix_embeddings_student_primary", table_name="facial_embeddings")
@@ -0,0 +1,53 @@
+"""Store facial embeddings as halfvec(512)
+
+Revision ID: 20261017_embeddings_halfvec
+Revises: 20261017_embeddings_hnsw_tune
+Create Date: 2026-10-17
+
+Why:
+- vector(512) stores 4 bytes per dimension (~2 KB per row). halfvec stores FP16,
+  halving the table and HNSW index size and the memory touched per graph hop,
+  with negligible recall loss for normalized face embeddings.
+- Requires pgvector >= 0.7. The HNSW index is dropped before the type change
+  and rebuilt with halfvec_cosine_ops.
+"""
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.db.vector_index import HNSW_INDEX_NAME, hnsw_rebuild_statements
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_embeddings_halfvec"
+down_revision = "20261017_embeddings_hnsw_tune"
+branch_labels = None
+depends_on = None
+
+
+def _embedding_count() -> int:
+    if context.is_offline_mode():
+        return 0
+    return op.get_bind().execute(sa.text("SELECT COUNT(*) FROM facial_embeddings")).scalar() or 0
+
+
+def _convert(column_type: str, opclass: str) -> None:
+    count = _embedding_count()
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {HNSW_INDEX_NAME}")
+        op.execute(
+            "ALTER TABLE facial_embeddings "
+            f"ALTER COLUMN embedding TYPE {column_type} USING embedding::{column_type}"
+        )
+        op.execute("SET maintenance_work_mem = '2GB'")
+        for statement in hnsw_rebuild_statements(count, opclass)[1:]:
+            op.execute(statement)
+        op.execute("RESET maintenance_work_mem")
+
+
+def upgrade() -> None:
+    _convert("halfvec(512)", "halfvec_cosine_ops")
+
+
+def downgrade() -> None:
+    _convert("vector(512)", "vector_cosine_ops")
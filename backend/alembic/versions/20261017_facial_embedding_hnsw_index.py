@@ -0,0 +1,48 @@
+"""Add HNSW index on facial_embeddings.embedding
+
+Revision ID: 20261017_embeddings_hnsw
+Revises: 20261017_attendance_types
+Create Date: 2026-10-17
+
+Why:
+- Face matching orders by cosine distance (embedding <=> query). Without an ANN
+  index that is a sequential scan + sort over every stored embedding.
+- vector_cosine_ops matches the <=> operator used by the verification queries.
+
+The index is built CONCURRENTLY with a larger maintenance_work_mem so the HNSW
+graph build stays in memory and does not block enrollments.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_embeddings_hnsw"
+down_revision = "20261017_attendance_types"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("SET maintenance_work_mem = '2GB'")
+        op.create_index(
+            "ix_embeddings_embedding_hnsw",
+            "facial_embeddings",
+            ["embedding"],
+            unique=False,
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_concurrently=True,
+        )
+        op.execute("RESET maintenance_work_mem")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_embeddings_embedding_hnsw",
+            table_name="facial_embeddings",
+            postgresql_concurrently=True,
+        )
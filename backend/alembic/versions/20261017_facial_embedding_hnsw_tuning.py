@@ -0,0 +1,47 @@
+"""Size HNSW parameters on facial_embeddings to the embedding count
+
+Revision ID: 20261017_embeddings_hnsw_tune
+Revises: 20261017_embeddings_hnsw
+Create Date: 2026-10-17
+
+Why:
+- Fixed m/ef_construction/ef_search either waste memory on small tables or lose
+  recall on large ones. The index is rebuilt with parameters picked from the
+  current row count (see app.db.vector_index.configure_hnsw_params) and
+  hnsw.ef_search is set as the database default.
+"""
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.db.vector_index import hnsw_rebuild_statements
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_embeddings_hnsw_tune"
+down_revision = "20261017_embeddings_hnsw"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if context.is_offline_mode():
+        count = 0
+    else:
+        count = op.get_bind().execute(sa.text("SELECT COUNT(*) FROM facial_embeddings")).scalar()
+
+    with op.get_context().autocommit_block():
+        op.execute("SET maintenance_work_mem = '2GB'")
+        for statement in hnsw_rebuild_statements(count or 0, "vector_cosine_ops"):
+            op.execute(statement)
+        op.execute("RESET maintenance_work_mem")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for statement in hnsw_rebuild_statements(0, "vector_cosine_ops")[:2]:
+            op.execute(statement)
+        op.execute(
+            "DO $$ BEGIN EXECUTE format('ALTER DATABASE %I RESET hnsw.ef_search', "
+            "current_database()); END $$"
+        )
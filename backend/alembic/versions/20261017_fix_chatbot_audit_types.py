@@ -0,0 +1,74 @@
+"""Fix chatbot confidence, audit success and feedback text column types
+
+Revision ID: 20261017_fix_chatbot_audit_types
+Revises: 20261017_native_enum_codes
+Create Date: 2026-10-17
+
+Why:
+- chatbot_messages.confidence_score held a float as VARCHAR, so every
+  comparison or aggregate parsed text. It is now DOUBLE PRECISION.
+- audit_logs.success held 'success'/'failure' strings for what is a
+  boolean (details live in error_message). It is now BOOLEAN NOT NULL
+  DEFAULT true.
+- chatbot_conversations.feedback_text is made explicitly TEXT.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_fix_chatbot_audit_types"
+down_revision = "20261017_native_enum_codes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "chatbot_messages",
+        "confidence_score",
+        existing_type=sa.String(),
+        type_=sa.Float(),
+        postgresql_using="NULLIF(confidence_score, '')::double precision",
+    )
+    op.alter_column(
+        "audit_logs",
+        "success",
+        existing_type=sa.String(length=20),
+        type_=sa.Boolean(),
+        nullable=False,
+        server_default=sa.text("true"),
+        postgresql_using="COALESCE(success, 'success') = 'success'",
+    )
+    op.alter_column(
+        "chatbot_conversations",
+        "feedback_text",
+        existing_type=sa.String(),
+        type_=sa.Text(),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "chatbot_conversations",
+        "feedback_text",
+        existing_type=sa.Text(),
+        type_=sa.String(),
+    )
+    op.alter_column(
+        "audit_logs",
+        "success",
+        existing_type=sa.Boolean(),
+        type_=sa.String(length=20),
+        nullable=True,
+        server_default=None,
+        postgresql_using="CASE WHEN success THEN 'success' ELSE 'failure' END",
+    )
+    op.alter_column(
+        "chatbot_messages",
+        "confidence_score",
+        existing_type=sa.Float(),
+        type_=sa.String(),
+        postgresql_using="confidence_score::text",
+    )
@@ -0,0 +1,73 @@
+"""Store audit log and chatbot JSON columns as JSONB
+
+Revision ID: 20261017_jsonb_audit_chatbot
+Revises: 20261017_embeddings_halfvec
+Create Date: 2026-10-17
+
+Why:
+- JSON keeps the raw text and reparses it on every read; JSONB stores a
+  decomposed binary form and supports GIN indexes for containment (@>) queries.
+- Audit search filters on audit_logs.meta and chatbot lookups on
+  chatbot_conversations.context_data, so both get jsonb_path_ops GIN indexes.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_jsonb_audit_chatbot"
+down_revision = "20261017_embeddings_halfvec"
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = (
+    ("audit_logs", "old_values"),
+    ("audit_logs", "new_values"),
+    ("audit_logs", "meta"),
+    ("chatbot_conversations", "context_data"),
+    ("chatbot_conversations", "conversation_history"),
+    ("chatbot_messages", "entities_extracted"),
+)
+
+
+def upgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    op.create_index(
+        "ix_audit_meta_gin",
+        "audit_logs",
+        ["meta"],
+        postgresql_using="gin",
+        postgresql_ops={"meta": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_chatbot_conversation_context_gin",
+        "chatbot_conversations",
+        ["context_data"],
+        postgresql_using="gin",
+        postgresql_ops={"context_data": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chatbot_conversation_context_gin", table_name="chatbot_conversations")
+    op.drop_index("ix_audit_meta_gin", table_name="audit_logs")
+
+    for table, column in reversed(JSON_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
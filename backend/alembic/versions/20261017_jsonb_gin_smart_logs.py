@@ -0,0 +1,46 @@
+"""GIN jsonb_path_ops indexes on alert, fraud and smart attendance JSONB
+
+Revision ID: 20261017_jsonb_gin_smart_logs
+Revises: 20261017_brin_alert_webhook_logs
+Create Date: 2026-10-17
+
+Why:
+- attendance_alerts.metadata, fraud_detections.evidence and
+  smart_attendance_logs.details had no index, so containment filters
+  (details @> '{"status": "present"}') scanned and detoasted every row.
+- jsonb_path_ops GIN indexes serve @> and jsonpath (@?, @@) lookups and are
+  smaller than the default jsonb_ops opclass. Column storage stays EXTENDED
+  (compressed): these blobs are small and mostly read through the index.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_jsonb_gin_smart_logs"
+down_revision = "20261017_brin_alert_webhook_logs"
+branch_labels = None
+depends_on = None
+
+
+GIN_INDEXES = (
+    ("ix_attendance_alerts_metadata_gin", "attendance_alerts", "metadata"),
+    ("ix_fraud_detections_evidence_gin", "fraud_detections", "evidence"),
+    ("ix_smart_attendance_logs_details_gin", "smart_attendance_logs", "details"),
+)
+
+
+def upgrade() -> None:
+    for name, table, column in GIN_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in GIN_INDEXES:
+        op.drop_index(name, table_name=table)
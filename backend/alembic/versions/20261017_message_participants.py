@@ -0,0 +1,89 @@
+"""Replace message_threads with a generated participants key on messages
+
+Revision ID: 20261017_message_participants
+Revises: 20261017_trigram_search_idx
+Create Date: 2026-10-17
+
+Why:
+- message_threads only grouped messages between two users. Reading a thread
+  went through the thread row first, and every send looked it up to find the
+  recipient.
+- messages.participants is a stored generated column
+  "<lower user id>-<higher user id>". Indexed with created_at, it serves
+  thread reads directly, and sends write a single row.
+
+The API keeps numeric thread ids: a thread is now identified by the other
+participant's user id. Empty threads (never messaged) are dropped.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_message_participants"
+down_revision = "20261017_trigram_search_idx"
+branch_labels = None
+depends_on = None
+
+
+PARTICIPANTS_SQL = "LEAST(sender_id, recipient_id)::text || '-' || GREATEST(sender_id, recipient_id)::text"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "messages",
+        sa.Column("participants", sa.String(32), sa.Computed(PARTICIPANTS_SQL, persisted=True)),
+    )
+    op.create_index("ix_messages_participants_created", "messages", ["participants", "created_at"])
+
+    op.drop_index("ix_messages_thread_created", table_name="messages")
+    op.drop_index("ix_messages_recipient_unread_cov", table_name="messages")
+    op.create_index(
+        "ix_messages_recipient_unread_cov",
+        "messages",
+        ["recipient_id", "sender_id"],
+        postgresql_include=["created_at"],
+        postgresql_where=sa.text("read = false"),
+    )
+    op.drop_column("messages", "thread_id")
+    op.drop_table("message_threads")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "message_threads",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user1_id", sa.Integer(), nullable=False),
+        sa.Column("user2_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.CheckConstraint("user1_id < user2_id", name="ck_thread_pair_ordered"),
+        sa.UniqueConstraint("user1_id", "user2_id", name="uq_thread_pair"),
+    )
+    op.create_index("ix_message_threads_id", "message_threads", ["id"])
+    op.create_index("ix_message_threads_user2_id", "message_threads", ["user2_id"])
+    op.execute(
+        "INSERT INTO message_threads (user1_id, user2_id, created_at) "
+        "SELECT LEAST(sender_id, recipient_id), GREATEST(sender_id, recipient_id), min(created_at) "
+        "FROM messages GROUP BY 1, 2"
+    )
+
+    op.add_column("messages", sa.Column("thread_id", sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE messages m SET thread_id = t.id FROM message_threads t "
+        "WHERE t.user1_id = LEAST(m.sender_id, m.recipient_id) "
+        "AND t.user2_id = GREATEST(m.sender_id, m.recipient_id)"
+    )
+    op.alter_column("messages", "thread_id", nullable=False)
+
+    op.drop_index("ix_messages_recipient_unread_cov", table_name="messages")
+    op.create_index(
+        "ix_messages_recipient_unread_cov",
+        "messages",
+        ["recipient_id", "thread_id"],
+        postgresql_include=["created_at", "sender_id"],
+        postgresql_where=sa.text("read = false"),
+    )
+    op.create_index("ix_messages_thread_created", "messages", ["thread_id", "created_at"])
+    op.drop_index("ix_messages_participants_created", table_name="messages")
+    op.drop_column("messages", "participants")
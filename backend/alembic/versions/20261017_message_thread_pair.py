@@ -0,0 +1,61 @@
+"""Canonicalize message thread pairs and make them unique
+
+Revision ID: 20261017_message_thread_pair
+Revises: 20261017_user_agents_lookup
+Create Date: 2026-10-17
+
+Why:
+- A conversation between users A and B could be stored as (A, B) or (B, A),
+  so finding it needed two probes (or an OR) and duplicates were possible.
+- Threads are now stored as (lower id, higher id), enforced by a CHECK, and
+  uq_thread_pair makes the pair unique. Its index leads with user1_id, which
+  makes ix_message_threads_users and ix_message_threads_user1_id redundant.
+
+Existing duplicate threads are merged into the oldest one (their messages are
+moved over) before the pairs are swapped into order.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_message_thread_pair"
+down_revision = "20261017_user_agents_lookup"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE thread_merge ON COMMIT DROP AS
+        SELECT id, min(id) OVER (
+            PARTITION BY least(user1_id, user2_id), greatest(user1_id, user2_id)
+        ) AS keep_id
+        FROM message_threads
+        """
+    )
+    op.execute(
+        "UPDATE messages m SET thread_id = tm.keep_id FROM thread_merge tm "
+        "WHERE m.thread_id = tm.id AND tm.id <> tm.keep_id"
+    )
+    op.execute(
+        "DELETE FROM message_threads t USING thread_merge tm "
+        "WHERE t.id = tm.id AND tm.id <> tm.keep_id"
+    )
+    op.execute(
+        "UPDATE message_threads SET user1_id = user2_id, user2_id = user1_id "
+        "WHERE user1_id > user2_id"
+    )
+
+    op.drop_index("ix_message_threads_users", table_name="message_threads")
+    op.drop_index("ix_message_threads_user1_id", table_name="message_threads")
+    op.create_check_constraint("ck_thread_pair_ordered", "message_threads", "user1_id < user2_id")
+    op.create_unique_constraint("uq_thread_pair", "message_threads", ["user1_id", "user2_id"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_thread_pair", "message_threads", type_="unique")
+    op.drop_constraint("ck_thread_pair_ordered", "message_threads", type_="check")
+    op.create_index("ix_message_threads_user1_id", "message_threads", ["user1_id"])
+    op.create_index("ix_message_threads_users", "message_threads", ["user1_id", "user2_id"])
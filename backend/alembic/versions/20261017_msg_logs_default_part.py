@@ -0,0 +1,44 @@
+"""Add DEFAULT partitions to the monthly message and log tables
+
+Revision ID: 20261017_msg_logs_default_part
+Revises: 20261017_audit_default_part
+Create Date: 2026-10-17
+
+Why:
+- messages, chatbot_messages and smart_attendance_logs only had monthly range
+  partitions premade by the app's maintenance job. Past the premade horizon,
+  sending a message or logging a chatbot turn failed with "no partition of
+  relation found for row".
+- The DEFAULT partitions take such rows instead. When the maintenance job
+  creates the missing month, it moves them into that month's partition
+  (app.db.partitioning.attach_partition_statements).
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msg_logs_default_part"
+down_revision = "20261017_audit_default_part"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ("messages", "chatbot_messages", "smart_attendance_logs")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        # Rows in the DEFAULT partition have no range partition to go back to
+        op.execute(
+            "DO $$ BEGIN "
+            f"IF EXISTS (SELECT 1 FROM {table}_default) THEN "
+            f"RAISE EXCEPTION '{table}_default holds rows outside every monthly partition'; "
+            "END IF; END $$"
+        )
+        op.execute(f"DROP TABLE {table}_default")
@@ -0,0 +1,90 @@
+"""Store fixed status/severity/priority codes as native ENUMs
+
+Revision ID: 20261017_native_enum_codes
+Revises: 20261017_partial_hot_set_idx
+Create Date: 2026-10-17
+
+Why:
+- These columns hold a handful of fixed codes as VARCHAR(20). A PostgreSQL
+  ENUM is stored as a 4-byte OID, which narrows rows and the keys of indexes
+  such as ix_notifications_type_priority and
+  ix_attendance_alerts_student_severity.
+
+Existing values outside an enum's label set make the USING cast fail;
+clean them up before upgrading.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_native_enum_codes"
+down_revision = "20261017_partial_hot_set_idx"
+branch_labels = None
+depends_on = None
+
+
+ENUMS = {
+    "user_role_enum": ("admin", "trainer", "student"),
+    "notification_priority_enum": ("low", "medium", "high", "critical"),
+    "delivery_status_enum": ("pending", "sent", "delivered", "failed"),
+    "severity_enum": ("low", "medium", "high", "critical"),
+    "checkin_status_enum": ("pending", "approved", "rejected", "flagged"),
+}
+
+# (table, column, enum type)
+COLUMNS = (
+    ("audit_logs", "user_role", "user_role_enum"),
+    ("notifications", "priority", "notification_priority_enum"),
+    ("notifications", "delivery_status", "delivery_status_enum"),
+    ("attendance_alerts", "severity", "severity_enum"),
+    ("fraud_detections", "severity", "severity_enum"),
+    ("self_checkins", "status", "checkin_status_enum"),
+)
+
+
+def _pending_index(create: bool) -> None:
+    # The partial predicate compares delivery_status; rebuild it around the type change
+    if create:
+        op.create_index(
+            "ix_notifications_pending",
+            "notifications",
+            ["user_id", "created_at"],
+            postgresql_where=sa.text("delivery_status = 'pending'"),
+        )
+    else:
+        op.drop_index("ix_notifications_pending", table_name="notifications")
+
+
+def upgrade() -> None:
+    for name, labels in ENUMS.items():
+        postgresql.ENUM(*labels, name=name).create(op.get_bind(), checkfirst=True)
+
+    _pending_index(create=False)
+    for table, column, enum_name in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(length=20),
+            type_=postgresql.ENUM(*ENUMS[enum_name], name=enum_name, create_type=False),
+            postgresql_using=f"{column}::{enum_name}",
+        )
+    _pending_index(create=True)
+
+
+def downgrade() -> None:
+    _pending_index(create=False)
+    for table, column, enum_name in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.ENUM(*ENUMS[enum_name], name=enum_name, create_type=False),
+            type_=sa.String(length=20),
+            postgresql_using=f"{column}::text",
+        )
+    _pending_index(create=True)
+
+    for name in ENUMS:
+        postgresql.ENUM(name=name).drop(op.get_bind(), checkfirst=True)
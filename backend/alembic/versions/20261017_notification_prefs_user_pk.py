@@ -0,0 +1,64 @@
+"""Key notification_preferences by user_id
+
+Revision ID: 20261017_notification_prefs_user_pk
+Revises: 20261017_fix_chatbot_audit_types
+Create Date: 2026-10-17
+
+Why:
+- Each user has at most one preferences row, yet the table had a surrogate
+  serial id plus a separate unique index on user_id. Making user_id the
+  primary key removes the id column and one index. ON CONFLICT (user_id)
+  upserts can then target the key directly.
+- user_id now references users.id (ON DELETE CASCADE); orphaned rows are
+  removed first.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_notification_prefs_user_pk"
+down_revision = "20261017_fix_chatbot_audit_types"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "DELETE FROM notification_preferences np "
+        "WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.id = np.user_id)"
+    )
+    op.drop_constraint("notification_preferences_pkey", "notification_preferences", type_="primary")
+    op.drop_column("notification_preferences", "id")
+    op.drop_index("ux_notification_preferences_user_id", table_name="notification_preferences")
+    op.create_primary_key("notification_preferences_pkey", "notification_preferences", ["user_id"])
+    op.create_foreign_key(
+        "fk_notification_preferences_user_id",
+        "notification_preferences",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "fk_notification_preferences_user_id", "notification_preferences", type_="foreignkey"
+    )
+    op.drop_constraint("notification_preferences_pkey", "notification_preferences", type_="primary")
+    op.create_index(
+        "ux_notification_preferences_user_id",
+        "notification_preferences",
+        ["user_id"],
+        unique=True,
+    )
+    op.add_column("notification_preferences", sa.Column("id", sa.Integer(), autoincrement=True))
+    op.execute("CREATE SEQUENCE IF NOT EXISTS notification_preferences_id_seq OWNED BY notification_preferences.id")
+    op.execute(
+        "ALTER TABLE notification_preferences "
+        "ALTER COLUMN id SET DEFAULT nextval('notification_preferences_id_seq')"
+    )
+    op.execute("UPDATE notification_preferences SET id = nextval('notification_preferences_id_seq')")
+    op.create_primary_key("notification_preferences_pkey", "notification_preferences", ["id"])
@@ -0,0 +1,56 @@
+"""Partial indexes on pending check-ins and open alerts / fraud flags
+
+Revision ID: 20261017_open_item_partial_idx
+Revises: 20261017_attendance_summary_mv
+Create Date: 2026-10-17
+
+Why:
+- Trainer and admin dashboards constantly filter on the open working set:
+  pending self check-ins, unacknowledged alerts and unresolved fraud flags.
+  ix_self_checkins_status indexed every status value, although approved and
+  rejected rows are the overwhelming majority and are never looked up by
+  status.
+- Partial indexes restricted to the open rows stay a few hundred entries
+  large and remain cached. ix_self_checkins_status is replaced by a pending
+  index on attendance_session_id; alerts get (student_id, severity) and
+  fraud flags (severity, created_at) next to the existing created_at ones.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_open_item_partial_idx"
+down_revision = "20261017_attendance_summary_mv"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_self_checkins_status", table_name="self_checkins")
+    op.create_index(
+        "ix_self_checkins_pending",
+        "self_checkins",
+        ["attendance_session_id"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_attendance_alerts_open",
+        "attendance_alerts",
+        ["student_id", "severity"],
+        postgresql_where=sa.text("is_acknowledged = false"),
+    )
+    op.create_index(
+        "ix_fraud_detections_open",
+        "fraud_detections",
+        ["severity", "created_at"],
+        postgresql_where=sa.text("is_resolved = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fraud_detections_open", table_name="fraud_detections")
+    op.drop_index("ix_attendance_alerts_open", table_name="attendance_alerts")
+    op.drop_index("ix_self_checkins_pending", table_name="self_checkins")
+    op.create_index("ix_self_checkins_status", "self_checkins", ["status"])
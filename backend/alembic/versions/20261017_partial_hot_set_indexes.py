@@ -0,0 +1,66 @@
+"""Partial indexes for pending / active / unresolved hot sets
+
+Revision ID: 20261017_partial_hot_set_idx
+Revises: 20261017_brin_log_timestamps
+Create Date: 2026-10-17
+
+Why:
+- Status/flag indexes on attendance_alerts, fraud_detections, notifications,
+  student_feedbacks and chatbot_conversations are heavily skewed: most rows
+  end up acknowledged / resolved / delivered / reviewed / inactive, while
+  dashboards only scan the small open set.
+- Partial indexes restricted to that set stay small and ordered by the column
+  those queries sort on.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_partial_hot_set_idx"
+down_revision = "20261017_brin_log_timestamps"
+branch_labels = None
+depends_on = None
+
+
+# (old name, old columns, new name, new columns, predicate, table)
+REPLACEMENTS = (
+    (
+        "ix_attendance_alerts_acknowledged", ["is_acknowledged"],
+        "ix_attendance_alerts_unacknowledged", ["created_at"],
+        "is_acknowledged = false", "attendance_alerts",
+    ),
+    (
+        "ix_fraud_detections_resolved", ["is_resolved"],
+        "ix_fraud_detections_unresolved", ["created_at"],
+        "is_resolved = false", "fraud_detections",
+    ),
+    (
+        "ix_notifications_delivery_status", ["delivery_status"],
+        "ix_notifications_pending", ["user_id", "created_at"],
+        "delivery_status = 'pending'", "notifications",
+    ),
+    (
+        "ix_student_feedbacks_status", ["status"],
+        "ix_student_feedbacks_pending", ["created_at"],
+        "status = 'pending'", "student_feedbacks",
+    ),
+    (
+        "ix_chatbot_conversation_activity", ["is_active", "last_activity"],
+        "ix_chatbot_conversation_active", ["last_activity"],
+        "is_active = true", "chatbot_conversations",
+    ),
+)
+
+
+def upgrade() -> None:
+    for old_name, _, new_name, new_columns, predicate, table in REPLACEMENTS:
+        op.drop_index(old_name, table_name=table)
+        op.create_index(new_name, table, new_columns, postgresql_where=sa.text(predicate))
+
+
+def downgrade() -> None:
+    for old_name, old_columns, new_name, _, _, table in REPLACEMENTS:
+        op.drop_index(new_name, table_name=table)
+        op.create_index(old_name, table, old_columns)
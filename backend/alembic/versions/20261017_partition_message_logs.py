@@ -0,0 +1,160 @@
+"""Partition messages, chatbot_messages and smart_attendance_logs by month
+
+Revision ID: 20261017_partition_message_logs
+Revises: 20261017_audit_logs_partitioned
+Create Date: 2026-10-17
+
+Why:
+- These are unbounded append-only time series, while UI queries only look at
+  recent windows (e.g. the last 50 messages of a thread). Indexes such as
+  ix_messages_thread_created still span the whole history.
+- A native RANGE partition per month on created_at keeps the hot indexes
+  small. Recent-window queries prune to the current partition, and old months
+  can be archived by detaching a partition.
+
+The primary keys become (id, created_at), and created_at becomes NOT NULL
+because it is the partition key. Indexes are defined on the partitioned
+parent so they propagate to every partition.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_partition_message_logs"
+down_revision = "20261017_audit_logs_partitioned"
+branch_labels = None
+depends_on = None
+
+
+TABLES = {
+    "messages": {
+        "columns": """
+            id INTEGER NOT NULL DEFAULT nextval('messages_id_seq'),
+            thread_id INTEGER NOT NULL,
+            sender_id INTEGER NOT NULL,
+            recipient_id INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            read BOOLEAN DEFAULT false NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL
+        """,
+        "indexes": [
+            ("ix_messages_thread_created", ["thread_id", "created_at"]),
+            ("ix_messages_recipient_read", ["recipient_id", "read"]),
+        ],
+    },
+    "chatbot_messages": {
+        "columns": """
+            id INTEGER NOT NULL DEFAULT nextval('chatbot_messages_id_seq'),
+            conversation_id INTEGER NOT NULL,
+            message_type VARCHAR(20) NOT NULL,
+            content VARCHAR NOT NULL,
+            intent_detected VARCHAR(100),
+            confidence_score VARCHAR,
+            entities_extracted JSONB,
+            response_time_ms INTEGER,
+            tokens_used INTEGER,
+            model_used VARCHAR(50),
+            helpful_score INTEGER,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL
+        """,
+        "indexes": [
+            ("ix_chatbot_message_conversation", ["conversation_id"]),
+            ("ix_chatbot_messages_id", ["id"]),
+        ],
+    },
+    "smart_attendance_logs": {
+        "columns": """
+            id INTEGER NOT NULL DEFAULT nextval('smart_attendance_logs_id_seq'),
+            event_type VARCHAR(50) NOT NULL,
+            user_id INTEGER,
+            student_id INTEGER,
+            session_id INTEGER,
+            details JSONB,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL
+        """,
+        "indexes": [
+            ("ix_smart_attendance_logs_event_created", ["event_type", "created_at"]),
+        ],
+    },
+}
+
+
+# Monthly partitions created ahead of the current month
+PREMAKE_MONTHS = 4
+
+
+def _next_month(start):
+    return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _partition_statements(table: str, first):
+    """Monthly partitions from the month of ``first`` (default today) through the horizon."""
+    month = (first or datetime.now(timezone.utc).date()).replace(day=1)
+    last = datetime.now(timezone.utc).date().replace(day=1)
+    for _ in range(PREMAKE_MONTHS):
+        last = _next_month(last)
+    statements = []
+    while month <= last:
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS {table}_p{month:%Y%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{_next_month(month).isoformat()} 00:00:00+00')"
+        )
+        month = _next_month(month)
+    return statements
+
+
+def _oldest_month(table: str):
+    if context.is_offline_mode():
+        return None
+    oldest = op.get_bind().execute(sa.text(f"SELECT min(created_at) FROM {table}")).scalar()
+    if oldest is None:
+        return None
+    if oldest.tzinfo is not None:
+        oldest = oldest.astimezone(timezone.utc)
+    return oldest.date()
+
+
+def _swap_table(table: str, partitioned: bool) -> None:
+    spec = TABLES[table]
+    old = f"{table}_old"
+
+    # Keep the id sequence alive while the old table is swapped out
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+    for name, _ in spec["indexes"]:
+        op.drop_index(name, table_name=table)
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {old}_pkey")
+
+    if partitioned:
+        op.execute(
+            f"CREATE TABLE {table} ({spec['columns']}, PRIMARY KEY (id, created_at)) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        op.execute(f"UPDATE {old} SET created_at = now() WHERE created_at IS NULL")
+        for statement in _partition_statements(table, _oldest_month(old)):
+            op.execute(statement)
+    else:
+        op.execute(f"CREATE TABLE {table} ({spec['columns']}, PRIMARY KEY (id))")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at DROP NOT NULL")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+    for name, columns in spec["indexes"]:
+        op.create_index(name, table, columns)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        _swap_table(table, partitioned=True)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        _swap_table(table, partitioned=False)
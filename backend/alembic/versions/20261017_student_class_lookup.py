@@ -0,0 +1,54 @@
+"""Dictionary-encode students.class into a classes lookup table
+
+Revision ID: 20261017_student_class_lookup
+Revises: 20261017_webhook_signature_algo
+Create Date: 2026-10-17
+
+Why:
+- students.class repeated one of ~100 class labels as a VARCHAR(50) on every
+  row, and ix_students_class_status stored those strings in every entry.
+- Storing a SMALLINT class_id referencing classes(id) narrows the rows and
+  the composite index. Class filters compare integers (the name is resolved
+  once per query), and per-class grouping joins the small classes table.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_student_class_lookup"
+down_revision = "20261017_webhook_signature_algo"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "classes",
+        sa.Column("id", sa.SmallInteger(), primary_key=True),
+        sa.Column("name", sa.String(length=50), nullable=False, unique=True),
+    )
+    op.execute('INSERT INTO classes (name) SELECT DISTINCT "class" FROM students ORDER BY 1')
+
+    op.add_column("students", sa.Column("class_id", sa.SmallInteger(), nullable=True))
+    op.execute('UPDATE students SET class_id = classes.id FROM classes WHERE classes.name = students."class"')
+    op.alter_column("students", "class_id", nullable=False)
+    op.create_foreign_key("fk_students_class_id", "students", "classes", ["class_id"], ["id"])
+
+    op.drop_index("ix_students_class_status", table_name="students")
+    op.drop_column("students", "class")
+    op.create_index("ix_students_class_status", "students", ["class_id", "academic_status"])
+
+
+def downgrade() -> None:
+    op.add_column("students", sa.Column("class", sa.String(length=50), nullable=True))
+    op.execute('UPDATE students SET "class" = classes.name FROM classes WHERE classes.id = students.class_id')
+    op.alter_column("students", "class", nullable=False)
+
+    op.drop_index("ix_students_class_status", table_name="students")
+    op.drop_constraint("fk_students_class_id", "students", type_="foreignkey")
+    op.drop_column("students", "class_id")
+    op.create_index("ix_students_class_status", "students", ["class", "academic_status"])
+
+    op.drop_table("classes")
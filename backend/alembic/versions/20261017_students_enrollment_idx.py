@@ -0,0 +1,39 @@
+"""Replace the boolean facial flag index with a partial needs-enrollment index
+
+Revision ID: 20261017_students_enrollment_idx
+Revises: 20261017_student_class_lookup
+Create Date: 2026-10-17
+
+Why:
+- ix_students_facial_flag indexed a two-valued boolean. The planner prefers
+  a sequential scan for either value, so the index was never read but was
+  still maintained on every student INSERT and UPDATE of the flag.
+- The only selective lookup is the small set of students still waiting for
+  facial enrollment. ix_students_needs_enrollment covers just those rows, and
+  enrolled students never touch it.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_students_enrollment_idx"
+down_revision = "20261017_student_class_lookup"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_students_facial_flag", table_name="students")
+    op.create_index(
+        "ix_students_needs_enrollment",
+        "students",
+        ["id"],
+        postgresql_where=sa.text("facial_data_encoded = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_students_needs_enrollment", table_name="students")
+    op.create_index("ix_students_facial_flag", "students", ["facial_data_encoded"])
@@ -0,0 +1,61 @@
+"""Convert naive timestamp columns to timestamptz
+
+Revision ID: 20261017_timestamptz_columns
+Revises: 20261017_chatbot_session_uuid
+Create Date: 2026-10-17
+
+Why:
+- These tables stored naive timestamps, while audit_logs.timestamp and the
+  webhook tables use timestamptz. Comparing across the two meant implicit
+  casts in range filters, and the API had to guess the zone of every value.
+- Existing values were written as UTC (server now() and the app's clock in
+  UTC containers), so they are reinterpreted AT TIME ZONE 'UTC'.
+
+messages.created_at and chatbot_messages.created_at are partition keys and
+cannot be retyped in place, so they stay timestamp without time zone.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_timestamptz_columns"
+down_revision = "20261017_chatbot_session_uuid"
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = {
+    "chatbot_conversations": ["started_at", "last_activity", "created_at"],
+    "controles": ["created_at", "updated_at"],
+    "facial_verification_logs": ["created_at"],
+    "student_feedbacks": ["created_at", "updated_at"],
+    "message_threads": ["created_at"],
+    "notifications": ["read_at", "created_at", "scheduled_for"],
+    "notification_preferences": ["created_at", "updated_at"],
+}
+
+
+def upgrade() -> None:
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+
+def downgrade() -> None:
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
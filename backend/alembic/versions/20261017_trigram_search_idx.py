@@ -0,0 +1,46 @@
+"""Add pg_trgm GIN indexes for substring search on log and message text
+
+Revision ID: 20261017_trigram_search_idx
+Revises: 20261017_timestamptz_columns
+Create Date: 2026-10-17
+
+Why:
+- ILIKE '%term%' cannot use a B-tree, so searching audit descriptions or
+  chat history read every row of large, growing tables.
+- GIN trigram indexes on audit_logs.action_description,
+  chatbot_messages.content and messages.content serve those searches. They
+  are created on the partitioned parents, so every partition gets one.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_trigram_search_idx"
+down_revision = "20261017_timestamptz_columns"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_audit_desc_trgm", "audit_logs", "action_description"),
+    ("ix_chatbot_messages_content_trgm", "chatbot_messages", "content"),
+    ("ix_messages_content_trgm", "messages", "content"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
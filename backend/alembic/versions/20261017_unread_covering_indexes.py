@@ -0,0 +1,55 @@
+"""Covering partial indexes for unread notifications and messages
+
+Revision ID: 20261017_unread_covering_idx
+Revises: 20261017_partition_message_logs
+Create Date: 2026-10-17
+
+Why:
+- The unread inbox and unread-count queries filter on read = false, which is a
+  small, hot subset. (user_id, read) / (recipient_id, read) B-trees index
+  every row and still need a heap fetch per match.
+- Partial indexes over unread rows only, with INCLUDE columns for the listed
+  fields, allow index-only scans on those endpoints.
+- ix_notifications_user_read is replaced by (user_id, created_at), which also
+  serves the full notification list ordered by created_at.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_unread_covering_idx"
+down_revision = "20261017_partition_message_logs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_notifications_user_read", table_name="notifications")
+    op.create_index("ix_notifications_user_created", "notifications", ["user_id", "created_at"])
+    op.create_index(
+        "ix_notifications_user_unread_cov",
+        "notifications",
+        ["user_id", "created_at"],
+        postgresql_include=["title", "notification_type", "priority"],
+        postgresql_where=sa.text("read = false"),
+    )
+
+    op.drop_index("ix_messages_recipient_read", table_name="messages")
+    op.create_index(
+        "ix_messages_recipient_unread_cov",
+        "messages",
+        ["recipient_id", "thread_id"],
+        postgresql_include=["created_at", "sender_id"],
+        postgresql_where=sa.text("read = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_messages_recipient_unread_cov", table_name="messages")
+    op.create_index("ix_messages_recipient_read", "messages", ["recipient_id", "read"])
+
+    op.drop_index("ix_notifications_user_unread_cov", table_name="notifications")
+    op.drop_index("ix_notifications_user_created", table_name="notifications")
+    op.create_index("ix_notifications_user_read", "notifications", ["user_id", "read"])
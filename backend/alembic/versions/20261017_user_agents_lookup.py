@@ -0,0 +1,72 @@
+"""Move user agent strings into a user_agents lookup table
+
+Revision ID: 20261017_user_agents_lookup
+Revises: 20261017_image_hash_bytea
+Create Date: 2026-10-17
+
+Why:
+- audit_logs and facial_verification_logs stored the raw User-Agent header
+  (up to 512 bytes) on every row, although a handful of distinct browsers make
+  up nearly all traffic. The repeated text inflates heap pages and the buffer
+  cache footprint of both log tables.
+- Rows now hold a 4-byte user_agent_id into user_agents, keyed by the first 16
+  bytes of SHA-256 over the text (app.services.user_agent).
+
+The backfill computes the same hash in SQL so rows written before and after
+the migration share lookup entries.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_user_agents_lookup"
+down_revision = "20261017_image_hash_bytea"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ("audit_logs", "facial_verification_logs")
+
+UA_HASH = "substring(sha256(convert_to({column}, 'UTF8')) from 1 for 16)"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_agents",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("ua_hash", sa.LargeBinary(16), nullable=False),
+        sa.Column("ua_text", sa.Text(), nullable=False),
+        sa.UniqueConstraint("ua_hash", name="user_agents_ua_hash_key"),
+    )
+
+    for table in TABLES:
+        op.execute(
+            f"INSERT INTO user_agents (ua_hash, ua_text) "
+            f"SELECT DISTINCT {UA_HASH.format(column='user_agent')}, user_agent FROM {table} "
+            "WHERE user_agent IS NOT NULL AND user_agent <> '' "
+            "ON CONFLICT (ua_hash) DO NOTHING"
+        )
+        op.add_column(table, sa.Column("user_agent_id", sa.Integer(), nullable=True))
+        op.execute(
+            f"UPDATE {table} t SET user_agent_id = ua.id FROM user_agents ua "
+            f"WHERE ua.ua_hash = {UA_HASH.format(column='t.user_agent')}"
+        )
+        op.drop_column(table, "user_agent")
+        op.create_foreign_key(
+            f"{table}_user_agent_id_fkey", table, "user_agents", ["user_agent_id"], ["id"]
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_constraint(f"{table}_user_agent_id_fkey", table, type_="foreignkey")
+        op.add_column(table, sa.Column("user_agent", sa.String(512), nullable=True))
+        op.execute(
+            f"UPDATE {table} t SET user_agent = ua.ua_text FROM user_agents ua "
+            "WHERE ua.id = t.user_agent_id"
+        )
+        op.drop_column(table, "user_agent_id")
+
+    op.drop_table("user_agents")
@@ -0,0 +1,38 @@
+"""Add a DEFAULT partition to webhook_logs
+
+Revision ID: 20261017_webhook_default_part
+Revises: 20261017_msg_logs_default_part
+Create Date: 2026-10-17
+
+Why:
+- webhook_logs only had monthly range partitions premade by the app's
+  maintenance job. Past the premade horizon, logging a delivery attempt
+  failed with "no partition of relation found for row".
+- The DEFAULT partition takes such rows instead. When the maintenance job
+  creates the missing month, it moves them into that month's partition
+  (app.db.partitioning.attach_partition_statements).
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_webhook_default_part"
+down_revision = "20261017_msg_logs_default_part"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE TABLE IF NOT EXISTS webhook_logs_default PARTITION OF webhook_logs DEFAULT")
+
+
+def downgrade() -> None:
+    # Rows in the DEFAULT partition have no range partition to go back to
+    op.execute(
+        "DO $$ BEGIN "
+        "IF EXISTS (SELECT 1 FROM webhook_logs_default) THEN "
+        "RAISE EXCEPTION 'webhook_logs_default holds rows outside every monthly partition'; "
+        "END IF; END $$"
+    )
+    op.execute("DROP TABLE webhook_logs_default")
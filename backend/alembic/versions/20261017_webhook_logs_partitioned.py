@@ -0,0 +1,134 @@
+"""Partition webhook_logs by month on created_at
+
+Revision ID: 20261017_webhook_logs_partitioned
+Revises: 20261017_checkin_covering_idx
+Create Date: 2026-10-17
+
+Why:
+- webhook_logs gets one row per delivery attempt and grows without bound,
+  while it is only read by webhook and recent time range. Its indexes and
+  autovacuum work grew with the whole history.
+- A native RANGE partition per month on created_at lets recent-window
+  queries prune to the current partition (the BRIN index is then per
+  partition). GDPR retention can drop whole partitions instead of
+  DELETE-ing rows.
+
+The primary key becomes (id, created_at), and created_at becomes NOT NULL
+because it is the partition key. Future partitions are premade by the app's
+partition maintenance job.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_webhook_logs_partitioned"
+down_revision = "20261017_checkin_covering_idx"
+branch_labels = None
+depends_on = None
+
+
+COLUMNS_DDL = """
+    id INTEGER NOT NULL DEFAULT nextval('webhook_logs_id_seq'),
+    webhook_id INTEGER NOT NULL,
+    event_type VARCHAR(50),
+    request_payload JSON,
+    request_headers JSON,
+    response_status_code INTEGER,
+    response_body TEXT,
+    response_time_ms INTEGER,
+    success BOOLEAN,
+    error_message TEXT,
+    retry_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL
+"""
+
+
+def _drop_indexes() -> None:
+    op.drop_index("ix_webhook_logs_id", table_name="webhook_logs")
+    op.drop_index("ix_webhook_logs_webhook_id", table_name="webhook_logs")
+    op.drop_index("ix_webhook_logs_created_at_brin", table_name="webhook_logs")
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_webhook_logs_id", "webhook_logs", ["id"])
+    op.create_index("ix_webhook_logs_webhook_id", "webhook_logs", ["webhook_id"])
+    op.create_index(
+        "ix_webhook_logs_created_at_brin",
+        "webhook_logs",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+# Monthly partitions created ahead of the current month
+PREMAKE_MONTHS = 4
+
+
+def _next_month(start):
+    return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _partition_statements(first):
+    """Monthly partitions from the month of ``first`` (default today) through the horizon."""
+    month = (first or datetime.now(timezone.utc).date()).replace(day=1)
+    last = datetime.now(timezone.utc).date().replace(day=1)
+    for _ in range(PREMAKE_MONTHS):
+        last = _next_month(last)
+    statements = []
+    while month <= last:
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS webhook_logs_p{month:%Y%m} PARTITION OF webhook_logs "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{_next_month(month).isoformat()} 00:00:00+00')"
+        )
+        month = _next_month(month)
+    return statements
+
+
+def _oldest_month():
+    if context.is_offline_mode():
+        return None
+    oldest = op.get_bind().execute(sa.text("SELECT min(created_at) FROM webhook_logs_legacy")).scalar()
+    return oldest.astimezone(timezone.utc).date() if oldest is not None else None
+
+
+def upgrade() -> None:
+    # Keep the id sequence alive while the old table is swapped out
+    op.execute("ALTER SEQUENCE webhook_logs_id_seq OWNED BY NONE")
+    _drop_indexes()
+    op.execute("ALTER TABLE webhook_logs RENAME TO webhook_logs_legacy")
+    op.execute("ALTER INDEX webhook_logs_pkey RENAME TO webhook_logs_legacy_pkey")
+
+    op.execute(
+        f"CREATE TABLE webhook_logs ({COLUMNS_DDL}, PRIMARY KEY (id, created_at)) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute("UPDATE webhook_logs_legacy SET created_at = now() WHERE created_at IS NULL")
+    for statement in _partition_statements(_oldest_month()):
+        op.execute(statement)
+
+    op.execute("INSERT INTO webhook_logs SELECT * FROM webhook_logs_legacy")
+    op.execute("DROP TABLE webhook_logs_legacy")
+    op.execute("ALTER SEQUENCE webhook_logs_id_seq OWNED BY webhook_logs.id")
+
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute("ALTER SEQUENCE webhook_logs_id_seq OWNED BY NONE")
+    _drop_indexes()
+    op.execute("ALTER TABLE webhook_logs RENAME TO webhook_logs_partitioned")
+    op.execute("ALTER INDEX webhook_logs_pkey RENAME TO webhook_logs_partitioned_pkey")
+
+    op.execute(f"CREATE TABLE webhook_logs ({COLUMNS_DDL}, PRIMARY KEY (id))")
+    op.execute("ALTER TABLE webhook_logs ALTER COLUMN created_at DROP NOT NULL")
+    op.execute("INSERT INTO webhook_logs SELECT * FROM webhook_logs_partitioned")
+    op.execute("DROP TABLE webhook_logs_partitioned")
+    op.execute("ALTER SEQUENCE webhook_logs_id_seq OWNED BY webhook_logs.id")
+
+    _create_indexes()
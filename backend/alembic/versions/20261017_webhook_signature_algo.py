@@ -0,0 +1,34 @@
+"""Per-webhook signature algorithm
+
+Revision ID: 20261017_webhook_signature_algo
+Revises: 20261017_webhook_logs_partitioned
+Create Date: 2026-10-17
+
+Why:
+- Every delivery to a webhook with a secret is signed. HMAC-SHA256 runs two
+  SHA-256 passes (inner and outer) per body, which dominates the cost of
+  small payloads during fan-out. Keyed BLAKE2b is a MAC in a single pass.
+- Receivers verify with a fixed algorithm, so it is chosen per webhook.
+  Existing webhooks keep hmac-sha256; blake2b is opt-in.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_webhook_signature_algo"
+down_revision = "20261017_webhook_logs_partitioned"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "webhooks",
+        sa.Column("signature_algo", sa.String(length=20), nullable=False, server_default="hmac-sha256"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("webhooks", "signature_algo")
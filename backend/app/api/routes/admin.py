@@ -102,16 +102,20 @@ def list_students(
     page_size: int = Query(10, ge=1, le=100),
     search: str = Query("", min_length=0),
     class_name: Optional[str] = None,
+    needs_enrollment: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List all students with pagination and optional filtering."""
+    """List all students with pagination and optional filtering.
+
+    ``needs_enrollment`` restricts the list to students without facial data.
+    """
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can list students"
         )
 
-    cache_key = f"students:{page}:{page_size}:{search}:{class_name or 'all'}"
+    cache_key = f"students:{page}:{page_size}:{search}:{class_name or 'all'}:{int(needs_enrollment)}"
 
     def fetch_students():
         query = db.query(Student)
@@ -129,6 +133,10 @@ def list_students(
         if class_name:
             query = query.filter(Student.class_name == class_name)
 
+        # Students still to enroll (served by the partial ix_students_needs_enrollment)
+        if needs_enrollment:
+            query = query.filter(Student.facial_data_encoded == False)  # noqa: E712
+
         total = query.count()
         total_pages = (total + page_size - 1) // page_size
 
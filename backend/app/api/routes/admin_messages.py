@@ -84,11 +84,14 @@ def list_distinct_classes(
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admins can list classes")
 
+    from app.models.school_class import SchoolClass
     from app.models.session import Session as CourseSession
     from app.models.student import Student
 
     session_rows = db.query(CourseSession.class_name).distinct().all()
-    student_rows = db.query(Student.class_name).distinct().all()
+    student_rows = (
+        db.query(SchoolClass.name).join(Student, Student.class_id == SchoolClass.id).distinct().all()
+    )
     classes = sorted(
         {
             r[0]
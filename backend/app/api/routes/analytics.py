@@ -6,9 +6,11 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.attendance import AttendanceRecord
+from app.models.school_class import SchoolClass
 from app.models.session import Session as SessionModel
 from app.models.student import Student
 from app.models.user import User
+from app.services.student_counters import absence_hours_by_id, pending_absence_hours
 from app.utils.cache import cached_response
 from app.utils.deps import get_current_user, get_db
 
@@ -76,25 +78,42 @@ def get_class_stats(
 
     rows = (
         db.query(
-            Student.class_name.label("class_name"),
+            SchoolClass.name.label("class_name"),
             func.count(Student.id).label("total_students"),
             func.avg(Student.attendance_rate).label("attendance_rate"),
-            func.avg(Student.total_absence_hours).label("avg_absences"),
+            func.sum(func.coalesce(Student.total_absence_hours, 0)).label("absence_hours"),
         )
+        .join(Student, Student.class_id == SchoolClass.id)
         .filter(Student.is_deleted.is_(False))
-        .group_by(Student.class_name)
-        .order_by(Student.class_name)
+        .group_by(SchoolClass.name)
+        .order_by(SchoolClass.name)
         .all()
     )
 
+    # Add the absence hours still buffered in Redis (app.services.student_counters)
+    pending = pending_absence_hours()
+    pending_by_class: Dict[str, int] = {}
+    if pending:
+        pending_students = (
+            db.query(SchoolClass.name, Student.id)
+            .join(Student, Student.class_id == SchoolClass.id)
+            .filter(Student.is_deleted.is_(False), Student.id.in_(pending))
+        )
+        for class_name, student_id in pending_students:
+            pending_by_class[class_name] = pending_by_class.get(class_name, 0) + pending[student_id]
+
     return [
         {
             "class_name": class_name,
             "attendance_rate": float(attendance_rate or 0),
             "total_students": int(total_students or 0),
-            "avg_absences": float(avg_absences or 0),
+            "avg_absences": (
+                float((absence_hours or 0) + pending_by_class.get(class_name, 0)) / total_students
+                if total_students
+                else 0.0
+            ),
         }
-        for class_name, total_students, attendance_rate, avg_absences in rows
+        for class_name, total_students, attendance_rate, absence_hours in rows
         if class_name
     ]
 
@@ -173,8 +192,9 @@ def _compute_attendance_trend(db: Session, cutoff: datetime, period: str) -> Lis
 def _compute_class_statistics(db: Session) -> List[Dict]:
     """Compute attendance statistics per class."""
     classes = (
-        db.query(Student.class_name, func.count(Student.id), func.avg(Student.attendance_rate))
-        .group_by(Student.class_name)
+        db.query(SchoolClass.name, func.count(Student.id), func.avg(Student.attendance_rate))
+        .join(Student, Student.class_id == SchoolClass.id)
+        .group_by(SchoolClass.name)
         .all()
     )
     result = []
@@ -190,17 +210,27 @@ def _compute_class_statistics(db: Session) -> List[Dict]:
 
 
 def _compute_top_absences(db: Session, limit: int = 10) -> List[Dict]:
-    """Return top N students with highest total absence hours."""
-    students = (
-        db.query(Student)
+    """Return top N students with highest total absence hours.
+
+    Buffered deltas only add hours, so the top N is among the top N by the
+    stored column and the students with hours still buffered in Redis.
+    """
+    pending = pending_absence_hours()
+    candidates = {
+        s.id: s
+        for s in db.query(Student)
         .filter(Student.total_absence_hours > 0)
         .order_by(Student.total_absence_hours.desc())
         .limit(limit)
-        .all()
-    )
-    result = []
-    for s in students:
-        result.append(
-            {"student_name": f"{s.first_name} {s.last_name}", "absences": s.total_absence_hours}
-        )
-    return result
+    }
+    if pending:
+        candidates.update((s.id, s) for s in db.query(Student).filter(Student.id.in_(pending)))
+    students = list(candidates.values())
+    totals = absence_hours_by_id(students)
+    students = sorted(
+        (s for s in students if totals[s.id] > 0), key=lambda s: totals[s.id], reverse=True
+    )[:limit]
+    return [
+        {"student_name": f"{s.first_name} {s.last_name}", "absences": totals[s.id]}
+        for s in students
+    ]
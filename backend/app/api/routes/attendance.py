@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.event_bus import event_bus
 from app.models.attendance import AttendanceRecord
 from app.models.user import User
 from app.schemas.attendance import (
+    ATTENDANCE_LIST_ADAPTER,
     AttendanceCreate,
     AttendanceOut,
     AttendanceSummary,
@@ -204,4 +205,5 @@ def list_attendance(
         q = q.filter(AttendanceRecord.session_id == session_id)
     if student_id:
         q = q.filter(AttendanceRecord.student_id == student_id)
-    return q.all()
+    records = ATTENDANCE_LIST_ADAPTER.validate_python(q.all(), from_attributes=True)
+    return Response(content=ATTENDANCE_LIST_ADAPTER.dump_json(records), media_type="application/json")
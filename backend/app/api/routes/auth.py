@@ -16,6 +16,7 @@ from app.schemas.auth import (
 )
 from app.services import auth as auth_service
 from app.services.facial import enroll_user_faces, verify_user_face_by_image
+from app.services.user_agent import get_user_agent_id
 from app.utils.deps import get_db
 from app.utils.rate_limit import hit
 
@@ -46,6 +47,7 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
 @router.post("/login/facial", response_model=Token)
 def login_facial(payload: FacialLoginRequest, request: Request, db: Session = Depends(get_db)):
     ip = request.client.host if request.client else "unknown"
+    ua_id = get_user_agent_id(db, request.headers.get("user-agent"))
     allowed, count, reset_at = hit(
         f"rate:facial_login:{payload.email}:{ip}",
         limit=10,
@@ -54,14 +56,14 @@ def login_facial(payload: FacialLoginRequest, request: Request, db: Session = De
     if not allowed:
         db.execute(
             text(
-                "INSERT INTO facial_verification_logs (attempted_email, success, failure_reason, ip_address, user_agent) "
+                "INSERT INTO facial_verification_logs (attempted_email, success, failure_reason, ip_address, user_agent_id) "
                 "VALUES (:email, false, :reason, :ip, :ua)"
             ),
             {
                 "email": payload.email,
                 "reason": f"rate_limited:{count}",
                 "ip": ip,
-                "ua": request.headers.get("user-agent"),
+                "ua": ua_id,
             },
         )
         db.commit()
@@ -79,14 +81,14 @@ def login_facial(payload: FacialLoginRequest, request: Request, db: Session = De
         # Log attempt (unknown email)
         db.execute(
             text(
-                "INSERT INTO facial_verification_logs (attempted_email, success, failure_reason, ip_address, user_agent) "
+                "INSERT INTO facial_verification_logs (attempted_email, success, failure_reason, ip_address, user_agent_id) "
                 "VALUES (:email, false, :reason, :ip, :ua)"
             ),
             {
                 "email": payload.email,
                 "reason": "user_not_found",
                 "ip": ip,
-                "ua": request.headers.get("user-agent"),
+                "ua": ua_id,
             },
         )
         db.commit()
@@ -136,7 +138,7 @@ def login_facial(payload: FacialLoginRequest, request: Request, db: Session = De
     if not has_embeddings:
         db.execute(
             text(
-                "INSERT INTO facial_verification_logs (user_id, attempted_email, success, failure_reason, ip_address, user_agent) "
+                "INSERT INTO facial_verification_logs (user_id, attempted_email, success, failure_reason, ip_address, user_agent_id) "
                 "VALUES (:uid, :email, false, :reason, :ip, :ua)"
             ),
             {
@@ -144,7 +146,7 @@ def login_facial(payload: FacialLoginRequest, request: Request, db: Session = De
                 "email": payload.email,
                 "reason": "no_enrolled_embeddings",
                 "ip": request.client.host if request.client else None,
-                "ua": request.headers.get("user-agent"),
+                "ua": ua_id,
             },
         )
         db.commit()
@@ -163,7 +165,7 @@ def login_facial(payload: FacialLoginRequest, request: Request, db: Session = De
     except Exception:
         db.execute(
             text(
-                "INSERT INTO facial_verification_logs (user_id, attempted_email, success, failure_reason, ip_address, user_agent) "
+                "INSERT INTO facial_verification_logs (user_id, attempted_email, success, failure_reason, ip_address, user_agent_id) "
                 "VALUES (:uid, :email, false, :reason, :ip, :ua)"
             ),
             {
@@ -171,7 +173,7 @@ def login_facial(payload: FacialLoginRequest, request: Request, db: Session = De
                 "email": payload.email,
                 "reason": "invalid_base64",
                 "ip": request.client.host if request.client else None,
-                "ua": request.headers.get("user-agent"),
+                "ua": ua_id,
             },
         )
         db.commit()
@@ -190,7 +192,7 @@ def login_facial(payload: FacialLoginRequest, request: Request, db: Session = De
     db.execute(
         text(
             "INSERT INTO facial_verification_logs "
-            "(user_id, attempted_email, success, similarity, threshold, failure_reason, num_faces, blur_score, brightness, ip_address, user_agent) "
+            "(user_id, attempted_email, success, similarity, threshold, failure_reason, num_faces, blur_score, brightness, ip_address, user_agent_id) "
             "VALUES (:uid, :email, :success, :sim, :thr, :reason, :faces, :blur, :bright, :ip, :ua)"
         ),
         {
@@ -204,7 +206,7 @@ def login_facial(payload: FacialLoginRequest, request: Request, db: Session = De
             "blur": float(metrics.blur_score) if metrics else None,
             "bright": float(metrics.brightness) if metrics else None,
             "ip": request.client.host if request.client else None,
-            "ua": request.headers.get("user-agent"),
+            "ua": ua_id,
         },
     )
     db.commit()
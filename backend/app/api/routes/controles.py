@@ -3,13 +3,19 @@
 from datetime import date, datetime, timedelta
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.models.controle import Controle
 from app.models.user import User
-from app.schemas.controle import ControleCreate, ControleNotificationUpdate, ControleOut, ControleUpdate
+from app.schemas.controle import (
+    CONTROLE_LIST_ADAPTER,
+    ControleCreate,
+    ControleNotificationUpdate,
+    ControleOut,
+    ControleUpdate,
+)
 from app.services.auth import get_current_user
 from app.services.controle_notification import ControleNotificationService
 
@@ -64,8 +70,13 @@ def list_controles(
         today = date.today()
         query = query.filter(Controle.date >= today)
     
-    controles = query.order_by(Controle.date.desc()).all()
-    return controles
+    controles = CONTROLE_LIST_ADAPTER.validate_python(
+        query.order_by(Controle.date.desc()).all(), from_attributes=True
+    )
+    return Response(
+        content=CONTROLE_LIST_ADAPTER.dump_json(controles, by_alias=True),
+        media_type="application/json",
+    )
 
 
 @router.get("/{controle_id}", response_model=ControleOut)
@@ -177,4 +188,8 @@ def get_upcoming_controles_week(
         Controle.date <= next_week
     ).order_by(Controle.date).all()
     
-    return controles
+    controles = CONTROLE_LIST_ADAPTER.validate_python(controles, from_attributes=True)
+    return Response(
+        content=CONTROLE_LIST_ADAPTER.dump_json(controles, by_alias=True),
+        media_type="application/json",
+    )
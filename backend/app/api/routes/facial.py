@@ -7,6 +7,7 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.services.facial import set_hnsw_ef_search
 from app.services.facial_service import facial_service
 from app.utils.deps import get_db
 
@@ -34,15 +35,14 @@ def enroll_face(payload: EnrollPayload, db: Session = Depends(get_db)):
     success_count = 0
     for i, emb_np in enumerate(embeddings):
         emb_list = emb_np.tolist()
-        emb_str = str(emb_list)
-        image_hash = hashlib.sha256(payload.images_base64[i].encode()).hexdigest()
+        image_hash = hashlib.sha256(payload.images_base64[i].encode()).digest()
 
         # Insert into DB with pgvector column via raw SQL
         db.execute(
             text(
                 """
                 INSERT INTO facial_embeddings (student_id, image_path, image_hash, embedding_model, is_primary, embedding)
-                VALUES (:sid, :path, :hash, 'insightface', :is_primary, (:vec)::vector)
+                VALUES (:sid, :path, :hash, 'insightface', :is_primary, (:vec)::halfvec)
                 """
             ),
             {
@@ -50,7 +50,7 @@ def enroll_face(payload: EnrollPayload, db: Session = Depends(get_db)):
                 "path": f"/storage/faces/{payload.student_id}_{i}.jpg",
                 "hash": image_hash,
                 "is_primary": i == 0,
-                "vec": emb_str,
+                "vec": emb_list,
             },
         )
         success_count += 1
@@ -65,20 +65,21 @@ def verify_face(payload: VerifyPayload, db: Session = Depends(get_db)):
     if test_emb is None:
         raise HTTPException(status_code=400, detail="No face detected in provided image")
 
-    emb_str = str(test_emb.tolist())
+    emb_list = test_emb.tolist()
 
     # Find closest match via pgvector cosine distance (1 - cosine_similarity)
+    set_hnsw_ef_search(db)
     result = db.execute(
         text(
             """
-            SELECT student_id, 1 - (embedding <=> (:vec)::vector) AS similarity
+            SELECT student_id, 1 - (embedding <=> (:vec)::halfvec) AS similarity
             FROM facial_embeddings
             WHERE student_id = :sid
             ORDER BY similarity DESC
             LIMIT 1
             """
         ),
-        {"vec": emb_str, "sid": payload.student_id},
+        {"vec": emb_list, "sid": payload.student_id},
     ).fetchone()
 
     if not result:
@@ -20,11 +20,10 @@ async def export_my_data(
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
     """Export all personal data for current user (GDPR compliance)."""
-    gdpr_service = GDPRService(db)
     audit_service = AuditService(db)
     
     try:
-        export_data = gdpr_service.export_user_data(current_user.id)
+        export_data = GDPRService.export_user_data(db, current_user)
         
         # Log the data export request
         await audit_service.log_action(
@@ -33,13 +32,13 @@ async def export_my_data(
             action_description=f"User {current_user.email} requested data export",
             resource_type="user_data",
             resource_id=current_user.id,
-            success="success",
+            success=True,
         )
         
         return {
             "message": "Data export completed",
             "data": export_data,
-            "exported_at": export_data.get("exported_at"),
+            "exported_at": export_data.get("export_date"),
         }
     except Exception as e:
         await audit_service.log_action(
@@ -48,7 +47,7 @@ async def export_my_data(
             action_description=f"Failed data export for {current_user.email}",
             resource_type="user_data",
             resource_id=current_user.id,
-            success="failure",
+            success=False,
             error_message=str(e),
         )
         raise HTTPException(status_code=500, detail=f"Data export failed: {str(e)}")
@@ -59,9 +58,8 @@ async def delete_my_account(
     background_tasks: BackgroundTasks,
     current_user: User = Depends(auth_service.get_current_user),
     db: Session = Depends(get_db),
-) -> dict[str, str]:
+) -> dict[str, Any]:
     """Delete or anonymize user account (GDPR right to be forgotten)."""
-    gdpr_service = GDPRService(db)
     audit_service = AuditService(db)
     
     try:
@@ -72,11 +70,11 @@ async def delete_my_account(
             action_description=f"User {current_user.email} requested account deletion",
             resource_type="user",
             resource_id=current_user.id,
-            success="success",
+            success=True,
         )
         
         # Anonymize user data
-        result = gdpr_service.delete_user_data(current_user.id)
+        result = GDPRService.delete_user_data(db, current_user)
         
         return {
             "message": "Account deletion/anonymization completed",
@@ -89,7 +87,7 @@ async def delete_my_account(
             action_description=f"Failed account deletion for {current_user.email}",
             resource_type="user",
             resource_id=current_user.id,
-            success="failure",
+            success=False,
             error_message=str(e),
         )
         raise HTTPException(status_code=500, detail=f"Account deletion failed: {str(e)}")
@@ -105,11 +103,14 @@ async def admin_export_user_data(
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    gdpr_service = GDPRService(db)
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
     audit_service = AuditService(db)
     
     try:
-        export_data = gdpr_service.export_user_data(user_id)
+        export_data = GDPRService.export_user_data(db, user)
         
         await audit_service.log_action(
             user_id=current_user.id,
@@ -117,7 +118,7 @@ async def admin_export_user_data(
             action_description=f"Admin {current_user.email} exported data for user {user_id}",
             resource_type="user_data",
             resource_id=user_id,
-            success="success",
+            success=True,
         )
         
         return export_data
@@ -128,7 +129,7 @@ async def admin_export_user_data(
             action_description=f"Admin failed to export data for user {user_id}",
             resource_type="user_data",
             resource_id=user_id,
-            success="failure",
+            success=False,
             error_message=str(e),
         )
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,72 +1,105 @@
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.models.message import Message, MessageThread
+from app.models.message import Message, participants_key
 from app.models.user import User
 from app.utils.deps import get_current_user, get_db
 
 router = APIRouter(tags=["messages"])
 
 
+def _support_admin(db: Session) -> Optional[User]:
+    """The admin offered as a support thread to users without conversations."""
+    return db.query(User).filter(User.role == "admin").order_by(User.id.asc()).first()
+
+
+def _get_partner(db: Session, current_user: User, thread_id: int) -> User:
+    """Resolve a thread id (the other participant's user id) to that user.
+
+    A thread exists once the pair has exchanged a message; the support thread
+    offered by ``/threads`` is also available before the first message.
+    """
+    other = db.query(User).filter(User.id == thread_id).first()
+    if not other or other.id == current_user.id:
+        raise HTTPException(status_code=404, detail="Thread not found")
+
+    exists = (
+        db.query(Message.id)
+        .filter(Message.participants == participants_key(current_user.id, other.id))
+        .first()
+    )
+    if not exists:
+        support = _support_admin(db)
+        if not support or support.id != other.id:
+            raise HTTPException(status_code=404, detail="Thread not found")
+    return other
+
+
 @router.get("/threads")
 def get_message_threads(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get message threads for the current user."""
-    q = db.query(MessageThread).filter(
-        (MessageThread.user1_id == current_user.id) | (MessageThread.user2_id == current_user.id)
+    """Get message threads for the current user.
+
+    A thread is the conversation with one other user, grouped on
+    ``Message.participants``; its id is the other user's id.
+    """
+    conversations = (
+        db.query(
+            Message.participants,
+            func.count(Message.id)
+            .filter(Message.recipient_id == current_user.id, Message.read.is_(False))
+            .label("unread_count"),
+        )
+        .filter((Message.sender_id == current_user.id) | (Message.recipient_id == current_user.id))
+        .group_by(Message.participants)
+        .order_by(func.max(Message.created_at).desc())
+        .limit(50)
+        .all()
     )
-    threads = q.order_by(MessageThread.id.desc()).limit(50).all()
-
-    # If no threads exist, create a single "support" thread with the first admin (if any).
-    if not threads:
-        admin_user = db.query(User).filter(User.role == "admin").order_by(User.id.asc()).first()
-        if admin_user and admin_user.id != current_user.id:
-            t = MessageThread(user1_id=current_user.id, user2_id=admin_user.id)
-            db.add(t)
-            db.commit()
-            db.refresh(t)
-            threads = [t]
 
     results = []
-    for t in threads:
-        other_user_id = t.user2_id if t.user1_id == current_user.id else t.user1_id
-        other = db.query(User).filter(User.id == other_user_id).first()
-
+    for participants, unread_count in conversations:
         last = (
             db.query(Message)
-            .filter(Message.thread_id == t.id)
+            .filter(Message.participants == participants)
             .order_by(Message.created_at.desc())
             .first()
         )
-
-        unread_count = (
-            db.query(func.count(Message.id))
-            .filter(
-                Message.thread_id == t.id,
-                Message.recipient_id == current_user.id,
-                Message.read.is_(False),
-            )
-            .scalar()
-            or 0
-        )
+        other_user_id = last.recipient_id if last.sender_id == current_user.id else last.sender_id
+        other = db.query(User).filter(User.id == other_user_id).first()
 
         results.append(
             {
-                "id": t.id,
+                "id": other_user_id,
                 "participant_name": (other.username if other else "Utilisateur"),
                 "participant_role": (other.role if other else "user"),
-                "last_message": (last.content if last else ""),
-                "last_message_at": (last.created_at.isoformat() if last and last.created_at else t.created_at.isoformat()),
-                "unread_count": int(unread_count),
+                "last_message": last.content,
+                "last_message_at": (last.created_at.isoformat() if last.created_at else None),
+                "unread_count": int(unread_count or 0),
             }
         )
 
+    # If no conversation exists yet, offer a "support" thread with the first admin (if any).
+    if not results:
+        admin_user = _support_admin(db)
+        if admin_user and admin_user.id != current_user.id:
+            results.append(
+                {
+                    "id": admin_user.id,
+                    "participant_name": admin_user.username,
+                    "participant_role": admin_user.role,
+                    "last_message": "",
+                    "last_message_at": datetime.now().isoformat(),
+                    "unread_count": 0,
+                }
+            )
+
     # Sort by last activity desc
     results.sort(key=lambda x: x.get("last_message_at") or "", reverse=True)
     return results
@@ -79,30 +112,17 @@ def get_thread_messages(
     current_user: User = Depends(get_current_user),
 ):
     """Get messages for a specific thread."""
-    thread = (
-        db.query(MessageThread)
-        .filter(
-            MessageThread.id == thread_id,
-            (MessageThread.user1_id == current_user.id) | (MessageThread.user2_id == current_user.id),
-        )
-        .first()
-    )
-    if not thread:
-        raise HTTPException(status_code=404, detail="Thread not found")
+    other = _get_partner(db, current_user, thread_id)
 
     messages = (
         db.query(Message)
-        .filter(Message.thread_id == thread_id)
+        .filter(Message.participants == participants_key(current_user.id, other.id))
         .order_by(Message.created_at.asc())
         .limit(200)
         .all()
     )
 
-    sender_ids = {m.sender_id for m in messages}
-    user_map = {}
-    if sender_ids:
-        rows = db.query(User.id, User.username).filter(User.id.in_(sender_ids)).all()
-        user_map = {r[0]: r[1] for r in rows}
+    user_map = {current_user.id: current_user.username, other.id: other.username}
 
     # Mark incoming messages as read
     updated = False
@@ -138,19 +158,9 @@ def send_message(
     if not thread_id or not content:
         raise HTTPException(status_code=400, detail="Missing thread_id or content")
 
-    thread = (
-        db.query(MessageThread)
-        .filter(
-            MessageThread.id == int(thread_id),
-            (MessageThread.user1_id == current_user.id) | (MessageThread.user2_id == current_user.id),
-        )
-        .first()
-    )
-    if not thread:
-        raise HTTPException(status_code=404, detail="Thread not found")
+    other = _get_partner(db, current_user, int(thread_id))
 
-    recipient_id = thread.user2_id if thread.user1_id == current_user.id else thread.user1_id
-    msg = Message(thread_id=thread.id, sender_id=current_user.id, recipient_id=recipient_id, content=content)
+    msg = Message(sender_id=current_user.id, recipient_id=other.id, content=content)
     db.add(msg)
     db.commit()
     db.refresh(msg)
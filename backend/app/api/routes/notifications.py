@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.models.user import User
@@ -42,7 +42,8 @@ def get_user_notifications(
     notifications = NotificationService.get_user_notifications(db, user_id, limit, unread_only)
     unread_count = NotificationService.get_unread_count(db, user_id)
 
-    return NotificationListOut(notifications=notifications, unread_count=unread_count)
+    result = NotificationListOut(notifications=notifications, unread_count=unread_count)
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get("/me", response_model=NotificationListOut)
@@ -58,7 +59,8 @@ def get_my_notifications(
     )
     unread_count = NotificationService.get_unread_count(db, current_user.id)
 
-    return NotificationListOut(notifications=notifications, unread_count=unread_count)
+    result = NotificationListOut(notifications=notifications, unread_count=unread_count)
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.put("/{notification_id}/read", response_model=NotificationOut)
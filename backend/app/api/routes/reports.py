@@ -1,8 +1,9 @@
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.db.session import SessionLocal
 from app.models.user import User
 from app.services.report import ReportService
 from app.utils.deps import get_current_user, get_db
@@ -14,7 +15,6 @@ router = APIRouter(tags=["reports"])
 @router.get("/attendance/csv")
 def export_attendance_csv(
     class_name: str | None = None,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Export attendance report as CSV."""
@@ -23,9 +23,17 @@ def export_attendance_csv(
             status_code=status.HTTP_403_FORBIDDEN, detail="Only admin/trainer can export reports"
         )
 
-    csv_data = ReportService.generate_attendance_csv(db, class_name)
+    def stream_rows():
+        # The request's session is closed once the response starts, so the
+        # stream reads through its own session
+        export_db = SessionLocal()
+        try:
+            yield from ReportService.iter_attendance_csv(export_db, class_name)
+        finally:
+            export_db.close()
+
     return StreamingResponse(
-        iter([csv_data.getvalue()]),
+        stream_rows(),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=attendance_report.csv"},
     )
@@ -45,7 +53,7 @@ def get_attendance_summary(
         )
 
     summary = ReportService.generate_attendance_summary(db, class_name=class_name, days=days)
-    return summary
+    return Response(content=summary.model_dump_json(by_alias=True), media_type="application/json")
 
 
 @router.get("/student/{student_id}")
@@ -142,7 +150,7 @@ def schedule_report(
     def _generate_and_store(target_class: str | None):
         summary = ReportService.generate_attendance_summary(db, class_name=target_class)
         with open("/tmp/last_attendance_report.json", "w", encoding="utf-8") as f:
-            f.write(str(summary))
+            f.write(summary.model_dump_json(by_alias=True))
 
     task_queue.submit(_generate_and_store, class_name)
     return {"scheduled": True, "cadence": cadence, "class": class_name or "all"}
@@ -8,6 +8,7 @@ from app.core.event_bus import event_bus
 from app.models.session_request import SessionRequest
 from app.models.user import User
 from app.schemas.session_request import (
+    TIME_FORMAT,
     SessionRequestCreate,
     SessionRequestListOut,
     SessionRequestOut,
@@ -43,9 +44,9 @@ async def create_session_request(
         trainer_email=current_user.email,
         title=payload.title,
         class_name=payload.class_name,
-        session_date=payload.session_date,
-        start_time=payload.start_time,
-        end_time=payload.end_time,
+        session_date=payload.session_date.isoformat(),
+        start_time=payload.start_time.strftime(TIME_FORMAT),
+        end_time=payload.end_time.strftime(TIME_FORMAT),
         session_type=payload.session_type,
         notes=payload.notes,
         status="pending",
@@ -81,7 +82,7 @@ async def create_session_request(
             "trainer_name": current_user.username,
             "title": payload.title,
             "class_name": payload.class_name,
-            "date": payload.session_date,
+            "date": session_request.session_date,
         },
     )
 
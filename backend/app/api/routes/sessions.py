@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.models.session import Session as SessionModel
-from app.schemas.session import SessionCreate, SessionOut
+from app.schemas.session import SESSION_LIST_ADAPTER, SessionCreate, SessionOut
 from app.utils.deps import get_db
 
 router = APIRouter()
@@ -10,7 +10,10 @@ router = APIRouter()
 
 @router.get("/", response_model=list[SessionOut])
 def list_sessions(db: Session = Depends(get_db)):
-    return db.query(SessionModel).all()
+    sessions = SESSION_LIST_ADAPTER.validate_python(
+        db.query(SessionModel).all(), from_attributes=True
+    )
+    return Response(content=SESSION_LIST_ADAPTER.dump_json(sessions), media_type="application/json")
 
 
 @router.post("/", response_model=SessionOut, status_code=status.HTTP_201_CREATED)
@@ -2,11 +2,15 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.user import User
+from app.schemas.common import FROM_DB
 from app.schemas.smart_attendance import (
+    ATTENDANCE_ALERT_LIST_ADAPTER,
+    FRAUD_DETECTION_LIST_ADAPTER,
     AttendanceAlertOut,
     AttendanceSessionCreate,
     AttendanceSessionOut,
@@ -14,22 +18,28 @@ from app.schemas.smart_attendance import (
     FraudDetectionOut,
     LiveAttendanceSnapshot,
     SelfCheckinOut,
-    TeamsParticipationOut,
+    Severity,
+    TeamsParticipantReport,
 )
 from app.services.self_checkin import SelfCheckinService
 from app.services.smart_alerts import SmartAlertsService
 from app.services.teams_integration import TeamsIntegrationService
-from app.utils.deps import get_current_user, get_db
+from app.utils.deps import get_current_user, get_db, json_body, json_body_openapi
 
 router = APIRouter(prefix="/smart-attendance", tags=["smart-attendance"])
 
 
-@router.post("/sessions", response_model=AttendanceSessionOut, status_code=201)
+@router.post(
+    "/sessions",
+    response_model=AttendanceSessionOut,
+    status_code=201,
+    openapi_extra=json_body_openapi(AttendanceSessionCreate),
+)
 async def create_attendance_session(
     *,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    session_data: AttendanceSessionCreate,
+    session_data: AttendanceSessionCreate = Depends(json_body(AttendanceSessionCreate)),
 ) -> AttendanceSessionOut:
     """
     Create a new smart attendance session configuration.
@@ -53,17 +63,8 @@ async def create_attendance_session(
         raise HTTPException(status_code=400, detail="Attendance session already exists for this session")
     
     # Create attendance session
-    attendance_session = AttendanceSession(
-        session_id=session_data.session_id,
-        mode=session_data.mode,
-        checkin_window_minutes=session_data.checkin_window_minutes,
-        location_verification_enabled=session_data.location_verification_enabled,
-        classroom_lat=session_data.classroom_lat,
-        classroom_lng=session_data.classroom_lng,
-        allowed_radius_meters=session_data.allowed_radius_meters,
-        teams_meeting_id=session_data.teams_meeting_id,
-        teams_meeting_url=session_data.teams_meeting_url,
-    )
+    # Settings the mode has no fields for keep their column defaults
+    attendance_session = AttendanceSession(**session_data.model_dump())
     db.add(attendance_session)
     db.commit()
     db.refresh(attendance_session)
@@ -90,10 +91,14 @@ async def get_attendance_session(
     return AttendanceSessionOut.from_orm(attendance_session)
 
 
-@router.patch("/sessions/{session_id}", response_model=AttendanceSessionOut)
+@router.patch(
+    "/sessions/{session_id}",
+    response_model=AttendanceSessionOut,
+    openapi_extra=json_body_openapi(AttendanceSessionUpdate),
+)
 async def update_attendance_session(
     session_id: int,
-    session_data: AttendanceSessionUpdate,
+    session_data: AttendanceSessionUpdate = Depends(json_body(AttendanceSessionUpdate)),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> AttendanceSessionOut:
@@ -171,7 +176,7 @@ async def get_live_attendance(
     session_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> LiveAttendanceSnapshot:
+) -> Response:
     """
     Get real-time attendance snapshot for a session.
     Shows all check-ins, pending verifications, and fraud flags.
@@ -199,41 +204,66 @@ async def get_live_attendance(
     if not attendance_session:
         raise HTTPException(status_code=404, detail="Attendance session not configured")
     
-    # Get check-ins
-    checkins = db.query(SelfCheckin).filter(
-        SelfCheckin.attendance_session_id == attendance_session.id
-    ).all()
-    
-    # Get Teams participations
-    teams_participations = db.query(TeamsParticipation).filter(
-        TeamsParticipation.attendance_session_id == attendance_session.id
-    ).all()
-    
-    # Get fraud flags for this session
-    fraud_flags = db.query(FraudDetection).filter(
-        FraudDetection.session_id == session_id,
-        FraudDetection.is_resolved == False
-    ).all()
-    
-    return LiveAttendanceSnapshot(
-        session_id=session_id,
-        mode=attendance_session.mode,
-        total_students_expected=0,  # TODO: Calculate from session enrollment
-        total_checked_in=len([c for c in checkins if c.status == "approved"]),
-        pending_verification=len([c for c in checkins if c.status == "flagged"]),
-        fraud_flags_count=len(fraud_flags),
-        recent_checkins=[SelfCheckinOut.from_orm(c) for c in checkins[-10:]],
-        recent_teams_joins=[TeamsParticipationOut.from_orm(t) for t in teams_participations[-10:]],
+    # Status counts in one aggregate (index-only on ix_self_checkins_session_student)
+    total_checked_in, pending_verification = (
+        db.query(
+            func.count().filter(SelfCheckin.status == "approved"),
+            func.count().filter(SelfCheckin.status == "flagged"),
+        )
+        .filter(SelfCheckin.attendance_session_id == attendance_session.id)
+        .one()
     )
 
+    # Only the latest rows are shown
+    recent_checkins = (
+        db.query(SelfCheckin)
+        .filter(SelfCheckin.attendance_session_id == attendance_session.id)
+        .order_by(SelfCheckin.id.desc())
+        .limit(10)
+        .all()
+    )
+    recent_teams_joins = (
+        db.query(TeamsParticipation)
+        .filter(TeamsParticipation.attendance_session_id == attendance_session.id)
+        .order_by(TeamsParticipation.id.desc())
+        .limit(10)
+        .all()
+    )
+
+    # Count open fraud flags for this session
+    fraud_flags_count = (
+        db.query(func.count(FraudDetection.id))
+        .filter(
+            FraudDetection.session_id == session_id,
+            FraudDetection.is_resolved == False,  # noqa: E712
+        )
+        .scalar()
+    )
+    
+    snapshot = LiveAttendanceSnapshot.model_validate(
+        {
+            "session_id": session_id,
+            "mode": attendance_session.mode,
+            "total_students_expected": 0,  # TODO: Calculate from session enrollment
+            "total_checked_in": total_checked_in,
+            "pending_verification": pending_verification,
+            "fraud_flags_count": fraud_flags_count,
+            "recent_checkins": recent_checkins[::-1],
+            "recent_teams_joins": recent_teams_joins[::-1],
+        },
+        from_attributes=True,
+        context=FROM_DB,
+    )
+    return Response(content=snapshot.model_dump_json(), media_type="application/json")
+
 
 @router.get("/alerts", response_model=List[AttendanceAlertOut])
 async def get_alerts(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    severity: Optional[str] = Query(None, description="Filter by severity: low, medium, high"),
+    severity: Optional[Severity] = Query(None, description="Filter by severity"),
     unacknowledged_only: bool = Query(True, description="Show only unacknowledged alerts"),
-) -> List[AttendanceAlertOut]:
+) -> Response:
     """Get attendance alerts for the current user (trainer/admin)."""
     if current_user.role not in ["trainer", "admin"]:
         raise HTTPException(status_code=403, detail="Only trainers and admins can view alerts")
@@ -249,7 +279,13 @@ async def get_alerts(
             query = query.filter(AttendanceAlert.severity == severity)
         alerts = query.order_by(AttendanceAlert.created_at.desc()).limit(100).all()
     
-    return [AttendanceAlertOut.from_orm(alert) for alert in alerts]
+    alerts = ATTENDANCE_ALERT_LIST_ADAPTER.validate_python(
+        alerts, from_attributes=True, context=FROM_DB
+    )
+    return Response(
+        content=ATTENDANCE_ALERT_LIST_ADAPTER.dump_json(alerts, by_alias=True),
+        media_type="application/json",
+    )
 
 
 @router.patch("/alerts/{alert_id}/acknowledge", response_model=AttendanceAlertOut)
@@ -277,8 +313,8 @@ async def get_fraud_detections(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     resolved: Optional[bool] = Query(None, description="Filter by resolution status"),
-    severity: Optional[str] = Query(None, description="Filter by severity"),
-) -> List[FraudDetectionOut]:
+    severity: Optional[Severity] = Query(None, description="Filter by severity"),
+) -> Response:
     """Get fraud detection records. Admin only."""
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admins can view fraud detections")
@@ -293,7 +329,12 @@ async def get_fraud_detections(
     
     fraud_records = query.order_by(FraudDetection.created_at.desc()).limit(100).all()
     
-    return [FraudDetectionOut.from_orm(record) for record in fraud_records]
+    fraud_records = FRAUD_DETECTION_LIST_ADAPTER.validate_python(
+        fraud_records, from_attributes=True, context=FROM_DB
+    )
+    return Response(
+        content=FRAUD_DETECTION_LIST_ADAPTER.dump_json(fraud_records), media_type="application/json"
+    )
 
 
 @router.patch("/fraud-detections/{fraud_id}/resolve", response_model=FraudDetectionOut)
@@ -346,3 +387,31 @@ async def sync_teams_meeting(
         status_code=501,
         detail="Teams sync not implemented yet (Microsoft Graph integration required)",
     )
+
+
+@router.post(
+    "/teams/{attendance_session_id}/attendance-report",
+    status_code=200,
+    openapi_extra=json_body_openapi(List[TeamsParticipantReport]),
+)
+async def ingest_teams_attendance_report(
+    attendance_session_id: int,
+    participants: List[TeamsParticipantReport] = Depends(json_body(List[TeamsParticipantReport])),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Store a Teams meeting attendance report (all participants at once).
+    Replaces participation already recorded for the attendance session.
+    """
+    if current_user.role not in ["trainer", "admin"]:
+        raise HTTPException(status_code=403, detail="Only trainers and admins can sync Teams data")
+
+    result = TeamsIntegrationService.ingest_attendance_report(
+        db, attendance_session_id, [p.model_dump() for p in participants]
+    )
+    if not result["success"]:
+        raise HTTPException(status_code=404, detail=result["error"])
+
+    db.commit()
+    return result
@@ -12,6 +12,7 @@ from app.models.session import Session as SessionModel
 from app.models.student import Student
 from app.models.user import User
 from app.services.attendance import AttendanceService
+from app.services.student_counters import total_absence_hours
 from app.utils.deps import get_current_user, get_db
 
 router = APIRouter(tags=["student"])
@@ -110,7 +111,7 @@ def get_student_stats(
             if next_session and next_session.session_date
             else None
         ),
-        "total_absence_hours": student.total_absence_hours or 0,
+        "total_absence_hours": total_absence_hours(student),
         "total_late_minutes": student.total_late_minutes or 0,
         "alert_level": student.alert_level or "none",
         "ai_score": student.pourcentage,  # AI attendance score (ALWAYS available now!)
@@ -725,11 +726,7 @@ def get_notification_preferences(
 
     from app.models.notification_preferences import NotificationPreferences
 
-    prefs = (
-        db.query(NotificationPreferences)
-        .filter(NotificationPreferences.user_id == current_user.id)
-        .first()
-    )
+    prefs = db.get(NotificationPreferences, current_user.id)
 
     if not prefs:
         prefs = NotificationPreferences(user_id=current_user.id)
@@ -895,24 +892,31 @@ def update_notification_preferences(
     if current_user.role != "student":
         raise HTTPException(status_code=403, detail="Only students can update preferences")
 
-    from app.models.notification_preferences import NotificationPreferences
+    from sqlalchemy import func
+    from sqlalchemy.dialects.postgresql import insert
 
-    prefs = (
-        db.query(NotificationPreferences)
-        .filter(NotificationPreferences.user_id == current_user.id)
-        .first()
-    )
-    if not prefs:
-        prefs = NotificationPreferences(user_id=current_user.id)
-        db.add(prefs)
+    from app.models.notification_preferences import NotificationPreferences
 
     # Only update known keys; ignore extras.
-    for key in ["system", "justification", "schedule", "message", "email", "push"]:
-        if key in payload:
-            setattr(prefs, key, bool(payload[key]))
+    updates = {
+        key: bool(payload[key])
+        for key in ["system", "justification", "schedule", "message", "email", "push"]
+        if key in payload
+    }
 
+    # Single-statement upsert keyed on user_id (no SELECT-then-UPDATE round trip)
+    stmt = insert(NotificationPreferences).values(user_id=current_user.id, **updates)
+    if updates:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[NotificationPreferences.user_id],
+            set_={**updates, "updated_at": func.now()},
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[NotificationPreferences.user_id])
+    db.execute(stmt)
     db.commit()
-    db.refresh(prefs)
+
+    prefs = db.get(NotificationPreferences, current_user.id)
     return {
         "system": prefs.system,
         "justification": prefs.justification,
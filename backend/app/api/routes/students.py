@@ -1,15 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.models.student import Student
 from app.models.user import User
-from app.schemas.student import StudentListResponse, StudentOut, StudentUpdate
+from app.schemas.student import STUDENT_LIST_ADAPTER, StudentListResponse, StudentOut, StudentUpdate
+from app.services.student_counters import absence_hours_by_id
 from app.services.user import UserService
 from app.utils.deps import get_current_user, get_db
 
 router = APIRouter(tags=["students"])
 
 
+def _students_out(students: list[Student]) -> list[StudentOut]:
+    """Serialize ``students`` with absence hours still buffered in Redis included."""
+    totals = absence_hours_by_id(students)
+    return [
+        StudentOut.model_validate(student).model_copy(
+            update={"total_absence_hours": totals[student.id]}
+        )
+        for student in students
+    ]
+
+
 @router.get("", response_model=StudentListResponse)
 def list_students(
     page: int = Query(1, ge=1),
@@ -35,7 +47,10 @@ def list_students(
     offset = (page - 1) * page_size
     students = query.offset(offset).limit(page_size).all()
 
-    return StudentListResponse(students=students, total=total, page=page, page_size=page_size)
+    result = StudentListResponse(
+        students=_students_out(students), total=total, page=page, page_size=page_size
+    )
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{student_id}", response_model=StudentOut)
@@ -61,7 +76,7 @@ def get_student(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Cannot access other student's data"
             )
 
-    return student
+    return _students_out([student])[0]
 
 
 @router.patch("/{student_id}", response_model=StudentOut)
@@ -88,7 +103,7 @@ def update_student(
 
     db.commit()
     db.refresh(student)
-    return student
+    return _students_out([student])[0]
 
 
 @router.get("/class/{class_name}", response_model=list[StudentOut])
@@ -104,8 +119,8 @@ def get_students_by_class(
             detail="Only admin/trainer can view class students",
         )
 
-    students = UserService.get_students_by_class(db, class_name)
-    return students
+    students = _students_out(UserService.get_students_by_class(db, class_name))
+    return Response(content=STUDENT_LIST_ADAPTER.dump_json(students), media_type="application/json")
 
 
 @router.delete("/{student_id}", status_code=status.HTTP_204_NO_CONTENT)
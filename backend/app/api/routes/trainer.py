@@ -6,6 +6,7 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.attendance import AttendanceRecord
+from app.models.school_class import SchoolClass
 from app.models.session import Session as SessionModel
 from app.models.student import Student
 from app.models.trainer import Trainer
@@ -160,11 +161,11 @@ def get_trainer_sessions(
     class_names.discard("")
     class_counts = {}
     if class_names:
-        # The mapped attribute is `class_name` (DB column named "class")
         class_counts = dict(
-            db.query(Student.class_name, func.count(Student.id))
-            .filter(Student.class_name.in_(class_names))
-            .group_by(Student.class_name)
+            db.query(SchoolClass.name, func.count(Student.id))
+            .join(Student, Student.class_id == SchoolClass.id)
+            .filter(SchoolClass.name.in_(class_names))
+            .group_by(SchoolClass.name)
             .all()
         )
 
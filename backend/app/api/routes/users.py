@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.models.user import User
-from app.schemas.user import UserCreate, UserOut, UserUpdate
+from app.schemas.user import USER_LIST_ADAPTER, UserCreate, UserOut, UserUpdate
 from app.services.auth import get_password_hash
 from app.utils.deps import get_db
 
@@ -11,7 +11,8 @@ router = APIRouter()
 
 @router.get("/", response_model=list[UserOut])
 def list_users(db: Session = Depends(get_db)):
-    return db.query(User).all()
+    users = USER_LIST_ADAPTER.validate_python(db.query(User).all(), from_attributes=True)
+    return Response(content=USER_LIST_ADAPTER.dump_json(users), media_type="application/json")
 
 
 @router.post("/", response_model=UserOut, status_code=status.HTTP_201_CREATED)
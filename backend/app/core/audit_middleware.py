@@ -98,7 +98,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
                     request_method=method,
                     request_path=path,
                     new_values=body if method in ["POST", "PUT", "PATCH"] else None,
-                    success="success" if response.status_code < 400 else "failure",
+                    success=response.status_code < 400,
                     meta={
                         'status_code': response.status_code,
                         'duration_ms': duration_ms,
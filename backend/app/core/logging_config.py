@@ -2,26 +2,51 @@
 Comprehensive logging configuration for SmartPresence AI
 """
 
-import json
 import logging
 import logging.handlers
+import os
+import queue
 import sys
-from datetime import datetime
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
+
+import orjson
 
 # Create logs directory if it doesn't exist
 LOGS_DIR = Path("logs")
 LOGS_DIR.mkdir(exist_ok=True)
 
+# Background listeners started by setup_logging (stopped on reconfigure/shutdown)
+_queue_listeners: List[logging.handlers.QueueListener] = []
+
+# In-memory buffers in front of file handlers (flushed periodically)
+_buffered_handlers: List[logging.handlers.MemoryHandler] = []
+
+
+@lru_cache(maxsize=4)
+def _utc_second_prefix(seconds: int) -> str:
+    """Format the whole-second part of a UTC timestamp (cached per second)"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _format_record_time(created: float) -> str:
+    """Format a LogRecord ``created`` value as a UTC ISO timestamp"""
+    seconds = int(created)
+    return f"{_utc_second_prefix(seconds)}.{int((created - seconds) * 1_000_000):06d}"
+
 
 # Custom JSON formatter for structured logging
 class JsonFormatter(logging.Formatter):
     """Format logs as JSON for easier parsing and monitoring"""
 
+    # Custom fields copied from ``extra=`` when present and not None
+    _OPTIONAL = ("user_id", "request_id", "endpoint", "method", "status_code", "duration_ms")
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _format_record_time(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -34,21 +59,82 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        # Add custom fields if present
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-        if hasattr(record, "endpoint"):
-            log_data["endpoint"] = record.endpoint
-        if hasattr(record, "method"):
-            log_data["method"] = record.method
-        if hasattr(record, "status_code"):
-            log_data["status_code"] = record.status_code
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
+        rd = record.__dict__
+        for key in self._OPTIONAL:
+            value = rd.get(key)
+            if value is not None:
+                log_data[key] = value
+
+        return orjson.dumps(log_data, default=str).decode()
+
+
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that coalesces records into batched writes
+
+    Formatted records are buffered and written with a single ``os.write`` per
+    batch instead of one ``write()`` per record. A batch is flushed when it
+    reaches ``batch_size`` records, when ``flush_interval`` seconds have passed
+    since the last write, on ERROR-level records, and on flush/close.
+    """
+
+    def __init__(
+        self,
+        filename,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+        **kwargs,
+    ):
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, **kwargs)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self._last_write = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + self.terminator
+            self._pending.append(line)
+            self._pending_size += len(line)
+            if (
+                len(self._pending) >= self.batch_size
+                or record.levelno >= logging.ERROR
+                or time.monotonic() - self._last_write >= self.flush_interval
+            ):
+                self._write_pending()
+        except Exception:
+            self.handleError(record)
+
+    def _write_pending(self) -> None:
+        """Write buffered records in one syscall (caller holds the handler lock)"""
+        if not self._pending:
+            return
+        if self.stream is None:
+            self.stream = self._open()
+        fd = self.stream.fileno()
+        if self.maxBytes > 0 and os.fstat(fd).st_size + self._pending_size >= self.maxBytes:
+            self.doRollover()
+            fd = self.stream.fileno()
 
-        return json.dumps(log_data)
+        data = memoryview("".join(self._pending).encode(self.stream.encoding))
+        self._pending.clear()
+        self._pending_size = 0
+        while data:
+            data = data[os.write(fd, data) :]
+        self._last_write = time.monotonic()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write_pending()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -95,6 +181,14 @@ def setup_logging(
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    stop_logging()
+
+    # Formatters are stateless, so one instance per mode is shared by all handlers
+    json_formatter = JsonFormatter()
+    text_formatter = logging.Formatter(
+        "%(asctime)s - %(levelname)s - %(name)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    file_formatter = json_formatter if json_output else text_formatter
 
     # Console Handler
     if include_console:
@@ -102,7 +196,7 @@ def setup_logging(
         console_handler.setLevel(getattr(logging, log_level.upper()))
 
         if json_output:
-            formatter = JsonFormatter()
+            formatter = json_formatter
         else:
             formatter = ColoredFormatter(
                 "%(asctime)s - %(levelname)s - %(name)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
@@ -113,40 +207,43 @@ def setup_logging(
     # File Handlers
     if include_file:
         # General log file
-        general_handler = logging.handlers.RotatingFileHandler(
+        general_handler = BatchedRotatingFileHandler(
             LOGS_DIR / "app.log", maxBytes=10485760, backupCount=10  # 10MB
         )
         general_handler.setLevel(getattr(logging, log_level.upper()))
-        general_handler.setFormatter(
-            JsonFormatter()
-            if json_output
-            else logging.Formatter(
-                "%(asctime)s - %(levelname)s - %(name)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-            )
+        general_handler.setFormatter(file_formatter)
+        root_logger.addHandler(
+            _buffered(general_handler, capacity=1024, level=getattr(logging, log_level.upper()))
         )
-        root_logger.addHandler(general_handler)
 
-        # Error log file
-        error_handler = logging.handlers.RotatingFileHandler(
+        # Error log file (unbuffered: errors are written immediately)
+        error_handler = BatchedRotatingFileHandler(
             LOGS_DIR / "error.log", maxBytes=10485760, backupCount=10  # 10MB
         )
         error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(
-            JsonFormatter()
-            if json_output
-            else logging.Formatter(
-                "%(asctime)s - %(levelname)s - %(name)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-            )
-        )
+        error_handler.setFormatter(file_formatter)
         root_logger.addHandler(error_handler)
 
         # API request log file
-        api_handler = logging.handlers.RotatingFileHandler(
+        api_handler = BatchedRotatingFileHandler(
             LOGS_DIR / "api.log", maxBytes=10485760, backupCount=20  # 10MB
         )
         api_handler.setLevel(logging.INFO)
-        api_handler.setFormatter(JsonFormatter())
-        root_logger.addHandler(api_handler)
+        api_handler.setFormatter(json_formatter)
+
+        # Hand API records to a listener thread so JSON formatting and the
+        # file write happen off the request path
+        api_queue: queue.SimpleQueue = queue.SimpleQueue()
+        api_queue_handler = logging.handlers.QueueHandler(api_queue)
+        api_queue_handler.setLevel(logging.INFO)
+        api_listener = logging.handlers.QueueListener(
+            api_queue,
+            _buffered(api_handler, capacity=2048, level=logging.INFO),
+            respect_handler_level=True,
+        )
+        api_listener.start()
+        _queue_listeners.append(api_listener)
+        root_logger.addHandler(api_queue_handler)
 
     # Create specific loggers
     loggers = {
@@ -165,6 +262,34 @@ def setup_logging(
     return loggers
 
 
+def _buffered(
+    target: logging.Handler, capacity: int, level: int
+) -> logging.handlers.MemoryHandler:
+    """Wrap a file handler in a MemoryHandler that flushes on ERROR or when full"""
+    handler = logging.handlers.MemoryHandler(
+        capacity=capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True
+    )
+    handler.setLevel(level)
+    _buffered_handlers.append(handler)
+    return handler
+
+
+def flush_logging() -> None:
+    """Flush buffered file handlers (scheduled periodically by the app)"""
+    for handler in list(_buffered_handlers):
+        handler.flush()
+        if handler.target is not None:
+            handler.target.flush()
+
+
+def stop_logging() -> None:
+    """Flush and stop background log listeners started by setup_logging"""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+    flush_logging()
+    _buffered_handlers.clear()
+
+
 # Get logger instance
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance"""
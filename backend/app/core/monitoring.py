@@ -3,14 +3,18 @@ Monitoring and metrics collection for SmartPresence AI
 """
 
 import json
+import logging
+import queue
 import threading
 import time
-from collections import defaultdict
-from dataclasses import asdict, dataclass
-from datetime import datetime, timedelta
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from functools import wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Union
+
+import numpy as np
 
 from .logging_config import get_logger
 
@@ -21,12 +25,18 @@ metrics_logger = get_logger("api")
 METRICS_DIR = Path("metrics")
 METRICS_DIR.mkdir(exist_ok=True)
 
+_HOUR_NS = 3600 * 1_000_000_000
+
+# Field names passed as ``extra=`` on metric log records
+_REQ_EXTRA_KEYS = ("endpoint", "method", "status_code", "duration_ms", "user_id")
+_SERVICE_EXTRA_KEYS = ("service", "operation", "duration_ms", "success", "error")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RequestMetric:
     """Request metric data"""
 
-    timestamp: str
+    timestamp_ns: int
     endpoint: str
     method: str
     status_code: int
@@ -36,24 +46,59 @@ class RequestMetric:
     request_size: Optional[int] = None
     response_size: Optional[int] = None
 
+    @property
+    def timestamp(self) -> str:
+        """ISO timestamp, formatted only when needed"""
+        return _epoch_ns_to_iso(self.timestamp_ns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "timestamp": self.timestamp,
+            "endpoint": self.endpoint,
+            "method": self.method,
+            "status_code": self.status_code,
+            "duration_ms": self.duration_ms,
+            "user_id": self.user_id,
+            "error": self.error,
+            "request_size": self.request_size,
+            "response_size": self.response_size,
+        }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemMetric:
     """System health metric"""
 
-    timestamp: str
+    timestamp_ns: int
     cpu_usage: float
     memory_usage: float
     disk_usage: float
     active_connections: int
     request_queue_size: int
 
+    @property
+    def timestamp(self) -> str:
+        """ISO timestamp, formatted only when needed"""
+        return _epoch_ns_to_iso(self.timestamp_ns)
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "timestamp": self.timestamp,
+            "cpu_usage": self.cpu_usage,
+            "memory_usage": self.memory_usage,
+            "disk_usage": self.disk_usage,
+            "active_connections": self.active_connections,
+            "request_queue_size": self.request_queue_size,
+        }
+
+
+@dataclass(slots=True, frozen=True)
 class ServiceMetric:
     """Service-specific metric"""
 
-    timestamp: str
+    timestamp_ns: int
     service: str
     operation: str
     success: bool
@@ -61,124 +106,289 @@ class ServiceMetric:
     error: Optional[str] = None
     details: Optional[Dict[str, Any]] = None
 
+    @property
+    def timestamp(self) -> str:
+        """ISO timestamp, formatted only when needed"""
+        return _epoch_ns_to_iso(self.timestamp_ns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "timestamp": self.timestamp,
+            "service": self.service,
+            "operation": self.operation,
+            "success": self.success,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            "details": self.details,
+        }
+
+
+def _epoch_ns_to_iso(epoch_ns: int) -> str:
+    """Convert integer epoch nanoseconds back to a naive UTC ISO timestamp"""
+    dt = datetime.fromtimestamp(epoch_ns // 1000 / 1_000_000, tz=timezone.utc)
+    return dt.replace(tzinfo=None).isoformat()
+
+
+class RequestBuffer:
+    """Columnar (structure-of-arrays) store for request metrics
+
+    Hot numeric fields live in preallocated NumPy arrays that double on
+    overflow, and endpoint/method strings are interned to integer ids, so
+    aggregations run as vectorized mask/bincount passes instead of Python
+    loops over per-request dicts. Rarely-set optional fields are kept in a
+    sparse row -> dict map.
+    """
+
+    _OPTIONAL_FIELDS = ("user_id", "error", "request_size", "response_size")
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self.ts = np.zeros(capacity, dtype=np.int64)
+        self.dur = np.zeros(capacity, dtype=np.float32)
+        self.status = np.zeros(capacity, dtype=np.int16)
+        self.endpoint_idx = np.zeros(capacity, dtype=np.int32)
+        self.method_idx = np.zeros(capacity, dtype=np.int32)
+        self.endpoints: Dict[str, int] = {}
+        self.endpoint_names: List[str] = []
+        self.methods: Dict[str, int] = {}
+        self.method_names: List[str] = []
+        self.extras: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    @staticmethod
+    def _intern(value: str, ids: Dict[str, int], names: List[str]) -> int:
+        idx = ids.get(value)
+        if idx is None:
+            idx = ids[value] = len(names)
+            names.append(value)
+        return idx
+
+    def _grow(self) -> None:
+        capacity = max(1, len(self.ts)) * 2
+        for name in ("ts", "dur", "status", "endpoint_idx", "method_idx"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+
+    def append(self, metric: "RequestMetric") -> None:
+        """Append a request metric (caller holds the collector lock)"""
+        if self.size == len(self.ts):
+            self._grow()
+        i = self.size
+        self.ts[i] = metric.timestamp_ns
+        self.dur[i] = metric.duration_ms
+        self.status[i] = metric.status_code
+        self.endpoint_idx[i] = self._intern(metric.endpoint, self.endpoints, self.endpoint_names)
+        self.method_idx[i] = self._intern(metric.method, self.methods, self.method_names)
+        extra = {
+            field: getattr(metric, field)
+            for field in self._OPTIONAL_FIELDS
+            if getattr(metric, field) is not None
+        }
+        if extra:
+            self.extras[i] = extra
+        self.size = i + 1
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """Return views over the filled part of each column"""
+        n = self.size
+        return {
+            "ts": self.ts[:n],
+            "dur": self.dur[:n],
+            "status": self.status[:n],
+            "endpoint_idx": self.endpoint_idx[:n],
+        }
+
+    def compact(self, cutoff_ns: int) -> None:
+        """Drop rows recorded at or before ``cutoff_ns``"""
+        keep = np.flatnonzero(self.ts[: self.size] > cutoff_ns)
+        if len(keep) == self.size:
+            return
+        # Copy into fresh arrays so snapshots handed out earlier stay consistent
+        for name in ("ts", "dur", "status", "endpoint_idx", "method_idx"):
+            column = getattr(self, name)
+            compacted = np.zeros(len(column), dtype=column.dtype)
+            compacted[: len(keep)] = column[keep]
+            setattr(self, name, compacted)
+        remap = {int(old): new for new, old in enumerate(keep)}
+        self.extras = {remap[row]: extra for row, extra in self.extras.items() if row in remap}
+        self.size = len(keep)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize rows as dicts (used for exports)"""
+        records = []
+        for i in range(self.size):
+            record = {
+                "timestamp": _epoch_ns_to_iso(int(self.ts[i])),
+                "endpoint": self.endpoint_names[self.endpoint_idx[i]],
+                "method": self.method_names[self.method_idx[i]],
+                "status_code": int(self.status[i]),
+                "duration_ms": float(self.dur[i]),
+            }
+            record.update({field: None for field in self._OPTIONAL_FIELDS})
+            record.update(self.extras.get(i, {}))
+            records.append(record)
+        return records
+
 
 class MetricsCollector:
-    """Collect and store application metrics"""
+    """Collect and store application metrics
+
+    ``record_*`` calls only enqueue the metric; a single daemon writer thread
+    drains the queue into the in-memory store and emits the matching log
+    lines, keeping lock acquisition and log I/O off the request path.
+    """
 
     def __init__(self, retention_days: int = 7):
         self.retention_days = retention_days
-        self.metrics: Dict[str, List[Dict]] = defaultdict(list)
+        # Time-ordered system/service metrics, trimmed from the left on cleanup
+        self.metrics: Dict[str, Deque[Union[SystemMetric, ServiceMetric]]] = defaultdict(deque)
+        self.requests = RequestBuffer()
         self.lock = threading.Lock()
+        self._queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._drain, name="metrics-writer", daemon=True
+        )
+        self._writer.start()
 
     def record_request(self, metric: RequestMetric) -> None:
         """Record a request metric"""
-        with self.lock:
-            self.metrics["requests"].append(asdict(metric))
-            metrics_logger.info(
-                f"API Request: {metric.method} {metric.endpoint}",
-                extra={
-                    "endpoint": metric.endpoint,
-                    "method": metric.method,
-                    "status_code": metric.status_code,
-                    "duration_ms": metric.duration_ms,
-                    "user_id": metric.user_id,
-                },
-            )
+        self._queue.put(("request", metric))
 
     def record_system_metric(self, metric: SystemMetric) -> None:
         """Record a system metric"""
-        with self.lock:
-            self.metrics["system"].append(asdict(metric))
+        self._queue.put(("system", metric))
 
     def record_service_metric(self, metric: ServiceMetric) -> None:
         """Record a service metric"""
-        with self.lock:
-            self.metrics["services"].append(asdict(metric))
-            level = "info" if metric.success else "error"
-            logger.log(
-                getattr(logger, level),
-                f"{metric.service}: {metric.operation}",
-                extra={
-                    "service": metric.service,
-                    "operation": metric.operation,
-                    "duration_ms": metric.duration_ms,
-                    "success": metric.success,
-                    "error": metric.error,
-                },
-            )
+        self._queue.put(("service", metric))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every metric queued so far has been applied"""
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def _drain(self) -> None:
+        """Writer thread loop: apply queued metrics one at a time"""
+        while True:
+            kind, item = self._queue.get()
+            try:
+                self._apply(kind, item)
+            except Exception:
+                logger.exception(f"Failed to record {kind} metric")
+
+    def _apply(self, kind: str, item: Any) -> None:
+        if kind == "flush":
+            item.set()
+        elif kind == "request":
+            with self.lock:
+                self.requests.append(item)
+            if metrics_logger.isEnabledFor(logging.INFO):
+                values = (
+                    item.endpoint,
+                    item.method,
+                    item.status_code,
+                    item.duration_ms,
+                    item.user_id,
+                )
+                metrics_logger.info(
+                    "API Request: %s %s",
+                    item.method,
+                    item.endpoint,
+                    extra=dict(zip(_REQ_EXTRA_KEYS, values)),
+                )
+        elif kind == "system":
+            with self.lock:
+                self.metrics["system"].append(item)
+        elif kind == "service":
+            with self.lock:
+                self.metrics["services"].append(item)
+            level = logging.INFO if item.success else logging.ERROR
+            if logger.isEnabledFor(level):
+                values = (
+                    item.service,
+                    item.operation,
+                    item.duration_ms,
+                    item.success,
+                    item.error,
+                )
+                logger.log(
+                    level,
+                    "%s: %s",
+                    item.service,
+                    item.operation,
+                    extra=dict(zip(_SERVICE_EXTRA_KEYS, values)),
+                )
 
     def get_request_stats(self, hours: int = 1) -> Dict[str, Any]:
         """Get request statistics for the last N hours"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        cutoff_str = cutoff_time.isoformat()
+        cutoff_ns = time.time_ns() - hours * _HOUR_NS
 
-        requests = [r for r in self.metrics["requests"] if r.get("timestamp", "") > cutoff_str]
+        with self.lock:
+            columns = self.requests.snapshot()
+            endpoint_names = list(self.requests.endpoint_names)
 
-        if not requests:
+        mask = columns["ts"] > cutoff_ns
+        total = int(np.count_nonzero(mask))
+        if not total:
             return {}
 
-        status_codes = defaultdict(int)
-        endpoints = defaultdict(lambda: {"count": 0, "avg_duration": 0})
-        total_duration = 0
-
-        for req in requests:
-            status_codes[req["status_code"]] += 1
-            endpoint = req["endpoint"]
-            endpoints[endpoint]["count"] += 1
-            total_duration += req["duration_ms"]
-
-        # Calculate average durations
-        for endpoint in endpoints:
-            endpoint_requests = [r for r in requests if r["endpoint"] == endpoint]
-            endpoint_durations = [r["duration_ms"] for r in endpoint_requests]
-            endpoints[endpoint]["avg_duration"] = (
-                sum(endpoint_durations) / len(endpoint_durations) if endpoint_durations else 0
-            )
+        durations = columns["dur"][mask].astype(np.float64)
+        endpoint_idx = columns["endpoint_idx"][mask]
+        codes, code_counts = np.unique(columns["status"][mask], return_counts=True)
+        counts = np.bincount(endpoint_idx, minlength=len(endpoint_names))
+        duration_sums = np.bincount(endpoint_idx, weights=durations, minlength=len(endpoint_names))
+
+        endpoints = {
+            endpoint_names[idx]: {
+                "count": int(counts[idx]),
+                "avg_duration": float(duration_sums[idx] / counts[idx]),
+            }
+            for idx in np.flatnonzero(counts)
+        }
 
         return {
-            "total_requests": len(requests),
-            "status_codes": dict(status_codes),
-            "endpoints": dict(endpoints),
-            "avg_duration_ms": total_duration / len(requests) if requests else 0,
-            "min_duration_ms": min((r["duration_ms"] for r in requests), default=0),
-            "max_duration_ms": max((r["duration_ms"] for r in requests), default=0),
+            "total_requests": total,
+            "status_codes": {int(code): int(count) for code, count in zip(codes, code_counts)},
+            "endpoints": endpoints,
+            "avg_duration_ms": float(durations.sum() / total),
+            "min_duration_ms": float(durations.min()),
+            "max_duration_ms": float(durations.max()),
         }
 
     def get_error_stats(self, hours: int = 24) -> Dict[str, Any]:
         """Get error statistics"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        cutoff_str = cutoff_time.isoformat()
+        cutoff_ns = time.time_ns() - hours * _HOUR_NS
 
-        errors = [
-            r
-            for r in self.metrics["requests"]
-            if r.get("status_code", 0) >= 400 and r.get("timestamp", "") > cutoff_str
-        ]
-
-        error_types = defaultdict(int)
-        error_endpoints = defaultdict(int)
+        with self.lock:
+            columns = self.requests.snapshot()
+            endpoint_names = list(self.requests.endpoint_names)
 
-        for error in errors:
-            error_types[error.get("status_code", "unknown")] += 1
-            error_endpoints[error.get("endpoint", "unknown")] += 1
+        mask = (columns["status"] >= 400) & (columns["ts"] > cutoff_ns)
+        codes, code_counts = np.unique(columns["status"][mask], return_counts=True)
+        counts = np.bincount(columns["endpoint_idx"][mask], minlength=len(endpoint_names))
 
         return {
-            "total_errors": len(errors),
-            "error_types": dict(error_types),
-            "error_endpoints": dict(error_endpoints),
-            "errors_by_hour": self._count_by_hour(errors),
+            "total_errors": int(np.count_nonzero(mask)),
+            "error_types": {int(code): int(count) for code, count in zip(codes, code_counts)},
+            "error_endpoints": {endpoint_names[idx]: int(counts[idx]) for idx in np.flatnonzero(counts)},
+            "errors_by_hour": self._count_by_hour(columns["ts"][mask]),
         }
 
     def cleanup_old_metrics(self) -> None:
         """Remove metrics older than retention period"""
-        cutoff_time = datetime.utcnow() - timedelta(days=self.retention_days)
-        cutoff_str = cutoff_time.isoformat()
+        cutoff_ns = time.time_ns() - self.retention_days * 24 * _HOUR_NS
 
         with self.lock:
-            for metric_type in self.metrics:
-                self.metrics[metric_type] = [
-                    m for m in self.metrics[metric_type] if m.get("timestamp", "") > cutoff_str
-                ]
+            self.requests.compact(cutoff_ns)
+            for metrics in self.metrics.values():
+                while metrics and metrics[0].timestamp_ns <= cutoff_ns:
+                    metrics.popleft()
 
     def export_metrics(self, filepath: Optional[Path] = None) -> str:
         """Export metrics to JSON file"""
@@ -187,23 +397,23 @@ class MetricsCollector:
             filepath = METRICS_DIR / f"metrics_{timestamp}.json"
 
         with self.lock:
+            data = {"requests": self.requests.to_records()}
+            for metric_type, metrics in self.metrics.items():
+                data[metric_type] = [m.to_dict() for m in metrics]
             with open(filepath, "w") as f:
-                json.dump(dict(self.metrics), f, indent=2, default=str)
+                json.dump(data, f, indent=2, default=str)
 
         logger.info(f"Metrics exported to {filepath}")
         return str(filepath)
 
     @staticmethod
-    def _count_by_hour(items: List[Dict]) -> Dict[str, int]:
-        """Count items by hour"""
-        hourly_counts = defaultdict(int)
-        for item in items:
-            timestamp_str = item.get("timestamp", "")
-            if timestamp_str:
-                # Extract hour from ISO format timestamp
-                hour = timestamp_str[:13] + ":00"
-                hourly_counts[hour] += 1
-        return dict(hourly_counts)
+    def _count_by_hour(timestamps: np.ndarray) -> Dict[str, int]:
+        """Count epoch-ns timestamps by hour"""
+        hours, counts = np.unique(timestamps // _HOUR_NS, return_counts=True)
+        return {
+            _epoch_ns_to_iso(int(hour) * _HOUR_NS)[:13] + ":00": int(count)
+            for hour, count in zip(hours, counts)
+        }
 
 
 # Global metrics collector instance
@@ -215,7 +425,7 @@ def track_request(func):
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = time.time_ns()
         result = None
         error = None
         status_code = 500
@@ -229,7 +439,7 @@ def track_request(func):
             logger.exception(f"Error in {func.__name__}")
             raise
         finally:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.time_ns() - start_ns) / 1_000_000
 
             # Try to extract request context if available
             user_id = None
@@ -237,7 +447,7 @@ def track_request(func):
             method = "GET"
 
             metric = RequestMetric(
-                timestamp=datetime.utcnow().isoformat(),
+                timestamp_ns=start_ns,
                 endpoint=endpoint,
                 method=method,
                 status_code=status_code,
@@ -256,7 +466,7 @@ def track_service(service_name: str, operation: str):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.time_ns()
             success = False
             error = None
             result = None
@@ -270,9 +480,9 @@ def track_service(service_name: str, operation: str):
                 logger.exception(f"Error in {service_name}.{operation}")
                 raise
             finally:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.time_ns() - start_ns) / 1_000_000
                 metric = ServiceMetric(
-                    timestamp=datetime.utcnow().isoformat(),
+                    timestamp_ns=start_ns,
                     service=service_name,
                     operation=operation,
                     success=success,
@@ -287,37 +497,73 @@ def track_service(service_name: str, operation: str):
 
 
 # Health check data
+def _health_flag(bit: int, doc: str) -> property:
+    """Boolean view over one bit of HealthStatus._bits"""
+    mask = 1 << bit
+
+    def getter(self) -> bool:
+        return bool(self._bits & mask)
+
+    def setter(self, value: bool) -> None:
+        # Read-modify-write of the shared int: serialized so concurrent
+        # updates of different flags cannot drop each other
+        with self._lock:
+            self._bits = self._bits | mask if value else self._bits & ~mask
+
+    return property(getter, setter, doc=doc)
+
+
 class HealthStatus:
-    """Track system health status"""
+    """Track system health status
+
+    Component flags are packed into a single int, so reads and to_dict() see
+    one consistent snapshot; updates take a lock. The last check time is kept
+    as epoch nanoseconds.
+    """
+
+    __slots__ = ("_bits", "_last_check_ns", "_lock")
+
+    api_healthy = _health_flag(0, "API is serving requests")
+    database_healthy = _health_flag(1, "Database is reachable")
+    facial_service_healthy = _health_flag(2, "Facial recognition service is available")
+    redis_healthy = _health_flag(3, "Redis is reachable")
+    event_subscribers_ready = _health_flag(4, "Event bus subscribers are registered")
+
+    # Flags that must all be set for the system to count as healthy
+    _CRITICAL_MASK = 0b10011
 
     def __init__(self):
-        self.api_healthy = True
-        self.database_healthy = True
-        self.facial_service_healthy = True
-        self.redis_healthy = True
-        self.last_check = datetime.utcnow()
+        self._bits = 0b11111
+        self._last_check_ns = time.time_ns()
+        self._lock = threading.Lock()
+
+    def mark_checked(self) -> None:
+        """Record that a health check just ran"""
+        self._last_check_ns = time.time_ns()
+
+    @property
+    def last_check(self) -> datetime:
+        """Time of the last health check (naive UTC)"""
+        return datetime.utcfromtimestamp(self._last_check_ns / 1_000_000_000)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        bits = self._bits
         return {
             "status": "healthy" if self.is_healthy else "degraded",
-            "api": "healthy" if self.api_healthy else "unhealthy",
-            "database": "healthy" if self.database_healthy else "unhealthy",
-            "facial_service": "healthy" if self.facial_service_healthy else "unhealthy",
-            "redis": "healthy" if self.redis_healthy else "unhealthy",
-            "last_check": self.last_check.isoformat(),
+            "api": "healthy" if bits & 0b1 else "unhealthy",
+            "database": "healthy" if bits & 0b10 else "unhealthy",
+            "facial_service": "healthy" if bits & 0b100 else "unhealthy",
+            "redis": "healthy" if bits & 0b1000 else "unhealthy",
+            "event_subscribers": "ready" if bits & 0b10000 else "starting",
+            "last_check": _epoch_ns_to_iso(self._last_check_ns),
             "timestamp": datetime.utcnow().isoformat(),
         }
 
     @property
     def is_healthy(self) -> bool:
         """Check if all critical services are healthy"""
-        return all(
-            [
-                self.api_healthy,
-                self.database_healthy,
-            ]
-        )
+        return self._bits & self._CRITICAL_MASK == self._CRITICAL_MASK
 
 
 # Global health status
@@ -1,3 +1,12 @@
+from sqlalchemy import Column, DateTime
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql import func
 
 Base = declarative_base()
+
+
+class TimestampMixin:
+    """``created_at`` / ``updated_at`` columns stored as timestamptz."""
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,154 @@
+"""Bulk inserts for append-only log tables.
+
+Large batches are streamed with PostgreSQL ``COPY ... FROM STDIN`` (one round
+trip, no per-row INSERT parsing); small batches and non-psycopg dialects use a
+Core executemany ``insert()``, which SQLAlchemy sends as multi-row VALUES
+statements sized to stay under PostgreSQL's bind parameter limit.
+``BatchInserter`` buffers rows produced one at a time and writes them in
+batches.
+
+Timestamp columns defaulting to ``now()`` on the server are stamped once per
+batch on the client instead, so COPY writes a plain value and every row of a
+batch carries the same time (as a single INSERT's ``now()`` would).
+
+COPY rows go through each column type's bind processing (e.g. the
+``BasisPoints`` and ``Microdegrees`` decorators), so a batch stores the same
+values whichever path writes it.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type
+
+import orjson
+from sqlalchemy import JSON, DateTime, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import now as sql_now
+
+# Batches at or above this size are written with COPY
+COPY_THRESHOLD = 100
+
+# PostgreSQL accepts at most 65535 bind parameters per statement
+MAX_BIND_PARAMS = 65535
+MAX_ROWS_PER_STATEMENT = 10_000
+
+
+def _copy_json(value: Any) -> Any:
+    if value is None:
+        return None
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def copy_rows(
+    table, names: Sequence[str], rows: Sequence[Dict[str, Any]], defaults: Dict[str, Any], dialect
+) -> Iterator[List[Any]]:
+    """COPY rows for ``names``: values bound as an INSERT would bind them for ``dialect``.
+
+    JSON columns are encoded with orjson (as the engine's ``json_serializer``
+    does); other values go through the column type's bind processor, if any.
+    """
+    processors = [
+        _copy_json
+        if isinstance(table.c[name].type, JSON)
+        else table.c[name].type.bind_processor(dialect)
+        for name in names
+    ]
+    for row in rows:
+        values = [row.get(name, defaults.get(name)) for name in names]
+        yield [
+            process(value) if process is not None else value
+            for process, value in zip(processors, values)
+        ]
+
+
+def _batch_timestamps(table, names: Sequence[str]) -> Dict[str, datetime]:
+    """One shared value for each ``server_default=func.now()`` column of ``table`` missing from ``names``."""
+    now = datetime.now(timezone.utc)
+    return {
+        column.name: now if column.type.timezone else now.replace(tzinfo=None)
+        for column in table.columns
+        if isinstance(column.type, DateTime)
+        and isinstance(getattr(column.server_default, "arg", None), sql_now)
+        and column.name not in names
+    }
+
+
+def rows_per_statement(model: Type) -> int:
+    """Rows per multi-row VALUES statement for ``model`` within the bind parameter limit."""
+    return max(1, min(MAX_ROWS_PER_STATEMENT, MAX_BIND_PARAMS // len(model.__table__.columns)))
+
+
+def bulk_insert(session: Session, model: Type, rows: Sequence[Dict[str, Any]]) -> int:
+    """Insert ``rows`` (dicts keyed by column name) into ``model``'s table.
+
+    Python-side scalar column defaults are filled in for keys missing from the
+    rows, and ``now()``-defaulted timestamps get one shared value per batch;
+    other server defaults apply to columns not present in any row. Returns
+    the number of rows written. The caller commits.
+    """
+    if not rows:
+        return 0
+
+    table = model.__table__
+    names: List[str] = list(dict.fromkeys(key for row in rows for key in row))
+    stamps = _batch_timestamps(table, names)
+
+    if len(rows) < COPY_THRESHOLD or session.get_bind().dialect.driver != "psycopg":
+        statement = insert(model).execution_options(insertmanyvalues_page_size=rows_per_statement(model))
+        session.execute(statement, [{**stamps, **row} for row in rows])
+        return len(rows)
+
+    defaults = {
+        column.name: column.default.arg
+        for column in table.columns
+        if column.default is not None and column.default.is_scalar and column.name not in names
+    }
+    defaults.update(stamps)
+    names.extend(defaults)
+
+    dialect = session.get_bind().dialect
+    quote = dialect.identifier_preparer.quote
+    statement = f"COPY {quote(table.name)} ({', '.join(quote(name) for name in names)}) FROM STDIN"
+
+    cursor = session.connection().connection.driver_connection.cursor()
+    try:
+        with cursor.copy(statement) as copy:
+            for values in copy_rows(table, names, rows, defaults, dialect):
+                copy.write_row(values)
+    finally:
+        cursor.close()
+    return len(rows)
+
+
+class BatchInserter:
+    """Buffer rows for ``model`` and write them with ``bulk_insert`` in batches.
+
+    A batch is written whenever ``batch_size`` rows are pending; ``flush``
+    writes the remainder and must run before the caller commits (leaving the
+    ``with`` block does it).
+    """
+
+    def __init__(self, session: Session, model: Type, batch_size: Optional[int] = None):
+        self.session = session
+        self.model = model
+        self.batch_size = batch_size or rows_per_statement(model)
+        self.written = 0
+        self._pending: List[Dict[str, Any]] = []
+
+    def add(self, row: Dict[str, Any]) -> None:
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write pending rows; returns how many were written."""
+        rows, self._pending = self._pending, []
+        count = bulk_insert(self.session, self.model, rows)
+        self.written += count
+        return count
+
+    def __enter__(self) -> "BatchInserter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
@@ -0,0 +1,208 @@
+"""Native RANGE partition maintenance for append-only time-series tables.
+
+Partitioned tables are split into one child per day or month on their time
+column, named ``<table>_pYYYYMMDD`` / ``<table>_pYYYYMM``. Queries bounded on
+that column only touch recent partitions, and retention drops whole
+partitions (DETACH + DROP) instead of DELETE-ing rows from one big table.
+
+Children are not created automatically by PostgreSQL: ``maintain_partitions``
+keeps ``PARTITION_PREMAKE`` future partitions ahead of time and is scheduled
+by the app. Each table also has a DEFAULT partition (``<table>_default``)
+catching rows no range partition covers, so writes keep working if the job
+falls behind; the job moves such rows into their range partition when it
+creates it.
+"""
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+# table -> (partition column, interval)
+PARTITIONED_TABLES: Dict[str, Tuple[str, str]] = {
+    "audit_logs": ("timestamp", "day"),
+    "messages": ("created_at", "month"),
+    "chatbot_messages": ("created_at", "month"),
+    "smart_attendance_logs": ("created_at", "month"),
+    "webhook_logs": ("created_at", "month"),
+}
+
+# Future partitions created ahead of the current one
+PARTITION_PREMAKE = 4
+
+_SUFFIX_FORMATS = {"day": "%Y%m%d", "month": "%Y%m"}
+
+
+def partition_start(value: date, interval: str) -> date:
+    """Lower bound of the partition that contains ``value``."""
+    if interval == "day":
+        return value
+    if interval == "month":
+        return value.replace(day=1)
+    raise ValueError(f"Unsupported partition interval: {interval}")
+
+
+def next_partition_start(start: date, interval: str) -> date:
+    """Lower bound of the partition following the one starting at ``start``."""
+    if interval == "day":
+        return start + timedelta(days=1)
+    if interval == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    raise ValueError(f"Unsupported partition interval: {interval}")
+
+
+def partition_name(table: str, start: date, interval: str) -> str:
+    """Child table name for the partition of ``table`` starting at ``start``."""
+    return f"{table}_p{start.strftime(_SUFFIX_FORMATS[interval])}"
+
+
+def create_partition_statements(table: str, first: date, last: date, interval: str) -> List[str]:
+    """SQL creating the partitions of ``table`` covering ``first`` through ``last``."""
+    statements = []
+    start = partition_start(first, interval)
+    while start <= last:
+        end = next_partition_start(start, interval)
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(table, start, interval)} "
+            f"PARTITION OF {table} "
+            f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+        )
+        start = end
+    return statements
+
+
+def premake_starts(interval: str, since: date | None = None) -> List[date]:
+    """Partition lower bounds from ``since`` (default today) up to the premake horizon."""
+    today = datetime.now(timezone.utc).date()
+    start = partition_start(since or today, interval)
+    last = today
+    for _ in range(PARTITION_PREMAKE):
+        last = next_partition_start(partition_start(last, interval), interval)
+    starts = []
+    while start <= last:
+        starts.append(start)
+        start = next_partition_start(start, interval)
+    return starts
+
+
+def default_partition_name(table: str) -> str:
+    """Name of the DEFAULT partition of ``table``."""
+    return f"{table}_default"
+
+
+def default_partition_statement(table: str) -> str:
+    """SQL creating the DEFAULT partition of ``table`` if missing."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {default_partition_name(table)} "
+        f"PARTITION OF {table} DEFAULT"
+    )
+
+
+def attach_partition_statements(table: str, start: date, columns: Sequence[str]) -> List[str]:
+    """SQL adding the partition of ``table`` starting at ``start``.
+
+    PostgreSQL refuses a new range partition while the DEFAULT partition holds
+    rows in its range, so the child is created detached, those rows are moved
+    into it and it is attached (which creates the parent's indexes on it).
+    ``columns`` are the table's non-generated columns: generated ones (e.g.
+    ``messages.participants``) are recomputed on insert.
+    """
+    column, interval = PARTITIONED_TABLES[table]
+    name = partition_name(table, start, interval)
+    lower = f"'{start.isoformat()} 00:00:00+00'"
+    upper = f"'{next_partition_start(start, interval).isoformat()} 00:00:00+00'"
+    column_list = ", ".join(columns)
+    return [
+        f"CREATE TABLE {name} "
+        f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)",
+        f"WITH moved AS (DELETE FROM {default_partition_name(table)} "
+        f"WHERE {column} >= {lower} AND {column} < {upper} RETURNING *) "
+        f"INSERT INTO {name} ({column_list}) SELECT {column_list} FROM moved",
+        f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ({lower}) TO ({upper})",
+    ]
+
+
+def _insertable_columns(connection: Connection, table: str) -> List[str]:
+    return connection.execute(
+        text(
+            "SELECT attname FROM pg_attribute "
+            "WHERE attrelid = CAST(:table AS regclass) AND attnum > 0 "
+            "AND NOT attisdropped AND attgenerated = '' "
+            "ORDER BY attnum"
+        ),
+        {"table": table},
+    ).scalars().all()
+
+
+def _child_partitions(connection: Connection, table: str) -> List[str]:
+    return connection.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ),
+        {"table": table},
+    ).scalars().all()
+
+
+def _maintain_table(connection: Connection, table: str, interval: str) -> None:
+    connection.execute(text(default_partition_statement(table)))
+    existing = set(_child_partitions(connection, table))
+    missing = [
+        start
+        for start in premake_starts(interval)
+        if partition_name(table, start, interval) not in existing
+    ]
+    if not missing:
+        return
+    columns = _insertable_columns(connection, table)
+    for start in missing:
+        for statement in attach_partition_statements(table, start, columns):
+            connection.execute(text(statement))
+
+
+def maintain_partitions(connection: Connection) -> None:
+    """Create the DEFAULT and upcoming partitions of every table in ``PARTITIONED_TABLES``.
+
+    Each table runs in its own savepoint, so a failure on one table is logged
+    and does not stop the others.
+    """
+    # App workers run this job concurrently; one at a time creates partitions
+    connection.execute(text("SELECT pg_advisory_xact_lock(hashtext('maintain_partitions'))"))
+    for table, (_, interval) in PARTITIONED_TABLES.items():
+        try:
+            with connection.begin_nested():
+                _maintain_table(connection, table, interval)
+        except Exception:
+            logger.exception("Partition maintenance failed for %s", table)
+
+
+def drop_partitions_before(connection: Connection, table: str, cutoff: datetime) -> List[str]:
+    """Detach and drop partitions of ``table`` whose whole range is older than ``cutoff``.
+
+    Rows older than ``cutoff`` in the partition that straddles it are left for
+    the caller to DELETE (the planner prunes that DELETE to one partition).
+    """
+    _, interval = PARTITIONED_TABLES[table]
+    children = _child_partitions(connection, table)
+
+    prefix = f"{table}_p"
+    cutoff_date = cutoff.astimezone(timezone.utc).date() if cutoff.tzinfo else cutoff.date()
+    dropped = []
+    for name in children:
+        if not name.startswith(prefix):
+            continue
+        try:
+            start = datetime.strptime(name[len(prefix) :], _SUFFIX_FORMATS[interval]).date()
+        except ValueError:
+            continue
+        if next_partition_start(start, interval) <= cutoff_date:
+            connection.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            connection.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    return dropped
@@ -0,0 +1,96 @@
+"""Create-or-update of user accounts and their role profiles for seed scripts.
+
+Seed records are dicts keyed by ``email`` and ``username`` plus whatever the
+profile builder reads. ``upsert_with_user`` looks up existing accounts and
+profiles with one IN query each, adds the missing users in one flush, inserts
+the missing profiles with one Core ``INSERT ... RETURNING`` and refreshes the
+existing ones with one executemany UPDATE by primary key.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Type
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+
+
+@dataclass(slots=True, frozen=True)
+class SeededProfiles:
+    """Outcome of ``upsert_with_user``; ``users`` and ``profile_ids`` follow the record order."""
+
+    users: List[User]
+    profile_ids: List[int]
+    users_created: int
+    profiles_created: int
+    profiles_updated: int
+
+
+def upsert_with_user(
+    db: Session,
+    model: Type,
+    records: Sequence[Dict[str, Any]],
+    *,
+    role: str,
+    password_hash: str,
+    profile_row: Callable[[Dict[str, Any], User], Dict[str, Any]],
+    update_keys: Iterable[str] = (),
+) -> SeededProfiles:
+    """Ensure every record has a ``User`` with ``role`` and a ``model`` profile row.
+
+    ``profile_row(record, user)`` returns the profile's column values; new
+    profiles are inserted with all of them, existing ones only get the
+    ``update_keys`` columns rewritten (none by default). Existing users are
+    left untouched. The caller commits.
+    """
+    users_by_email = {
+        u.email: u for u in db.query(User).filter(User.email.in_([r["email"] for r in records]))
+    }
+    new_users = [
+        User(
+            username=record["username"],
+            email=record["email"],
+            password_hash=password_hash,
+            role=role,
+            is_active=True,
+        )
+        for record in records
+        if record["email"] not in users_by_email
+    ]
+    # One flush inserts the new users together and assigns their ids
+    db.add_all(new_users)
+    db.flush()
+    users_by_email.update((user.email, user) for user in new_users)
+    users = [users_by_email[record["email"]] for record in records]
+
+    profile_ids = dict(
+        db.query(model.user_id, model.id).filter(model.user_id.in_([u.id for u in users])).all()
+    )
+    update_keys = tuple(update_keys)
+    updates = []
+    new_profiles = []
+    for record, user in zip(records, users):
+        if user.id in profile_ids:
+            if update_keys:
+                row = profile_row(record, user)
+                values = {key: row[key] for key in update_keys}
+                values["id"] = profile_ids[user.id]
+                updates.append(values)
+        else:
+            new_profiles.append(profile_row(record, user))
+
+    if updates:
+        db.execute(update(model), updates)
+    existing = len(profile_ids)
+    if new_profiles:
+        statement = insert(model).returning(model.user_id, model.id)
+        profile_ids.update(db.execute(statement, new_profiles).tuples().all())
+
+    return SeededProfiles(
+        users=users,
+        profile_ids=[profile_ids[user.id] for user in users],
+        users_created=len(new_users),
+        profiles_created=len(new_profiles),
+        profiles_updated=existing if update_keys else 0,
+    )
@@ -1,12 +1,29 @@
-from typing import Generator
+from typing import Any, Generator
 
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
 
 settings = get_settings()
-engine = create_engine(settings.database_url, future=True)
+
+
+def _json_serializer(value: Any) -> str:
+	# Non-str keys are accepted to match stdlib json.dumps behaviour
+	return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+engine = create_engine(
+	settings.database_url,
+	future=True,
+	pool_size=settings.db_pool_size,
+	max_overflow=settings.db_max_overflow,
+	pool_pre_ping=True,
+	pool_recycle=settings.db_pool_recycle,
+	json_serializer=_json_serializer,
+	json_deserializer=orjson.loads,
+)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
 
@@ -0,0 +1,53 @@
+"""Custom column types."""
+
+from typing import Any, Optional
+
+from sqlalchemy import Integer, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+BASIS_POINTS = 10_000
+
+
+class BasisPoints(TypeDecorator):
+    """A 0..1 ratio stored as SMALLINT basis points (0..10000).
+
+    The ORM reads and writes plain floats; the column is 2 bytes on disk
+    instead of a variable-length NUMERIC or an 8-byte double.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return round(float(value) * BASIS_POINTS)
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[float]:
+        if value is None:
+            return None
+        return value / BASIS_POINTS
+
+
+MICRODEGREES = 1_000_000
+
+
+class Microdegrees(TypeDecorator):
+    """A GPS latitude or longitude stored as INTEGER microdegrees (degrees * 1e6).
+
+    One microdegree is about 11 cm, well below GPS accuracy. The ORM reads and
+    writes float degrees; the column is 4 bytes instead of a NUMERIC(11, 8).
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return round(float(value) * MICRODEGREES)
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[float]:
+        if value is None:
+            return None
+        return value / MICRODEGREES
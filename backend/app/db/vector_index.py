@@ -0,0 +1,55 @@
+"""HNSW index tuning for facial_embeddings.embedding.
+
+HNSW build/search parameters depend on how many embeddings are indexed: small
+tables get a cheap graph with good recall, large ones need more neighbours per
+node and a wider search to keep recall up. The index is (re)built with
+parameters picked from the current row count, and ``hnsw.ef_search`` is set as
+the database default so every face matching query picks it up.
+"""
+
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+HNSW_INDEX_NAME = "ix_embeddings_embedding_hnsw"
+HNSW_OPCLASS = "halfvec_cosine_ops"
+
+
+def configure_hnsw_params(n: int) -> Dict[str, int]:
+    """Pick HNSW m / ef_construction / ef_search for ``n`` embeddings."""
+    if n < 100_000:
+        return {"m": 16, "ef_construction": 64, "ef_search": 40}
+    if n < 1_000_000:
+        return {"m": 24, "ef_construction": 100, "ef_search": 100}
+    return {"m": 32, "ef_construction": 128, "ef_search": 200}
+
+
+def hnsw_rebuild_statements(n: int, opclass: str = HNSW_OPCLASS) -> List[str]:
+    """SQL to rebuild the HNSW index for ``n`` rows (run outside a transaction)."""
+    params = configure_hnsw_params(n)
+    return [
+        f"DROP INDEX CONCURRENTLY IF EXISTS {HNSW_INDEX_NAME}",
+        (
+            f"CREATE INDEX CONCURRENTLY {HNSW_INDEX_NAME} ON facial_embeddings "
+            f"USING hnsw (embedding {opclass}) "
+            f"WITH (m = {params['m']}, ef_construction = {params['ef_construction']})"
+        ),
+        (
+            "DO $$ BEGIN EXECUTE format('ALTER DATABASE %I SET hnsw.ef_search = %s', "
+            f"current_database(), {params['ef_search']}); END $$"
+        ),
+    ]
+
+
+def rebuild_hnsw_index(connection: Connection) -> Dict[str, int]:
+    """Rebuild the HNSW index sized to the current embedding count.
+
+    ``connection`` must be in autocommit mode (CREATE INDEX CONCURRENTLY).
+    """
+    n = connection.execute(text("SELECT COUNT(*) FROM facial_embeddings")).scalar() or 0
+    connection.execute(text("SET maintenance_work_mem = '2GB'"))
+    for statement in hnsw_rebuild_statements(n):
+        connection.execute(text(statement))
+    connection.execute(text("RESET maintenance_work_mem"))
+    return configure_hnsw_params(n)
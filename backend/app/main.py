@@ -1,4 +1,6 @@
+import asyncio
 import os
+import sys
 import time
 from datetime import datetime
 from pathlib import Path
@@ -7,16 +9,21 @@ from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.router import api_router
 from app.core.audit_middleware import AuditMiddleware
 from app.core.config import get_settings
-from app.core.logging_config import get_logger, setup_logging
+from app.core.logging_config import flush_logging, get_logger, setup_logging, stop_logging
 from app.core.monitoring import RequestMetric, health_status, metrics_collector
+from app.db.partitioning import maintain_partitions
+from app.db.session import SessionLocal, engine
+from app.services.attendance import AttendanceService
+from app.services.student_counters import flush_student_counters
+from app.utils.deps import JSON_BODY_COMPONENTS
 from app.utils.scheduler import scheduler
+from app.utils.static_files import CachedStaticFiles
 
 # Setup comprehensive logging
 setup_logging(log_level="INFO", include_console=True, include_file=True, json_output=True)
@@ -31,8 +38,25 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson encodes responses several times faster than the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
+_default_openapi = app.openapi
+
+
+def _openapi() -> dict:
+    # Bodies read through json_body are documented with openapi_extra; the models
+    # they reference are added to the components FastAPI generated
+    schema = _default_openapi()
+    components = schema.setdefault("components", {}).setdefault("schemas", {})
+    for name, definition in JSON_BODY_COMPONENTS.items():
+        components.setdefault(name, definition)
+    return schema
+
+
+app.openapi = _openapi
+
 # Response compression for bandwidth savings
 app.add_middleware(GZipMiddleware, minimum_size=500)
 
@@ -48,39 +72,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files for face images
+# Mount static files for face images (small files are served from memory)
 storage_dir = Path(os.getenv("FACE_STORAGE_DIR", "/app/storage"))
 storage_dir.mkdir(parents=True, exist_ok=True)
-app.mount("/storage", StaticFiles(directory=str(storage_dir)), name="storage")
+app.mount("/storage", CachedStaticFiles(directory=str(storage_dir)), name="storage")
 
 
 # Request logging middleware with metrics
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all incoming requests and measure response time with metrics"""
-    start_time = time.time()
+    start_ns = time.time_ns()
+    path = request.scope["path"]
+    method = request.scope["method"]
 
     # Log request
-    logger.info(f"Request: {request.method} {request.url.path}")
+    logger.info(f"Request: {method} {path}")
 
     # Process request
     response = await call_next(request)
 
     # Calculate duration
-    duration = time.time() - start_time
-    duration_ms = duration * 1000
+    duration_ms = (time.time_ns() - start_ns) / 1_000_000
 
     # Log response
     logger.info(
-        f"Response: {request.method} {request.url.path} "
+        f"Response: {method} {path} "
         f"Status: {response.status_code} Duration: {duration_ms:.1f}ms"
     )
 
-    # Record metrics
+    # Record metrics, grouped by route template (e.g. /api/students/{student_id})
+    route = request.scope.get("route")
     metric = RequestMetric(
-        timestamp=datetime.utcnow().isoformat(),
-        endpoint=request.url.path,
-        method=request.method,
+        timestamp_ns=start_ns,
+        endpoint=sys.intern(getattr(route, "path", path)),
+        method=method,
         status_code=response.status_code,
         duration_ms=duration_ms,
         user_id=None,  # Can be extracted from request context if available
@@ -158,7 +184,7 @@ app.include_router(api_router, prefix="/api")
 @app.get("/health", tags=["Health"])
 async def health_check() -> dict:
     """Detailed health check endpoint"""
-    health_status.last_check = datetime.utcnow()
+    health_status.mark_checked()
     return health_status.to_dict()
 
 
@@ -214,18 +240,67 @@ async def root() -> dict:
     }
 
 
+async def _start_event_subscribers() -> None:
+    """Subscribe event bus handlers; /health reports degraded until done"""
+    from app.core.event_subscribers import initialize_event_subscribers
+
+    try:
+        await initialize_event_subscribers()
+    except Exception:
+        logger.exception("Failed to initialize event bus subscribers")
+        return
+    health_status.event_subscribers_ready = True
+    logger.info("Event bus subscribers initialized")
+
+
+def _maintain_partitions() -> None:
+    """Premake upcoming partitions of time-partitioned tables"""
+    with engine.begin() as connection:
+        maintain_partitions(connection)
+
+
+def _refresh_attendance_summary() -> None:
+    """Refresh the per-day attendance summary view"""
+    db = SessionLocal()
+    try:
+        AttendanceService.refresh_attendance_summary(db)
+    finally:
+        db.close()
+
+
+def _flush_student_counters() -> None:
+    """Fold Redis-buffered student counters into the students table"""
+    db = SessionLocal()
+    try:
+        flush_student_counters(db)
+    finally:
+        db.close()
+
+
 @app.on_event("startup")
 async def on_startup():
     logger.info("Starting scheduler for recurring tasks")
+    scheduler.schedule("flush_log_buffers", 1, flush_logging)
+    scheduler.schedule("maintain_partitions", 3600, _maintain_partitions)
+    scheduler.schedule("refresh_attendance_summary", 300, _refresh_attendance_summary)
+    scheduler.schedule("flush_student_counters", 60, _flush_student_counters)
     scheduler.start()
-    
-    # Initialize event subscribers
-    from app.core.event_subscribers import initialize_event_subscribers
-    await initialize_event_subscribers()
-    logger.info("Event bus subscribers initialized")
+
+    # Initialize event subscribers in the background so startup isn't blocked
+    health_status.event_subscribers_ready = False
+    app.state.subscribers_task = asyncio.create_task(_start_event_subscribers())
 
 
 @app.on_event("shutdown")
 async def on_shutdown():
+    subscribers_task = getattr(app.state, "subscribers_task", None)
+    if subscribers_task is not None and not subscribers_task.done():
+        try:
+            await asyncio.wait_for(subscribers_task, timeout=2)
+        except asyncio.TimeoutError:
+            logger.warning("Event subscriber initialization did not finish before shutdown")
+
     logger.info("Stopping scheduler")
     scheduler.stop()
+    metrics_collector.flush(timeout=2)
+    stop_logging()
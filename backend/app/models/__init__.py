@@ -1,13 +1,29 @@
-from app.models.attendance import AttendanceRecord
+"""SQLAlchemy models.
+
+Importing this package registers every model with ``Base.metadata`` exactly
+once; Alembic and the app both rely on it instead of importing model modules
+piecemeal.
+"""
+from app.models.absence import Absence, PDFAbsence
+from app.models.admin_message import (
+    AdminMessage,
+    AdminMessageAttachment,
+    AdminMessageClass,
+    AdminMessageTrainer,
+)
+from app.models.attendance import AttendanceRecord, StudentAttendanceAggregate
 from app.models.audit_log import AuditLog
 from app.models.chatbot import ChatbotConversation, ChatbotMessage
 from app.models.controle import Controle
-from app.models.feedback import StudentFeedback
+from app.models.facial_embedding import FacialEmbedding
 from app.models.facial_verification_log import FacialVerificationLog
-from app.models.message import Message, MessageThread
+from app.models.feedback import StudentFeedback
+from app.models.message import Message
 from app.models.notification import Notification
 from app.models.notification_preferences import NotificationPreferences
+from app.models.school_class import SchoolClass
 from app.models.session import Session
+from app.models.session_request import SessionRequest
 from app.models.smart_attendance import (
     AttendanceAlert,
     AttendanceSession,
@@ -19,14 +35,20 @@ from app.models.smart_attendance import (
 from app.models.student import Student
 from app.models.trainer import Trainer
 from app.models.user import User
+from app.models.user_agent import UserAgent
 from app.models.webhook import Webhook, WebhookLog
 
 __all__ = [
     "User",
     "Student",
+    "SchoolClass",
     "Trainer",
     "Session",
+    "SessionRequest",
     "AttendanceRecord",
+    "StudentAttendanceAggregate",
+    "Absence",
+    "PDFAbsence",
     "Controle",
     "Notification",
     "NotificationPreferences",
@@ -40,9 +62,14 @@ __all__ = [
     "FraudDetection",
     "SmartAttendanceLog",
     "AuditLog",
+    "UserAgent",
     "Webhook",
     "WebhookLog",
-    "MessageThread",
     "Message",
+    "FacialEmbedding",
     "FacialVerificationLog",
+    "AdminMessage",
+    "AdminMessageAttachment",
+    "AdminMessageTrainer",
+    "AdminMessageClass",
 ]
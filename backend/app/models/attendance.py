@@ -1,7 +1,23 @@
-from sqlalchemy import JSON, Boolean, Column, DateTime, Index, Integer, Numeric, String, Time, UniqueConstraint
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Time,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.types import BasisPoints
 
 
 class AttendanceRecord(Base):
@@ -13,20 +29,28 @@ class AttendanceRecord(Base):
         Index("ix_attendance_status_marked", "status", "marked_at"),
         Index("ix_attendance_marked_at", "marked_at"),
         Index("ix_attendance_student", "student_id"),
-        Index("ix_attendance_session", "session_id"),
+        # Session roster lookups ("present students in session X"); the
+        # (session_id, student_id) index already serves plain session_id lookups
+        Index(
+            "ix_attendance_session_status_active",
+            "session_id",
+            "status",
+            postgresql_where=text("is_deleted = false"),
+        ),
     )
 
-    id = Column(Integer, primary_key=True, index=True)
+    # BIGINT in Postgres (highest-cardinality table); SQLite needs INTEGER for rowid autoincrement
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, index=True)
     session_id = Column(Integer, nullable=False)
     student_id = Column(Integer, nullable=False)
     status = Column(String(20), nullable=False)
     marked_via = Column(String(20), default="manual")
-    facial_confidence = Column(Numeric(5, 4))
+    facial_confidence = Column(BasisPoints)
     verification_photo_path = Column(String(255))
     marked_at = Column(DateTime, server_default=func.now())
     actual_arrival_time = Column(Time)
-    late_minutes = Column(Integer, default=0)
-    percentage = Column(Numeric(5, 2), default=0.00)
+    late_minutes = Column(SmallInteger, default=0)
+    percentage = Column(Float, default=0.0)
     justification = Column(String)
     device_id = Column(String(100))
     ip_address = Column(String(45))
@@ -35,5 +59,25 @@ class AttendanceRecord(Base):
     is_deleted = Column(Boolean, default=False, server_default="false")
 
 
+class StudentAttendanceAggregate(Base):
+    """Per-student, per-day status counts (materialized view, read-only).
+
+    Refreshed periodically by ``AttendanceService.refresh_attendance_summary``,
+    so it lags live attendance by up to one refresh interval.
+    """
+
+    __tablename__ = "attendance_summary_mv"
+    # Created by migration; excluded from autogenerate (alembic/env.py)
+    __table_args__ = {"info": {"is_view": True}}
+
+    student_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    total_sessions = Column(Integer, nullable=False)
+    present = Column(Integer, nullable=False)
+    absent = Column(Integer, nullable=False)
+    late = Column(Integer, nullable=False)
+    excused = Column(Integer, nullable=False)
+
+
 # Backward-compatible alias
 Attendance = AttendanceRecord
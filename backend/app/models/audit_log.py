@@ -2,11 +2,14 @@
 Audit Log Model - Track all admin and trainer actions for GDPR compliance
 """
 
-from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.sql import func
 
 from app.db.base import Base
 
+UserRole = ENUM("admin", "trainer", "student", name="user_role_enum")
+
 
 class AuditLog(Base):
     """Comprehensive audit logging for all sensitive operations."""
@@ -15,15 +18,38 @@ class AuditLog(Base):
     
     __table_args__ = (
         Index("ix_audit_user_action", "user_id", "action_type"),
-        Index("ix_audit_timestamp", "timestamp"),
+        # Rows arrive in timestamp order, so a BRIN index serves range scans
+        # at a fraction of a B-tree's size
+        Index(
+            "ix_audit_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("ix_audit_resource", "resource_type", "resource_id"),
+        Index(
+            "ix_audit_meta_gin",
+            "meta",
+            postgresql_using="gin",
+            postgresql_ops={"meta": "jsonb_path_ops"},
+        ),
+        # Trigram index for ILIKE '%term%' searches (pg_trgm)
+        Index(
+            "ix_audit_desc_trgm",
+            "action_description",
+            postgresql_using="gin",
+            postgresql_ops={"action_description": "gin_trgm_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
     )
     
-    id = Column(Integer, primary_key=True, index=True)
+    # Partitioned by day on timestamp (app.db.partitioning), so the partition
+    # key is part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     
     # Who performed the action
     user_id = Column(Integer, nullable=False)
-    user_role = Column(String(20))  # admin, trainer, student
+    user_role = Column(UserRole)
     user_email = Column(String(255))
     
     # What action was performed
@@ -36,23 +62,25 @@ class AuditLog(Base):
     
     # Request details
     ip_address = Column(String(45))
-    user_agent = Column(String(512))
+    user_agent_id = Column(Integer, ForeignKey("user_agents.id"))
     request_method = Column(String(10))
     request_path = Column(String(512))
     
     # Changes (for update/delete actions)
-    old_values = Column(JSON)
-    new_values = Column(JSON)
+    old_values = Column(JSONB)
+    new_values = Column(JSONB)
     
     # Additional metadata
-    meta = Column(JSON)
+    meta = Column(JSONB)
     
     # Status
-    success = Column(String(20), default="success")  # success, failed, unauthorized
+    success = Column(Boolean, nullable=False, server_default="true")
     error_message = Column(Text)
     
     # Timestamp
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    timestamp = Column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False
+    )
     
     # GDPR retention (auto-delete after X days)
     retention_days = Column(Integer, default=365)
@@ -1,4 +1,5 @@
-from sqlalchemy import JSON, Boolean, Column, DateTime, Index, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -9,38 +10,61 @@ class ChatbotConversation(Base):
 
     __table_args__ = (
         Index("ix_chatbot_conversation_user", "user_id", "user_type"),
-        Index("ix_chatbot_conversation_activity", "is_active", "last_activity"),
+        Index(
+            "ix_chatbot_conversation_active",
+            "last_activity",
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "ix_chatbot_conversation_context_gin",
+            "context_data",
+            postgresql_using="gin",
+            postgresql_ops={"context_data": "jsonb_path_ops"},
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False)
     user_type = Column(String(20), nullable=False)
-    session_id = Column(String(100), unique=True)
-    context_data = Column(JSON)
-    conversation_history = Column(JSON)
-    started_at = Column(DateTime, server_default=func.now())
-    last_activity = Column(DateTime, server_default=func.now())
+    session_id = Column(UUID(as_uuid=True), unique=True, server_default=text("gen_random_uuid()"))
+    context_data = Column(JSONB)
+    conversation_history = Column(JSONB)
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_activity = Column(DateTime(timezone=True), server_default=func.now())
     is_active = Column(Boolean, default=True)
     message_count = Column(Integer, default=0)
     user_satisfaction_score = Column(Integer)
-    feedback_text = Column(String)
-    created_at = Column(DateTime, server_default=func.now())
+    feedback_text = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
 class ChatbotMessage(Base):
     __tablename__ = "chatbot_messages"
 
-    __table_args__ = (Index("ix_chatbot_message_conversation", "conversation_id"),)
+    __table_args__ = (
+        Index("ix_chatbot_message_conversation", "conversation_id"),
+        # Trigram index for ILIKE '%term%' searches (pg_trgm)
+        Index(
+            "ix_chatbot_messages_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    # Partitioned by month on created_at (app.db.partitioning), so the
+    # partition key is part of the primary key. It stays a naive timestamp:
+    # PostgreSQL cannot change the type of a partition key column in place.
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     conversation_id = Column(Integer, nullable=False)
     message_type = Column(String(20), nullable=False)
     content = Column(String, nullable=False)
     intent_detected = Column(String(100))
-    confidence_score = Column(String)
-    entities_extracted = Column(JSON)
+    confidence_score = Column(Float)
+    entities_extracted = Column(JSONB)
     response_time_ms = Column(Integer)
     tokens_used = Column(Integer)
     model_used = Column(String(50))
     helpful_score = Column(Integer)
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(DateTime, primary_key=True, server_default=func.now(), nullable=False)
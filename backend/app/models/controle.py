@@ -1,10 +1,9 @@
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, String
-from sqlalchemy.sql import func
+from sqlalchemy import Boolean, Column, Date, ForeignKey, Index, Integer, String
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin
 
 
-class Controle(Base):
+class Controle(TimestampMixin, Base):
     """Controle/Test model for tracking exams and tests."""
     
     __tablename__ = "controles"
@@ -13,6 +12,7 @@ class Controle(Base):
         Index("ix_controles_class_date", "class_name", "date"),
         Index("ix_controles_module", "module"),
         Index("ix_controles_notified", "notified", "date"),
+        Index("ix_controles_trainer", "trainer_id"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -27,6 +27,4 @@ class Controle(Base):
     duration_minutes = Column(Integer)
     trainer_id = Column(Integer, ForeignKey("trainers.id", ondelete="SET NULL"))
     
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     is_deleted = Column(Boolean, default=False, server_default="false")
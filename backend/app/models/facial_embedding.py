@@ -1,5 +1,5 @@
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import Boolean, Column, Index, Integer, Numeric, String
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import Boolean, Column, Index, Integer, LargeBinary, Numeric, String, text
 from sqlalchemy.dialects.postgresql import VARCHAR
 
 from app.db.base import Base
@@ -10,8 +10,22 @@ class FacialEmbedding(Base):
 
     __table_args__ = (
         Index("ix_embeddings_student", "student_id"),
+        Index(
+            "ix_embeddings_student_primary",
+            "student_id",
+            postgresql_where=text("is_primary = true"),
+        ),
         Index("ix_embeddings_user", "user_id"),
         Index("ix_embeddings_image_hash", "image_hash"),
+        # ANN index for cosine-distance (<=>) face matching; build parameters are
+        # re-tuned to the row count with `python -m app.scripts.rebuild_hnsw_index`
+        Index(
+            "ix_embeddings_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+            postgresql_with={"m": 16, "ef_construction": 64},
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -19,11 +33,13 @@ class FacialEmbedding(Base):
     user_id = Column(Integer, nullable=True)
     # Store vector in pgvector column via raw SQL; ORM keeps path and meta
     image_path = Column(String(255), nullable=False)
-    image_hash = Column(String(64))
+    image_hash = Column(LargeBinary(32))  # raw SHA-256 digest
     confidence_score = Column(Numeric(5, 4))
     embedding_model = Column(VARCHAR(50), default="insightface")
     is_primary = Column(Boolean, default=False)
     capture_angle = Column(VARCHAR(20))
     lighting_conditions = Column(VARCHAR(50))
 
-    embedding = Column(Vector(512), nullable=True)
+    # FP16 storage: half the bytes of vector(512) with negligible recall loss
+    embedding = Column(HALFVEC(512), nullable=True)
+
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -8,13 +8,18 @@ class FacialVerificationLog(Base):
     __tablename__ = "facial_verification_logs"
 
     __table_args__ = (
-        Index("ix_facial_verification_logs_created_at", "created_at"),
+        Index(
+            "ix_facial_verification_logs_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("ix_facial_verification_logs_user_id", "user_id"),
         Index("ix_facial_verification_logs_attempted_email", "attempted_email"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     user_id = Column(Integer, nullable=True)
     attempted_email = Column(String(255), nullable=True)
@@ -29,4 +34,4 @@ class FacialVerificationLog(Base):
     brightness = Column(Float, nullable=True)
 
     ip_address = Column(String(45), nullable=True)
-    user_agent = Column(String(512), nullable=True)
+    user_agent_id = Column(Integer, ForeignKey("user_agents.id"), nullable=True)
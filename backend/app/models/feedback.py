@@ -1,15 +1,18 @@
-from sqlalchemy import Column, DateTime, Index, Integer, String, Text
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Index, Integer, String, Text, text
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin
 
 
-class StudentFeedback(Base):
+class StudentFeedback(TimestampMixin, Base):
     __tablename__ = "student_feedbacks"
 
     __table_args__ = (
         Index("ix_student_feedbacks_student_created", "student_id", "created_at"),
-        Index("ix_student_feedbacks_status", "status"),
+        Index(
+            "ix_student_feedbacks_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -18,5 +21,3 @@ class StudentFeedback(Base):
     message = Column(Text, nullable=False)
     status = Column(String(20), nullable=False, server_default="pending")  # pending, reviewed, resolved
     response = Column(Text)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
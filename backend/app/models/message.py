@@ -1,34 +1,51 @@
-from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text
+from sqlalchemy import Boolean, Column, Computed, DateTime, Index, Integer, String, Text, text
 from sqlalchemy.sql import func
 
 from app.db.base import Base
 
 
-class MessageThread(Base):
-    __tablename__ = "message_threads"
-
-    __table_args__ = (
-        Index("ix_message_threads_users", "user1_id", "user2_id"),
-    )
-
-    id = Column(Integer, primary_key=True, index=True)
-    user1_id = Column(Integer, nullable=False, index=True)
-    user2_id = Column(Integer, nullable=False, index=True)
-    created_at = Column(DateTime, server_default=func.now())
+def participants_key(user_a: int, user_b: int) -> str:
+    """Conversation key for two users, as computed by ``Message.participants``."""
+    return f"{min(user_a, user_b)}-{max(user_a, user_b)}"
 
 
 class Message(Base):
     __tablename__ = "messages"
 
     __table_args__ = (
-        Index("ix_messages_thread_created", "thread_id", "created_at"),
-        Index("ix_messages_recipient_read", "recipient_id", "read"),
+        Index("ix_messages_participants_created", "participants", "created_at"),
+        # Covering index over unread messages only, for index-only unread counts
+        Index(
+            "ix_messages_recipient_unread_cov",
+            "recipient_id",
+            "sender_id",
+            postgresql_include=["created_at"],
+            postgresql_where=text("read = false"),
+        ),
+        # Trigram index for ILIKE '%term%' searches (pg_trgm)
+        Index(
+            "ix_messages_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
-    id = Column(Integer, primary_key=True, index=True)
-    thread_id = Column(Integer, nullable=False, index=True)
+    # Partitioned by month on created_at (app.db.partitioning), so the
+    # partition key is part of the primary key. It stays a naive timestamp:
+    # PostgreSQL cannot change the type of a partition key column in place.
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     sender_id = Column(Integer, nullable=False, index=True)
     recipient_id = Column(Integer, nullable=False, index=True)
+    # Conversation key "<lower user id>-<higher user id>" (see participants_key)
+    participants = Column(
+        String(32),
+        Computed(
+            "LEAST(sender_id, recipient_id)::text || '-' || GREATEST(sender_id, recipient_id)::text",
+            persisted=True,
+        ),
+    )
     content = Column(Text, nullable=False)
     read = Column(Boolean, nullable=False, server_default="false")
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(DateTime, primary_key=True, server_default=func.now(), nullable=False)
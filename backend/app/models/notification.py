@@ -1,16 +1,33 @@
-from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.sql import func
 
 from app.db.base import Base
 
+NotificationPriority = ENUM("low", "medium", "high", "critical", name="notification_priority_enum")
+DeliveryStatus = ENUM("pending", "sent", "delivered", "failed", name="delivery_status_enum")
+
 
 class Notification(Base):
     __tablename__ = "notifications"
 
     __table_args__ = (
-        Index("ix_notifications_user_read", "user_id", "read"),
+        Index("ix_notifications_user_created", "user_id", "created_at"),
+        # Covering index over the unread inbox only, for index-only scans
+        Index(
+            "ix_notifications_user_unread_cov",
+            "user_id",
+            "created_at",
+            postgresql_include=["title", "notification_type", "priority"],
+            postgresql_where=text("read = false"),
+        ),
         Index("ix_notifications_type_priority", "notification_type", "priority"),
-        Index("ix_notifications_delivery_status", "delivery_status"),
+        Index(
+            "ix_notifications_pending",
+            "user_id",
+            "created_at",
+            postgresql_where=text("delivery_status = 'pending'"),
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -19,15 +36,15 @@ class Notification(Base):
     title = Column(String(200), nullable=False)
     message = Column(String, nullable=False)
     notification_type = Column(String(50), nullable=False)
-    priority = Column(String(20), default="medium")
+    priority = Column(NotificationPriority, default="medium")
     read = Column(Boolean, default=False)
-    read_at = Column(DateTime)
+    read_at = Column(DateTime(timezone=True))
     delivered = Column(Boolean, default=False)
     delivery_method = Column(String(20), default="in_app")
-    delivery_status = Column(String(20), default="pending")
+    delivery_status = Column(DeliveryStatus, default="pending")
     action_url = Column(String(255))
     action_label = Column(String(100))
     related_entity_type = Column(String(50))
     related_entity_id = Column(Integer)
-    created_at = Column(DateTime, server_default=func.now())
-    scheduled_for = Column(DateTime, server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    scheduled_for = Column(DateTime(timezone=True), server_default=func.now())
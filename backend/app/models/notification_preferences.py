@@ -1,19 +1,16 @@
-from sqlalchemy import Boolean, Column, DateTime, Index, Integer
-from sqlalchemy.sql import func
+from sqlalchemy import Boolean, Column, ForeignKey, Integer
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin
 
 
-class NotificationPreferences(Base):
+class NotificationPreferences(TimestampMixin, Base):
     __tablename__ = "notification_preferences"
 
-    __table_args__ = (
-        Index("ux_notification_preferences_user_id", "user_id", unique=True),
+    # One row per user: user_id is the key, so upserts can target it directly
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True, autoincrement=False
     )
 
-    id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, nullable=False)
-
     system = Column(Boolean, default=True, nullable=False)
     justification = Column(Boolean, default=True, nullable=False)
     schedule = Column(Boolean, default=True, nullable=False)
@@ -21,6 +18,3 @@ class NotificationPreferences(Base):
 
     email = Column(Boolean, default=True, nullable=False)
     push = Column(Boolean, default=False, nullable=False)
-
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, SmallInteger, String, text
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+
+
+class SchoolClass(Base):
+    """Class labels referenced by ``students.class_id`` (one row per distinct name)."""
+
+    __tablename__ = "classes"
+
+    # SQLite only autoincrements INTEGER PRIMARY KEY
+    id = Column(SmallInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    name = Column(String(50), nullable=False, unique=True)
+
+    @staticmethod
+    def id_for(db: Session, name: str) -> int:
+        """Return the ``classes.id`` for ``name``, inserting it if new."""
+        with db.no_autoflush:
+            class_id = db.execute(
+                text("INSERT INTO classes (name) VALUES (:name) ON CONFLICT (name) DO NOTHING RETURNING id"),
+                {"name": name},
+            ).scalar()
+            if class_id is None:
+                class_id = db.execute(text("SELECT id FROM classes WHERE name = :name"), {"name": name}).scalar_one()
+        return class_id
@@ -3,11 +3,26 @@
 These models are aligned with the current PostgreSQL schema created by init scripts/migrations.
 """
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.types import BasisPoints, Microdegrees
+
+Severity = ENUM("low", "medium", "high", "critical", name="severity_enum")
+CheckinStatus = ENUM("pending", "approved", "rejected", "flagged", name="checkin_status_enum")
 
 
 class AttendanceSession(Base):
@@ -28,8 +43,8 @@ class AttendanceSession(Base):
 
     checkin_window_minutes = Column(Integer, default=15)
     location_verification_enabled = Column(Boolean, default=False)
-    classroom_lat = Column(Numeric(10, 8))
-    classroom_lng = Column(Numeric(11, 8))
+    classroom_lat = Column(Microdegrees)
+    classroom_lng = Column(Microdegrees)
     allowed_radius_meters = Column(Integer, default=100)
 
     teams_meeting_id = Column(String(255))
@@ -43,8 +58,19 @@ class SelfCheckin(Base):
     __tablename__ = "self_checkins"
 
     __table_args__ = (
-        Index("ix_self_checkins_session_student", "attendance_session_id", "student_id"),
-        Index("ix_self_checkins_status", "status"),
+        # Covering: duplicate and status lookups are served by index-only scans
+        Index(
+            "ix_self_checkins_session_student",
+            "attendance_session_id",
+            "student_id",
+            postgresql_include=["status", "face_confidence", "liveness_passed"],
+        ),
+        # Partial: the review queue only reads pending check-ins
+        Index(
+            "ix_self_checkins_pending",
+            "attendance_session_id",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -53,19 +79,19 @@ class SelfCheckin(Base):
     )
     student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
 
-    face_confidence = Column(Numeric(3, 2))
+    face_confidence = Column(BasisPoints)
     liveness_passed = Column(Boolean, default=False)
     location_verified = Column(Boolean, default=True)
 
-    checkin_lat = Column(Numeric(10, 8))
-    checkin_lng = Column(Numeric(11, 8))
+    checkin_lat = Column(Microdegrees)
+    checkin_lng = Column(Microdegrees)
     distance_from_class_meters = Column(Integer)
 
     verification_photo_path = Column(String(512))
     device_id = Column(String(100))
     ip_address = Column(String(45))
 
-    status = Column(String(20), nullable=False)  # approved, rejected, flagged
+    status = Column(CheckinStatus, nullable=False)
     rejection_reason = Column(Text)
 
     created_at = Column(DateTime, server_default=func.now())
@@ -75,7 +101,12 @@ class TeamsParticipation(Base):
     __tablename__ = "teams_participation"
 
     __table_args__ = (
-        Index("ix_teams_participation_session_student", "attendance_session_id", "student_id"),
+        Index(
+            "ix_teams_participation_session_student",
+            "attendance_session_id",
+            "student_id",
+            postgresql_include=["presence_percentage", "engagement_score"],
+        ),
         Index("ix_teams_participation_meeting_participant", "teams_meeting_id", "teams_participant_id"),
     )
 
@@ -104,14 +135,37 @@ class AttendanceAlert(Base):
 
     __table_args__ = (
         Index("ix_attendance_alerts_student_severity", "student_id", "severity"),
-        Index("ix_attendance_alerts_acknowledged", "is_acknowledged"),
+        # Partial: dashboards only scan the unacknowledged working set
+        Index(
+            "ix_attendance_alerts_unacknowledged",
+            "created_at",
+            postgresql_where=text("is_acknowledged = false"),
+        ),
+        Index(
+            "ix_attendance_alerts_open",
+            "student_id",
+            "severity",
+            postgresql_where=text("is_acknowledged = false"),
+        ),
+        Index(
+            "ix_attendance_alerts_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_attendance_alerts_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     session_id = Column(Integer, ForeignKey("sessions.id", ondelete="CASCADE"))
     alert_type = Column(String(50), nullable=False)
-    severity = Column(String(20), nullable=False)
+    severity = Column(Severity, nullable=False)
     message = Column(Text, nullable=False)
     metadata_json = Column("metadata", JSONB)
     is_acknowledged = Column(Boolean, default=False)
@@ -126,7 +180,29 @@ class FraudDetection(Base):
 
     __table_args__ = (
         Index("ix_fraud_detections_student_severity", "student_id", "severity"),
-        Index("ix_fraud_detections_resolved", "is_resolved"),
+        Index(
+            "ix_fraud_detections_unresolved",
+            "created_at",
+            postgresql_where=text("is_resolved = false"),
+        ),
+        Index(
+            "ix_fraud_detections_open",
+            "severity",
+            "created_at",
+            postgresql_where=text("is_resolved = false"),
+        ),
+        Index(
+            "ix_fraud_detections_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_fraud_detections_evidence_gin",
+            "evidence",
+            postgresql_using="gin",
+            postgresql_ops={"evidence": "jsonb_path_ops"},
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -134,7 +210,7 @@ class FraudDetection(Base):
     session_id = Column(Integer, ForeignKey("sessions.id", ondelete="CASCADE"))
     checkin_id = Column(Integer, ForeignKey("self_checkins.id", ondelete="CASCADE"))
     fraud_type = Column(String(50), nullable=False)
-    severity = Column(String(20), nullable=False)
+    severity = Column(Severity, nullable=False)
     evidence = Column(JSONB)
     description = Column(Text, nullable=False)
     is_resolved = Column(Boolean, default=False)
@@ -149,12 +225,27 @@ class SmartAttendanceLog(Base):
 
     __table_args__ = (
         Index("ix_smart_attendance_logs_event_created", "event_type", "created_at"),
+        Index(
+            "ix_smart_attendance_logs_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_smart_attendance_logs_details_gin",
+            "details",
+            postgresql_using="gin",
+            postgresql_ops={"details": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
-    id = Column(Integer, primary_key=True, index=True)
+    # Partitioned by month on created_at (app.db.partitioning), so the
+    # partition key is part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     event_type = Column(String(50), nullable=False)
     user_id = Column(Integer)
     student_id = Column(Integer)
     session_id = Column(Integer)
     details = Column(JSONB)
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(DateTime, primary_key=True, server_default=func.now(), nullable=False)
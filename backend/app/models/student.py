@@ -1,15 +1,33 @@
-from sqlalchemy import Boolean, Column, Date, DateTime, Index, Integer, Numeric, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    Text,
+    event,
+    select,
+    text,
+)
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
+from sqlalchemy.orm import Session, object_session, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.models.school_class import SchoolClass
 
 
 class Student(Base):
     __tablename__ = "students"
 
     __table_args__ = (
-        Index("ix_students_class_status", "class", "academic_status"),
-        Index("ix_students_facial_flag", "facial_data_encoded"),
+        Index("ix_students_class_status", "class_id", "academic_status"),
+        Index("ix_students_needs_enrollment", "id", postgresql_where=text("facial_data_encoded = false")),
         Index("ix_students_alert_level", "alert_level", "alert_sent"),
     )
 
@@ -26,7 +44,9 @@ class Student(Base):
     parent_email = Column(String(100))
     parent_phone = Column(String(20))
     parent_relationship = Column(String(50))
-    class_name = Column("class", String(50), nullable=False)
+    # Dictionary-encoded class label; read and written through class_name
+    class_id = Column(SmallInteger, ForeignKey("classes.id"), nullable=False)
+    class_ = relationship(SchoolClass, lazy="joined", innerjoin=True)
     group_name = Column(String(50))
     enrollment_date = Column(Date)
     expected_graduation = Column(Date)
@@ -49,3 +69,65 @@ class Student(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     is_deleted = Column(Boolean, default=False, server_default="false")
+
+    @hybrid_property
+    def class_name(self) -> str | None:
+        pending = self.__dict__.get("_pending_class_name")
+        if pending is not None:
+            return pending
+        return self.class_.name if self.class_ is not None else None
+
+    @class_name.setter
+    def class_name(self, value: str) -> None:
+        # Resolved to class_id now if the student is in a session, otherwise
+        # when it is first flushed
+        self._pending_class_name = value
+        db = object_session(self)
+        if db is not None:
+            self.class_id = SchoolClass.id_for(db, value)
+
+    @class_name.comparator
+    def class_name(cls):
+        return _ClassNameComparator(cls)
+
+
+class _ClassNameComparator(Comparator):
+    """SQL side of ``Student.class_name``.
+
+    Filters compare ``class_id`` with the id looked up once for the name, so
+    they use the integer index. Selected as a column it is a correlated
+    subquery; bulk and grouped queries join ``SchoolClass`` instead.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        super().__init__(
+            select(SchoolClass.name)
+            .where(SchoolClass.id == cls.class_id)
+            .scalar_subquery()
+            .label("class_name")
+        )
+
+    def __eq__(self, other):
+        return self.cls.class_id == select(SchoolClass.id).where(SchoolClass.name == other).scalar_subquery()
+
+    def __ne__(self, other):
+        return self.cls.class_id != select(SchoolClass.id).where(SchoolClass.name == other).scalar_subquery()
+
+    def in_(self, other):
+        return self.cls.class_id.in_(select(SchoolClass.id).where(SchoolClass.name.in_(other)))
+
+
+@event.listens_for(Student, "refresh")
+def _drop_pending_class_name(target, context, attrs):
+    # Reloaded from the database: class_ is authoritative again
+    target.__dict__.pop("_pending_class_name", None)
+
+
+@event.listens_for(Session, "before_flush")
+def _resolve_pending_class_names(db, flush_context, instances):
+    for obj in db.new:
+        if isinstance(obj, Student) and obj.class_id is None:
+            pending = obj.__dict__.get("_pending_class_name")
+            if pending is not None:
+                obj.class_id = SchoolClass.id_for(db, pending)
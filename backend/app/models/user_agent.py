@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, LargeBinary, Text
+
+from app.db.base import Base
+
+
+class UserAgent(Base):
+    """Deduplicated User-Agent strings referenced by audit/verification logs."""
+
+    __tablename__ = "user_agents"
+
+    id = Column(Integer, primary_key=True)
+    # First 16 bytes of SHA-256 over the UTF-8 text (app.services.user_agent)
+    ua_hash = Column(LargeBinary(16), nullable=False, unique=True)
+    ua_text = Column(Text, nullable=False)
@@ -27,6 +27,10 @@ class Webhook(Base):
     
     # Authentication
     secret_key = Column(String(255))  # For HMAC signature verification
+    # Body signature sent as hex in X-Webhook-Signature, algorithm named in
+    # X-Webhook-Signature-Algorithm: "hmac-sha256" or "blake2b" (keyed
+    # BLAKE2b, 32-byte digest; secret at most 64 bytes)
+    signature_algo = Column(String(20), nullable=False, default="hmac-sha256", server_default="hmac-sha256")
     auth_header = Column(String(512))  # Optional custom auth header
     
     # Retry configuration
@@ -57,10 +61,20 @@ class WebhookLog(Base):
     __tablename__ = "webhook_logs"
     
     __table_args__ = (
-        Index("ix_webhook_logs_webhook_created", "webhook_id", "created_at"),
+        Index("ix_webhook_logs_webhook_id", "webhook_id"),
+        # Append-only: a BRIN index serves created_at range scans
+        Index(
+            "ix_webhook_logs_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
     
-    id = Column(Integer, primary_key=True, index=True)
+    # Partitioned by month on created_at (app.db.partitioning), so the
+    # partition key is part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     webhook_id = Column(Integer, nullable=False)
     
     # Request details
@@ -79,4 +93,4 @@ class WebhookLog(Base):
     retry_count = Column(Integer, default=0)
     
     # Timestamp
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False)
@@ -2,7 +2,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AbsenceCreate(BaseModel):
@@ -64,8 +64,7 @@ class AbsenceOut(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class AbsenceSummary(BaseModel):
@@ -93,6 +92,8 @@ class AbsenceListOut(BaseModel):
     absence_severity: str
     created_at: datetime
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class AbsenceStatistics(BaseModel):
     """Schema for absence statistics and analytics"""
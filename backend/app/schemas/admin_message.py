@@ -1,11 +1,11 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AdminMessageCreate(BaseModel):
     title: str = Field(..., min_length=3, max_length=255)
-    message_type: str = Field(..., pattern=r"^(service_note|official_message)$")
+    message_type: Literal["service_note", "official_message"]
     body: Optional[str] = None
     trainer_ids: List[int] = []
     class_names: List[str] = []
@@ -20,5 +20,4 @@ class AdminMessageOut(BaseModel):
     class_names: List[str]
     attachments: List[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
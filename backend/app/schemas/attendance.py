@@ -2,7 +2,7 @@ from datetime import datetime, time
 from decimal import Decimal
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class AttendanceCreate(BaseModel):
@@ -14,7 +14,7 @@ class AttendanceCreate(BaseModel):
         ..., description="Attendance status"
     )
     marked_via: Optional[str] = Field("manual", max_length=20, description="Check-in method")
-    facial_confidence: Optional[Decimal] = Field(
+    facial_confidence: Optional[float] = Field(
         None, ge=0, le=1, description="Facial recognition confidence (0-1)"
     )
     verification_photo_path: Optional[str] = Field(None, max_length=255)
@@ -27,15 +27,6 @@ class AttendanceCreate(BaseModel):
     device_id: Optional[str] = Field(None, max_length=100)
     ip_address: Optional[str] = Field(None, max_length=45)
     location_data: Optional[dict] = None
-    
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, v: str) -> str:
-        """Ensure status is valid."""
-        valid = ["present", "absent", "late", "excused"]
-        if v not in valid:
-            raise ValueError(f"Status must be one of {valid}")
-        return v
 
 
 class AttendanceUpdate(BaseModel):
@@ -43,7 +34,7 @@ class AttendanceUpdate(BaseModel):
     
     status: Optional[Literal["present", "absent", "late", "excused"]] = None
     marked_via: Optional[str] = Field(None, max_length=20)
-    facial_confidence: Optional[Decimal] = Field(None, ge=0, le=1)
+    facial_confidence: Optional[float] = Field(None, ge=0, le=1)
     late_minutes: Optional[int] = Field(None, ge=0)
     percentage: Optional[Decimal] = Field(None, ge=0, le=100)
     justification: Optional[str] = Field(None, max_length=500)
@@ -57,7 +48,7 @@ class AttendanceOut(BaseModel):
     student_id: int
     status: str
     marked_via: Optional[str]
-    facial_confidence: Optional[Decimal]
+    facial_confidence: Optional[float]
     verification_photo_path: Optional[str]
     marked_at: datetime
     actual_arrival_time: Optional[time]
@@ -65,8 +56,11 @@ class AttendanceOut(BaseModel):
     percentage: Optional[Decimal]
     justification: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
+# Built once: validates and serializes whole result lists in pydantic-core
+ATTENDANCE_LIST_ADAPTER = TypeAdapter(list[AttendanceOut])
 
 
 class AttendanceSummary(BaseModel):
@@ -81,5 +75,4 @@ class AttendanceSummary(BaseModel):
     attendance_rate: float = Field(..., ge=0, le=100, description="Percentage")
     period_days: int = Field(..., gt=0)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class Token(BaseModel):
@@ -35,9 +35,8 @@ class EnrollFacialRequest(BaseModel):
 
 class MeResponse(BaseModel):
     id: int
-    email: EmailStr
+    email: str
     role: str
     last_login: datetime | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ChatbotMessageCreate(BaseModel):
@@ -17,8 +17,7 @@ class ChatbotMessageOut(BaseModel):
     intent_detected: Optional[str]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class ChatbotConversationStart(BaseModel):
@@ -34,8 +33,7 @@ class ChatbotConversationOut(BaseModel):
     message_count: int
     started_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class ChatbotAskIn(BaseModel):
@@ -1,18 +1,80 @@
 from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Iterable, Optional, Type
 
-from pydantic import BaseModel, EmailStr
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    TypeAdapter,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    create_model,
+)
+from pydantic.fields import FieldInfo
+
+
+@lru_cache(maxsize=None)
+def get_validator(schema: Any) -> TypeAdapter:
+    """The process-wide TypeAdapter for ``schema`` (a model or any hashable type).
+
+    Building an adapter compiles a pydantic-core schema; this builds it once
+    per type and hands the same instance to every caller.
+    """
+    return TypeAdapter(schema)
+
+
+# Validation context for schemas built from ORM rows: JSON columns loaded
+# from the database are trusted as-is
+FROM_DB = {"from_db": True}
+
+
+def _trust_db_json(value: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    if isinstance(value, dict) and info.context and info.context.get("from_db"):
+        return value
+    return handler(value)
+
+
+# A JSON object column. Validated key by key, except under the FROM_DB
+# context where the dict decoded by the driver is passed through untouched.
+JsonDict = Annotated[Dict[str, Any], WrapValidator(_trust_db_json)]
 
 
 class Timestamped(BaseModel):
     created_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserBase(BaseModel):
     email: EmailStr
     role: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+def make_partial(
+    model: Type[BaseModel], name: str, exclude: Iterable[str] = (), **extra_fields: Any
+) -> Type[BaseModel]:
+    """Build an update schema where every field of ``model`` is optional.
+
+    Fields keep their constraints, aliases and descriptions but default to
+    ``None``, so ``model_dump(exclude_unset=True)`` yields only what the client
+    sent. ``exclude`` drops fields that cannot be updated; ``extra_fields`` are
+    passed to ``create_model`` as-is for update-only fields.
+    """
+    excluded = set(exclude)
+    fields: dict[str, Any] = {
+        field_name: (Optional[info.annotation], FieldInfo.merge_field_infos(info, default=None))
+        for field_name, info in model.model_fields.items()
+        if field_name not in excluded
+    }
+    fields.update(extra_fields)
+    return create_model(
+        name,
+        __config__=model.model_config,
+        __doc__=f"Schema for partially updating a {model.__name__} (all fields optional).",
+        __module__=model.__module__,
+        **fields,
+    )
@@ -1,7 +1,9 @@
 from datetime import date
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.schemas.common import make_partial
 
 
 class ControleCreate(BaseModel):
@@ -15,24 +17,10 @@ class ControleCreate(BaseModel):
     duration_minutes: Optional[int] = Field(None, gt=0, description="Duration in minutes")
     trainer_id: Optional[int] = Field(None, description="Trainer ID")
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
-class ControleUpdate(BaseModel):
-    """Schema for updating a controle."""
-    
-    module: Optional[str] = Field(None, min_length=1, max_length=100)
-    controle_date: Optional[date] = Field(None, alias="date")
-    class_name: Optional[str] = Field(None, min_length=1, max_length=50)
-    title: Optional[str] = Field(None, max_length=200)
-    description: Optional[str] = Field(None, max_length=500)
-    duration_minutes: Optional[int] = Field(None, gt=0)
-    trainer_id: Optional[int] = None
-    notified: Optional[bool] = None
-    
-    class Config:
-        populate_by_name = True
+ControleUpdate = make_partial(ControleCreate, "ControleUpdate", notified=(Optional[bool], None))
 
 
 class ControleOut(BaseModel):
@@ -48,9 +36,13 @@ class ControleOut(BaseModel):
     duration_minutes: Optional[int]
     trainer_id: Optional[int]
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(
+        from_attributes=True, populate_by_name=True, frozen=True, extra="forbid"
+    )
+
+
+# Built once: validates and serializes whole result lists in pydantic-core
+CONTROLE_LIST_ADAPTER = TypeAdapter(list[ControleOut])
 
 
 class ControleNotificationUpdate(BaseModel):
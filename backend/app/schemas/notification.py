@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class NotificationCreate(BaseModel):
@@ -10,7 +10,7 @@ class NotificationCreate(BaseModel):
     title: str
     message: str
     notification_type: str
-    priority: Optional[str] = "medium"
+    priority: Optional[Literal["low", "medium", "high", "critical"]] = "medium"
     delivery_method: Optional[str] = "in_app"
     related_entity_type: Optional[str] = None
     related_entity_id: Optional[int] = None
@@ -31,10 +31,11 @@ class NotificationOut(BaseModel):
     delivery_method: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class NotificationListOut(BaseModel):
     notifications: list[NotificationOut]
     unread_count: int
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
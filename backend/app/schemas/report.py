@@ -1,13 +1,18 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
+from typing_extensions import TypedDict
 
 
-class ReportSummary(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ReportSummary:
+    """Per-student attendance totals; one per student, so instances carry no ``__dict__``."""
+
     student_code: str
     name: str
-    class_: str
+    class_: Annotated[str, Field(serialization_alias="class")]
     total_sessions: int
     present: int
     absent: int
@@ -20,6 +25,12 @@ class AttendanceReportOut(BaseModel):
     report_date: datetime
     students: List[ReportSummary]
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+# Built once: validates and serializes whole result lists in pydantic-core
+REPORT_SUMMARY_LIST_ADAPTER = TypeAdapter(list[ReportSummary])
+
 
 class StudentReportOut(BaseModel):
     student_code: str
@@ -34,11 +45,25 @@ class StudentReportOut(BaseModel):
     attendance_summary: dict
     report_generated: str
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class StudentAnalyticsRow(TypedDict):
+    """One student line of a class analytics report."""
+
+    code: str
+    name: str
+    attendance_rate: float
+    alert_level: str
+    absence_hours: int
+
 
 class ClassAnalyticsOut(BaseModel):
     class_: str
     total_students: int
     high_risk_students: int
     average_attendance_rate: float
-    students: List[dict]
+    students: List[StudentAnalyticsRow]
     report_generated: str
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
@@ -1,6 +1,6 @@
 from datetime import date, time
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class SessionCreate(BaseModel):
@@ -28,5 +28,8 @@ class SessionOut(BaseModel):
     session_type: str | None
     status: str | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
+# Built once: validates and serializes whole result lists in pydantic-core
+SESSION_LIST_ADAPTER = TypeAdapter(list[SessionOut])
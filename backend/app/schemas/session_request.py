@@ -1,16 +1,26 @@
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime, time
+from typing import Annotated, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+# Times are stored and emitted as HH:MM, the format the trainer form submits
+TIME_FORMAT = "%H:%M"
+
+
+# The columns are VARCHAR and rows created before the request body was
+# validated may hold free-form text: those are returned as stored instead of
+# failing the whole listing. Left-to-right so well-formed strings still parse.
+StoredDate = Annotated[Union[date, str], Field(union_mode="left_to_right")]
+StoredTime = Annotated[Union[time, str], Field(union_mode="left_to_right")]
 
 
 class SessionRequestCreate(BaseModel):
     """Schema for creating a session request."""
     title: str
     class_name: str
-    session_date: str  # YYYY-MM-DD format
-    start_time: str  # HH:MM format
-    end_time: str  # HH:MM format
+    session_date: date
+    start_time: time
+    end_time: time
     session_type: Optional[str] = None
     notes: Optional[str] = None
 
@@ -23,9 +33,9 @@ class SessionRequestOut(BaseModel):
     trainer_email: str
     title: str
     class_name: str
-    session_date: str
-    start_time: str
-    end_time: str
+    session_date: StoredDate
+    start_time: StoredTime
+    end_time: StoredTime
     session_type: Optional[str]
     notes: Optional[str]
     status: str
@@ -35,8 +45,15 @@ class SessionRequestOut(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+    @field_serializer("session_date", "start_time", "end_time")
+    def _serialize_stored(self, value: date | time | str) -> str:
+        if isinstance(value, time):
+            return value.strftime(TIME_FORMAT)
+        if isinstance(value, date):
+            return value.isoformat()
+        return value
 
 
 class SessionRequestUpdate(BaseModel):
@@ -50,3 +67,5 @@ class SessionRequestListOut(BaseModel):
     requests: list[SessionRequestOut]
     total: int
     unread_count: int  # Pending requests count
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
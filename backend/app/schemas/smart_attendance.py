@@ -1,26 +1,57 @@
 """Smart Attendance Schemas - Pydantic models for self check-in and Teams integration."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.schemas.common import JsonDict
 
 # ============================================================================
 # Attendance Session Schemas
 # ============================================================================
 
-class AttendanceSessionCreate(BaseModel):
+AttendanceMode = Literal["self_checkin", "teams_auto", "hybrid"]
+
+
+class _AttendanceSessionCreateBase(BaseModel):
     session_id: int
-    mode: str = Field(..., pattern=r"^(self_checkin|teams_auto|hybrid)$")
     checkin_window_minutes: int = Field(default=15, ge=5, le=60)
+
+
+class _LocationSettings(BaseModel):
     location_verification_enabled: bool = False
     classroom_lat: Optional[float] = None
     classroom_lng: Optional[float] = None
     allowed_radius_meters: int = Field(default=100, ge=10, le=1000)
+
+
+class _TeamsMeeting(BaseModel):
     teams_meeting_id: Optional[str] = None
     teams_meeting_url: Optional[str] = None
 
 
+class SelfCheckinModeCreate(_AttendanceSessionCreateBase, _LocationSettings):
+    mode: Literal["self_checkin"]
+
+
+class TeamsAutoModeCreate(_AttendanceSessionCreateBase, _TeamsMeeting):
+    mode: Literal["teams_auto"]
+    # Participation sync matches attendees on the meeting id
+    teams_meeting_id: str
+
+
+class HybridModeCreate(_AttendanceSessionCreateBase, _LocationSettings, _TeamsMeeting):
+    mode: Literal["hybrid"]
+
+
+# pydantic-core picks the variant from "mode" and validates only its fields
+AttendanceSessionCreate = Annotated[
+    Union[SelfCheckinModeCreate, TeamsAutoModeCreate, HybridModeCreate],
+    Field(discriminator="mode"),
+]
+
+
 class AttendanceSessionOut(BaseModel):
     id: int
     session_id: int
@@ -35,12 +66,11 @@ class AttendanceSessionOut(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class AttendanceSessionUpdate(BaseModel):
-    mode: Optional[str] = Field(None, pattern=r"^(self_checkin|teams_auto|hybrid)$")
+    mode: Optional[AttendanceMode] = None
     checkin_window_minutes: Optional[int] = Field(None, ge=5, le=60)
     location_verification_enabled: Optional[bool] = None
     classroom_lat: Optional[float] = None
@@ -79,8 +109,7 @@ class SelfCheckinOut(BaseModel):
     rejection_reason: Optional[str]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 # ============================================================================
@@ -96,6 +125,19 @@ class TeamsParticipationCreate(BaseModel):
     leave_time: Optional[datetime] = None
 
 
+class TeamsParticipantReport(BaseModel):
+    """One participant of a Teams meeting attendance report."""
+
+    student_id: int
+    teams_participant_id: str
+    join_time: datetime
+    leave_time: Optional[datetime] = None
+    camera_on_minutes: int = Field(default=0, ge=0)
+    mic_used_count: int = Field(default=0, ge=0)
+    chat_messages_count: int = Field(default=0, ge=0)
+    reactions_count: int = Field(default=0, ge=0)
+
+
 class TeamsParticipationOut(BaseModel):
     id: int
     attendance_session_id: int
@@ -110,18 +152,21 @@ class TeamsParticipationOut(BaseModel):
     mic_used_count: int
     chat_messages_count: int
     reactions_count: int
-    engagement_details: Optional[Dict[str, Any]]
+    engagement_details: Optional[JsonDict]
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 # ============================================================================
 # Attendance Alert Schemas
 # ============================================================================
 
+# Values of severity_enum (AttendanceAlert.severity, FraudDetection.severity)
+Severity = Literal["low", "medium", "high", "critical"]
+
+
 class AttendanceAlertOut(BaseModel):
     id: int
     student_id: int
@@ -129,16 +174,20 @@ class AttendanceAlertOut(BaseModel):
     alert_type: str
     severity: str  # low, medium, high
     message: str
-    metadata: Optional[Dict[str, Any]] = Field(alias="metadata_json")
+    metadata: Optional[JsonDict] = Field(alias="metadata_json")
     is_acknowledged: bool
     acknowledged_by_user_id: Optional[int]
     acknowledged_at: Optional[datetime]
     action_taken: Optional[str]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(
+        from_attributes=True, populate_by_name=True, frozen=True, extra="forbid"
+    )
+
+
+# Built once: validates and serializes whole result lists in pydantic-core
+ATTENDANCE_ALERT_LIST_ADAPTER = TypeAdapter(list[AttendanceAlertOut])
 
 
 # ============================================================================
@@ -152,7 +201,7 @@ class FraudDetectionOut(BaseModel):
     checkin_id: Optional[int]
     fraud_type: str
     severity: str  # low, medium, high, critical
-    evidence: Optional[Dict[str, Any]]
+    evidence: Optional[JsonDict]
     description: str
     is_resolved: bool
     resolved_by_user_id: Optional[int]
@@ -160,8 +209,11 @@ class FraudDetectionOut(BaseModel):
     created_at: datetime
     resolved_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
+# Built once: validates and serializes whole result lists in pydantic-core
+FRAUD_DETECTION_LIST_ADAPTER = TypeAdapter(list[FraudDetectionOut])
 
 
 # ============================================================================
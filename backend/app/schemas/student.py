@@ -2,7 +2,9 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
+
+from app.schemas.common import make_partial
 
 
 class StudentBase(BaseModel):
@@ -28,26 +30,18 @@ class StudentCreate(StudentBase):
     user_id: int
 
 
-class StudentUpdate(BaseModel):
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
-    email: Optional[EmailStr] = None
-    phone: Optional[str] = None
-    date_of_birth: Optional[date] = None
-    cin_number: Optional[str] = None
-    parent_name: Optional[str] = None
-    parent_email: Optional[EmailStr] = None
-    parent_phone: Optional[str] = None
-    parent_relationship: Optional[str] = None
-    class_name: Optional[str] = None
-    group_name: Optional[str] = None
-    enrollment_date: Optional[date] = None
-    expected_graduation: Optional[date] = None
-    academic_status: Optional[str] = None
-    profile_photo_path: Optional[str] = None
+StudentUpdate = make_partial(
+    StudentBase,
+    "StudentUpdate",
+    exclude={"student_code"},
+    profile_photo_path=(Optional[str], None),
+)
 
 
 class StudentOut(StudentBase):
+    # Read back from rows that were validated on the way in
+    email: str
+    parent_email: Optional[str] = None
     id: int
     user_id: int
     total_absence_hours: int
@@ -68,8 +62,11 @@ class StudentOut(StudentBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
+# Built once: validates and serializes whole result lists in pydantic-core
+STUDENT_LIST_ADAPTER = TypeAdapter(list[StudentOut])
 
 
 class StudentListResponse(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
 
 from app.schemas.common import Timestamped
 
@@ -20,9 +20,12 @@ class UserUpdate(BaseModel):
 class UserOut(Timestamped):
     id: int
     username: str
-    email: EmailStr
+    email: str
     role: str
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
+# Built once: validates and serializes whole result lists in pydantic-core
+USER_LIST_ADAPTER = TypeAdapter(list[UserOut])
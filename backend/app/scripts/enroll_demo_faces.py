@@ -8,12 +8,32 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.db.session import SessionLocal
+from app.models.facial_embedding import FacialEmbedding
 from app.models.student import Student
 from app.models.user import User
-from sqlalchemy import text
+from sqlalchemy import insert, text
 import numpy as np
 
 
+def demo_embeddings(email: str, count: int) -> np.ndarray:
+    """``count`` unit-norm 512-d embeddings, always the same for a given email.
+
+    One PCG64 generator is seeded per call (no global ``np.random`` state), so
+    concurrent seeding jobs do not interfere. The seed comes from SHA-256
+    because ``hash(str)`` is randomized per process.
+    """
+    seed = int.from_bytes(hashlib.sha256(email.encode()).digest()[:8], "big")
+    embeddings = np.random.default_rng(seed).standard_normal((count, 512), dtype=np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings
+
+
+def _image_hash(prefix, index: int) -> bytes:
+    h = prefix.copy()
+    h.update(b"%d" % index)
+    return h.digest()
+
+
 def enroll_demo_student_face(db, email: str):
     """Enroll synthetic face embeddings for a student (FOR TESTING ONLY)."""
     
@@ -51,47 +71,28 @@ def enroll_demo_student_face(db, email: str):
     # In production, these would be real InsightFace embeddings
     print(f"📸 Enrolling facial data for: {student.first_name} {student.last_name}")
     
-    base_seed = hash(email) % (2**32)
-    
-    for i in range(3):
-        # Create a stable random embedding based on email + index
-        np.random.seed(base_seed + i)
-        embedding = np.random.randn(512).astype(np.float32)
-        
-        # Normalize to unit vector (standard for face embeddings)
-        embedding = embedding / np.linalg.norm(embedding)
-        
-        # Convert to pgvector format
-        embedding_str = "[" + ",".join(f"{x:.6f}" for x in embedding) + "]"
-        
-        # Create synthetic image hash
-        image_hash = hashlib.sha256(f"{email}_{i}".encode()).hexdigest()
-        
-        # Lighting conditions
-        lighting = ["normal", "bright", "normal"][i]
-        
-        # Insert embedding
-        db.execute(
-            text("""
-                INSERT INTO facial_embeddings 
-                (student_id, user_id, image_path, image_hash, is_primary, 
-                 embedding, embedding_model, lighting_conditions)
-                VALUES 
-                (:student_id, :user_id, :image_path, :image_hash, :is_primary,
-                 (:embedding)::vector, :embedding_model, :lighting)
-            """),
-            {
-                "student_id": student.id,
-                "user_id": user.id,
-                "image_path": f"demo/{email}/face_{i+1}.jpg",
-                "image_hash": image_hash,
-                "is_primary": i == 0,
-                "embedding": embedding_str,
-                "embedding_model": "insightface",
-                "lighting": lighting,
-            }
-        )
-        print(f"  ✅ Enrolled image {i+1}/3 ({lighting} lighting)")
+    embeddings = demo_embeddings(email, 3)
+
+    lighting = ["normal", "bright", "normal"]
+    # Synthetic image hashes are sha256(f"{email}_{i}"): hash the shared prefix once
+    hash_prefix = hashlib.sha256(f"{email}_".encode())
+    rows = [
+        {
+            "student_id": student.id,
+            "user_id": user.id,
+            "image_path": f"demo/{email}/face_{i+1}.jpg",
+            "image_hash": _image_hash(hash_prefix, i),
+            "is_primary": i == 0,
+            "embedding": embedding,
+            "embedding_model": "insightface",
+            "lighting_conditions": lighting[i],
+        }
+        for i, embedding in enumerate(embeddings)
+    ]
+    # One executemany for all images
+    db.execute(insert(FacialEmbedding), rows)
+    for i in range(len(rows)):
+        print(f"  ✅ Enrolled image {i+1}/3 ({lighting[i]} lighting)")
     
     # Update student record
     student.facial_data_encoded = True
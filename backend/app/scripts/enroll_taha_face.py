@@ -1,9 +1,10 @@
 """Enroll facial embeddings for Taha Khebazi for testing."""
 import sys
 import numpy as np
-from sqlalchemy import text
+from sqlalchemy import insert, text
 
 from app.db.session import SessionLocal
+from app.models.facial_embedding import FacialEmbedding
 from app.models.student import Student
 from app.models.user import User
 
@@ -43,37 +44,30 @@ def enroll_taha_embeddings():
         
         print("\nCreating synthetic facial embeddings...")
         
-        for idx, emb_data in enumerate(embeddings_data):
-            # Generate a random 512-dimensional embedding (InsightFace standard)
-            # In production, this would come from actual facial recognition
-            embedding_vector = np.random.randn(512).astype(np.float32)
-            
-            # Normalize the vector
-            embedding_vector = embedding_vector / np.linalg.norm(embedding_vector)
-            
-            # Convert to bytes for pgvector
-            embedding_bytes = embedding_vector.tobytes()
-            
-            # Insert into database
-            db.execute(
-                text("""
-                    INSERT INTO facial_embeddings 
-                    (user_id, student_id, embedding, lighting_conditions, confidence_score, is_primary, image_path, capture_angle)
-                    VALUES 
-                    (:user_id, :student_id, :embedding, :lighting, :confidence, :is_primary, :image_path, :angle)
-                """),
+        # Random 512-dimensional embeddings (InsightFace standard), normalized row-wise
+        # In production, these would come from actual facial recognition
+        embeddings = np.random.default_rng().standard_normal((len(embeddings_data), 512), dtype=np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+        # Insert all embeddings in one executemany
+        db.execute(
+            insert(FacialEmbedding),
+            [
                 {
                     "user_id": user.id,
                     "student_id": student.id,
-                    "embedding": embedding_vector.tolist(),  # pgvector accepts list
-                    "lighting": emb_data["lighting"],
-                    "confidence": emb_data["confidence"],
+                    "embedding": embedding,
+                    "lighting_conditions": emb_data["lighting"],
+                    "confidence_score": emb_data["confidence"],
                     "is_primary": (idx == 0),
                     "image_path": f"/storage/faces/taha_synthetic_{idx}.jpg",
-                    "angle": "frontal"
+                    "capture_angle": "frontal",
                 }
-            )
-            
+                for idx, (emb_data, embedding) in enumerate(zip(embeddings_data, embeddings))
+            ],
+        )
+
+        for idx, emb_data in enumerate(embeddings_data):
             print(f"  ✓ Created embedding {idx + 1}: {emb_data['lighting']} lighting, {emb_data['confidence']:.2%} confidence")
         
         # Update student's facial_data_encoded flag
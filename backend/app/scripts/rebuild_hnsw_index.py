@@ -0,0 +1,26 @@
+"""Rebuild the facial embedding HNSW index with parameters sized to the row count.
+
+Run when enrolment has grown past a tier of
+``app.db.vector_index.configure_hnsw_params``:
+
+    python -m app.scripts.rebuild_hnsw_index
+"""
+
+from app.db.session import engine
+from app.db.vector_index import HNSW_INDEX_NAME, rebuild_hnsw_index
+
+
+def main() -> None:
+    with engine.connect() as connection:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        params = rebuild_hnsw_index(connection)
+    print(
+        "Rebuilt {}: m={m}, ef_construction={ef_construction}, ef_search={ef_search}".format(
+            HNSW_INDEX_NAME, **params
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,24 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, time
+from io import BytesIO
+from itertools import cycle
 from pathlib import Path
 
 from sqlalchemy.orm import Session
 
+from app.db.bulk import bulk_insert
+from app.db.seeding import upsert_with_user
 from app.db.session import SessionLocal
 from app.models.attendance import AttendanceRecord
 from app.models.notification import Notification
+from app.models.school_class import SchoolClass
 from app.models.session import Session as SessionModel
 from app.models.student import Student
 from app.models.trainer import Trainer
 from app.models.user import User
 from app.services.auth import get_password_hash
-from app.services.facial import enroll_user_faces
+from app.services.facial import enroll_user_faces_batch
 
 
 def ensure_dir(path: Path):
@@ -26,37 +32,27 @@ def seed_users(db: Session):
         ("yassin", "madani", "yassin.madani@smartpresence.com"),
         ("rachid", "aitaamou", "rachid.aitaamou@smartpresence.com"),
     ]
-
-    created_trainers: list[User] = []
-    for first, last, email in trainers:
-        existing = db.query(User).filter(User.email == email).first()
-        if existing:
-            created_trainers.append(existing)
-            continue
-        user = User(
-            username=f"{first}.{last}",
-            email=email,
-            password_hash=get_password_hash("Trainer.123"),
-            role="trainer",
-            is_active=True,
-        )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        created_trainers.append(user)
-
-        # Optional trainer profile row
-        trainer_row = Trainer(
-            user_id=user.id,
-            first_name=first.capitalize(),
-            last_name=last.capitalize(),
-            email=email,
-            specialization="Software Engineering",
-            years_experience=5,
-            status="active",
-        )
-        db.add(trainer_row)
-        db.commit()
+    # All seeded accounts of a role share one password, so it is hashed once;
+    # existing profiles are kept as they are
+    seeded_trainers = upsert_with_user(
+        db,
+        Trainer,
+        [
+            {"username": f"{first}.{last}", "email": email, "first": first, "last": last}
+            for first, last, email in trainers
+        ],
+        role="trainer",
+        password_hash=get_password_hash("Trainer.123"),
+        profile_row=lambda record, user: {
+            "user_id": user.id,
+            "first_name": record["first"].capitalize(),
+            "last_name": record["last"].capitalize(),
+            "email": record["email"],
+            "specialization": "Software Engineering",
+            "years_experience": 5,
+            "status": "active",
+        },
+    )
 
     students = [
         ("taha", "khebazi", "taha.khebazi@smartpresence.com", "DEV101"),
@@ -65,56 +61,53 @@ def seed_users(db: Session):
         ("karim", "bennani", "karim.bennani@smartpresence.com", "DEV101"),
         ("amine", "elalami", "amine.elalami@smartpresence.com", "DEV102"),
     ]
+    class_ids = {cls: SchoolClass.id_for(db, cls) for cls in {cls for *_, cls in students}}
+    seeded_students = upsert_with_user(
+        db,
+        Student,
+        [
+            {
+                "username": f"{first}.{last}",
+                "email": email,
+                "first": first,
+                "last": last,
+                "cls": cls,
+            }
+            for first, last, email, cls in students
+        ],
+        role="student",
+        password_hash=get_password_hash("Student.123"),
+        profile_row=lambda record, user: {
+            "user_id": user.id,
+            "student_code": f"STU{user.id:04d}",
+            "first_name": record["first"].capitalize(),
+            "last_name": record["last"].capitalize(),
+            "email": record["email"],
+            "class_id": class_ids[record["cls"]],
+            "group_name": "A",
+            "academic_status": "active",
+            "attendance_rate": 100.0,
+            "facial_data_encoded": False,
+        },
+    )
+    db.commit()
 
-    created_students: list[Student] = []
-    for first, last, email, cls in students:
-        existing = db.query(User).filter(User.email == email).first()
-        if existing:
-            user = existing
-        else:
-            user = User(
-                username=f"{first}.{last}",
-                email=email,
-                password_hash=get_password_hash("Student.123"),
-                role="student",
-                is_active=True,
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-
-        # Student row
-        st_row = db.query(Student).filter(Student.user_id == user.id).first()
-        if not st_row:
-            st_row = Student(
-                user_id=user.id,
-                student_code=f"STU{user.id:04d}",
-                first_name=first.capitalize(),
-                last_name=last.capitalize(),
-                email=email,
-                class_name=cls,
-                group_name="A",
-                academic_status="active",
-                attendance_rate=100.0,
-                facial_data_encoded=False,
-            )
-            db.add(st_row)
-            db.commit()
-            db.refresh(st_row)
-        created_students.append(st_row)
-
-    return created_trainers, created_students
+    # Later steps need the student rows (ids and user ids), in seed order
+    by_id = {
+        st.id: st for st in db.query(Student).filter(Student.id.in_(seeded_students.profile_ids))
+    }
+    return seeded_trainers.users, [by_id[pid] for pid in seeded_students.profile_ids]
 
 
 def seed_sessions_and_attendance(db: Session, trainers: list[User], students: list[Student]):
     # Create one session per trainer today
-    sessions: list[SessionModel] = []
-    for idx, tr_user in enumerate(trainers, start=1):
-        s = SessionModel(
+    today = date.today()
+    sessions = [
+        SessionModel(
             module_id=100 + idx,
             trainer_id=tr_user.id,
             classroom_id=200 + idx,
-            session_date=date.today(),
+            session_date=today,
             start_time=time(9 + idx, 0),
             end_time=time(10 + idx, 30),
             title=f"Module {100+idx}",
@@ -122,47 +115,57 @@ def seed_sessions_and_attendance(db: Session, trainers: list[User], students: li
             class_name="DEV101",
             status="scheduled",
         )
-        db.add(s)
-        db.commit()
-        db.refresh(s)
-        sessions.append(s)
+        for idx, tr_user in enumerate(trainers, start=1)
+    ]
+    # The flush assigns the session ids the attendance rows need
+    db.add_all(sessions)
+    db.flush()
 
     # Mark attendance for first session
     if sessions:
         session_id = sessions[0].id
-        for i, st in enumerate(students):
-            status = "present" if i % 2 == 0 else "absent"
-            ar = AttendanceRecord(
-                session_id=session_id,
-                student_id=st.id,
-                status=status,
-                marked_via="manual",
-                percentage=100.0 if status == "present" else 0.0,
-            )
-            db.add(ar)
-        db.commit()
+        bulk_insert(
+            db,
+            AttendanceRecord,
+            [
+                {
+                    "session_id": session_id,
+                    "student_id": st.id,
+                    "status": status,
+                    "marked_via": "manual",
+                    "percentage": 100.0 if status == "present" else 0.0,
+                }
+                for st, status in zip(students, cycle(("present", "absent")))
+            ],
+        )
+    db.commit()
 
 
 def seed_notifications(db: Session, users: list[User]):
-    for u in users:
-        n = Notification(
-            user_id=u.id,
-            user_type=u.role,
-            title="Bienvenue",
-            message="Votre compte a été créé avec succès.",
-            notification_type="info",
-            priority="low",
-            read=False,
-            delivered=True,
-            delivery_method="in_app",
-            delivery_status="sent",
-        )
-        db.add(n)
+    bulk_insert(
+        db,
+        Notification,
+        [
+            {
+                "user_id": u.id,
+                "user_type": u.role,
+                "title": "Bienvenue",
+                "message": "Votre compte a été créé avec succès.",
+                "notification_type": "info",
+                "priority": "low",
+                "read": False,
+                "delivered": True,
+                "delivery_method": "in_app",
+                "delivery_status": "sent",
+            }
+            for u in users
+        ],
+    )
     db.commit()
 
 
 def seed_faces(db: Session, students: list[Student]):
-    """Create placeholder face images and enroll embeddings for first student."""
+    """Create placeholder face images and enroll embeddings for every student."""
     try:
         from PIL import Image, ImageDraw
     except Exception:
@@ -170,28 +173,40 @@ def seed_faces(db: Session, students: list[Student]):
 
     if not students:
         return
-    student = students[0]
-    user_id = student.user_id
 
-    base = Path(os.getenv("FACE_STORAGE_DIR", "/app/storage/faces")) / str(user_id)
-    ensure_dir(base)
+    # The face outline is drawn once into a mask and stamped on each background
+    outline = Image.new("L", (160, 160), 0)
+    ImageDraw.Draw(outline).ellipse((40, 40, 120, 120), outline=255, width=2)
 
-    images = []
-    for i, color in enumerate([(240, 240, 240), (220, 220, 230), (230, 220, 220)], start=1):
+    # Every student gets the same three captures, so they are encoded once
+    captures = []
+    for color in [(240, 240, 240), (220, 220, 230), (230, 220, 220)]:
         img = Image.new("RGB", (160, 160), color)
-        d = ImageDraw.Draw(img)
-        d.ellipse((40, 40, 120, 120), outline=(80, 80, 80), width=2)
-        path = base / f"capture_{i}.jpg"
-        img.save(path, format="JPEG", quality=90)
-        images.append((str(path), path.read_bytes()))
-
-    # Enroll embeddings
-    enroll_user_faces(db, user_id, images)
-
-    # Mark student as encoded
-    student.facial_data_encoded = True
-    db.add(student)
-    db.commit()
+        img.paste((80, 80, 80), mask=outline)
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG", quality=75, optimize=False, progressive=False)
+        captures.append(buffer.getvalue())
+
+    storage = Path(os.getenv("FACE_STORAGE_DIR", "/app/storage/faces"))
+    images_by_user = {}
+    for student in students:
+        base = ensure_dir(storage / str(student.user_id))
+        images_by_user[student.user_id] = [
+            (str(base / f"capture_{i}.jpg"), data) for i, data in enumerate(captures, start=1)
+        ]
+
+    # File writes release the GIL, so they overlap across a few threads
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        writes = [
+            pool.submit(Path(path).write_bytes, data)
+            for images in images_by_user.values()
+            for path, data in images
+        ]
+    for write in writes:
+        write.result()
+
+    # Enroll embeddings; marks the enrolled students as encoded
+    enroll_user_faces_batch(db, images_by_user)
 
 
 def main():
@@ -31,9 +31,6 @@ def upsert_user(db: Session, *, email: str, username: str, role: str, password:
         user.is_active = True
         user.is_deleted = False
         user.password_hash = get_password_hash(password)
-        db.add(user)
-        db.commit()
-        db.refresh(user)
         return user
 
     user = User(
@@ -45,20 +42,22 @@ def upsert_user(db: Session, *, email: str, username: str, role: str, password:
         is_deleted=False,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    # Assigns user.id through RETURNING; the caller's seed step commits
+    db.flush()
     return user
 
 
 def seed_admin(db: Session) -> User:
     # Login UI uses email; "badr eddine boudhim" is represented in the username.
-    return upsert_user(
+    admin = upsert_user(
         db,
         email="badr.eddine.boudhim@smartpresence.com",
         username="badr.eddine.boudhim",
         role="admin",
         password="Luno.xar.95",
     )
+    db.commit()
+    return admin
 
 
 def seed_trainers(db: Session) -> list[User]:
@@ -86,8 +85,8 @@ def seed_trainers(db: Session) -> list[User]:
                 status="active",
             )
             db.add(tr)
-            db.commit()
 
+    db.commit()
     return out
 
 
@@ -121,8 +120,6 @@ def seed_students(db: Session) -> list[Student]:
                 is_deleted=False,
             )
             db.add(st)
-            db.commit()
-            db.refresh(st)
         else:
             st.first_name = first.capitalize()
             st.last_name = last.capitalize()
@@ -130,11 +127,10 @@ def seed_students(db: Session) -> list[Student]:
             st.group_name = st.group_name or "A"
             st.academic_status = st.academic_status or "active"
             st.is_deleted = False
-            db.add(st)
-            db.commit()
 
         out.append(st)
 
+    db.commit()
     return out
 
 
@@ -156,9 +152,8 @@ def seed_sessions_and_attendance(db: Session, trainers: list[User], students: li
             is_deleted=False,
         )
         db.add(s)
-        db.commit()
-        db.refresh(s)
         sessions.append(s)
+    db.flush()
 
     # Mark attendance for the first session
     if sessions:
@@ -176,7 +171,6 @@ def seed_sessions_and_attendance(db: Session, trainers: list[User], students: li
                     allowed_radius_meters=100,
                 )
             )
-            db.commit()
 
         for i, st in enumerate(students):
             status = "present" if i % 2 == 0 else "absent"
@@ -189,7 +183,7 @@ def seed_sessions_and_attendance(db: Session, trainers: list[User], students: li
                 is_deleted=False,
             )
             db.add(ar)
-        db.commit()
+    db.commit()
 
 
 def seed_notifications(db: Session, users: list[User]) -> None:
@@ -1,13 +1,15 @@
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
-from app.models.attendance import AttendanceRecord
+from app.models.attendance import AttendanceRecord, StudentAttendanceAggregate
 from app.models.session import Session as SessionModel
 from app.models.student import Student
 from app.models.absence import Absence  # N8N integration
 from app.schemas.attendance import AttendanceCreate, AttendanceUpdate
+from app.services.student_counters import add_absence_hours, total_absence_hours
 
 
 class AttendanceService:
@@ -52,7 +54,7 @@ class AttendanceService:
             verification_photo_path=payload.verification_photo_path,
             actual_arrival_time=payload.actual_arrival_time,
             late_minutes=payload.late_minutes or 0,
-            percentage=payload.percentage or Decimal("0.00"),
+            percentage=payload.percentage or 0.0,
             justification=payload.justification,
             device_id=payload.device_id,
             ip_address=payload.ip_address,
@@ -120,23 +122,44 @@ class AttendanceService:
         Returns:
             dict: Summary with total_sessions, present, absent, late, excused counts,
                   attendance_rate (%), and period_days
+
+        On PostgreSQL the counts come from attendance_summary_mv: whole days
+        from the cutoff date, as of the view's last refresh.
         """
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        records = (
-            db.query(AttendanceRecord)
-            .filter(
-                AttendanceRecord.student_id == student_id,
-                AttendanceRecord.marked_at >= cutoff_date,
+        if db.get_bind().dialect.name == "postgresql":
+            # Sum at most `days` pre-aggregated rows instead of scanning history
+            aggregate = StudentAttendanceAggregate
+            total, present, absent, late, excused = (
+                db.query(
+                    func.coalesce(func.sum(aggregate.total_sessions), 0),
+                    func.coalesce(func.sum(aggregate.present), 0),
+                    func.coalesce(func.sum(aggregate.absent), 0),
+                    func.coalesce(func.sum(aggregate.late), 0),
+                    func.coalesce(func.sum(aggregate.excused), 0),
+                )
+                .filter(
+                    aggregate.student_id == student_id,
+                    aggregate.day >= cutoff_date.date(),
+                )
+                .one()
+            )
+        else:
+            records = (
+                db.query(AttendanceRecord)
+                .filter(
+                    AttendanceRecord.student_id == student_id,
+                    AttendanceRecord.marked_at >= cutoff_date,
+                )
+                .all()
             )
-            .all()
-        )
 
-        total = len(records)
-        present = sum(1 for r in records if r.status == "present")
-        absent = sum(1 for r in records if r.status == "absent")
-        late = sum(1 for r in records if r.status == "late")
-        excused = sum(1 for r in records if r.status == "excused")
+            total = len(records)
+            present = sum(1 for r in records if r.status == "present")
+            absent = sum(1 for r in records if r.status == "absent")
+            late = sum(1 for r in records if r.status == "late")
+            excused = sum(1 for r in records if r.status == "excused")
 
         attendance_rate = (present / total * 100) if total > 0 else 0
 
@@ -151,6 +174,12 @@ class AttendanceService:
             "period_days": days,
         }
 
+    @staticmethod
+    def refresh_attendance_summary(db: Session) -> None:
+        """Refresh the per-day summary view read by get_student_attendance_summary."""
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY attendance_summary_mv"))
+        db.commit()
+
     @staticmethod
     def get_session_attendance(db: Session, session_id: int):
         """Get all attendance records for a session."""
@@ -240,7 +269,7 @@ class AttendanceService:
             if session and session.duration_minutes:
                 # Convert minutes to hours and add to total
                 absence_hours = session.duration_minutes / 60.0
-                student.total_absence_hours = (student.total_absence_hours or 0) + int(absence_hours)
+                add_absence_hours(student, int(absence_hours))
         
         # Also track late minutes
         if status == "late":
@@ -314,6 +343,6 @@ class AttendanceService:
         db.commit()
         
         # Update alertsent flag if threshold exceeded (for WhatsApp workflow)
-        if student.total_absence_hours >= 8 and not student.alertsent:
+        if total_absence_hours(student) >= 8 and not student.alertsent:
             # N8N Workflow 3 will pick this up for WhatsApp notification
             pass  # Keep alertsent=False so N8N can detect and send WhatsApp
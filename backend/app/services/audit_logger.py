@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.models.audit_log import AuditLog
 from app.models.user import User
+from app.services.user_agent import get_user_agent_id
 
 
 class AuditService:
@@ -31,7 +32,7 @@ class AuditService:
         request_path: str | None = None,
         old_values: Dict[str, Any] | None = None,
         new_values: Dict[str, Any] | None = None,
-        success: str = "success",
+        success: bool = True,
         error_message: str | None = None,
         meta: Dict[str, Any] | None = None,
     ) -> AuditLog:
@@ -42,7 +43,7 @@ class AuditService:
             resource_type=resource_type,
             resource_id=resource_id,
             ip_address=ip_address,
-            user_agent=user_agent,
+            user_agent_id=get_user_agent_id(self.db, user_agent),
             request_method=request_method,
             request_path=request_path,
             old_values=old_values,
@@ -71,7 +72,7 @@ class AuditLogger:
         old_values: Optional[Dict[str, Any]] = None,
         new_values: Optional[Dict[str, Any]] = None,
         request: Optional[Request] = None,
-        success: str = "success",
+        success: bool = True,
         error_message: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> AuditLog:
@@ -106,7 +107,7 @@ class AuditLogger:
             resource_type=resource_type,
             resource_id=resource_id,
             ip_address=ip_address,
-            user_agent=user_agent,
+            user_agent_id=get_user_agent_id(db, user_agent),
             request_method=request_method,
             request_path=request_path,
             old_values=old_values,
@@ -1,5 +1,5 @@
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, Iterator
 
 from sqlalchemy.orm import Session
@@ -61,7 +61,6 @@ class ChatbotService:
         conversation = ChatbotConversation(
             user_id=user_id,
             user_type=user_type,
-            session_id=f"{user_id}_{datetime.now().timestamp()}",
             context_data=json.dumps({}),
             conversation_history=json.dumps([]),
             is_active=True,
@@ -120,7 +119,7 @@ class ChatbotService:
 
         # Update conversation
         conversation.message_count += 1
-        conversation.last_activity = datetime.now()
+        conversation.last_activity = datetime.now(timezone.utc)
 
         db.commit()
         db.refresh(assistant_msg)
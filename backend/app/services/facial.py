@@ -1,10 +1,11 @@
 import hashlib
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import numpy as np
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.models.student import Student
 from app.models.user import User
 from app.services.face_engine import (
@@ -14,8 +15,15 @@ from app.services.face_engine import (
 )
 
 
-def _embedding_to_pgvector_str(embedding: List[float]) -> str:
-    return "[" + ",".join(f"{x:.6f}" for x in embedding) + "]"
+def set_hnsw_ef_search(db: Session) -> None:
+    """Apply the configured hnsw.ef_search override to the current transaction."""
+    ef_search = get_settings().facial_hnsw_ef_search
+    if ef_search is None:
+        return
+    db.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef, true)"),
+        {"ef": str(ef_search)},
+    )
 
 
 def verify_user_face_by_image(
@@ -46,17 +54,18 @@ def verify_user_face_by_image(
     except Exception:
         return None, None, "invalid_image", None
 
+    # Bound as a float8[] (dumped by psycopg's C adapter) and cast to halfvec
     emb = emb_np.astype(np.float32).tolist()
-    emb_str = _embedding_to_pgvector_str(emb)
 
+    set_hnsw_ef_search(db)
     row = db.execute(
         text(
-            "SELECT user_id, student_id, image_path, 1 - (embedding <=> (:q)::vector) AS similarity "
+            "SELECT user_id, student_id, image_path, 1 - (embedding <=> (:q)::halfvec) AS similarity "
             "FROM facial_embeddings "
             "WHERE embedding IS NOT NULL AND (user_id = :uid OR student_id = (:sid)::int) "
-            "ORDER BY embedding <=> (:q)::vector ASC LIMIT 1"
+            "ORDER BY embedding <=> (:q)::halfvec ASC LIMIT 1"
         ),
-        {"q": emb_str, "uid": user.id, "sid": student_id},
+        {"q": emb, "uid": user.id, "sid": student_id},
     ).fetchone()
 
     if not row:
@@ -69,9 +78,19 @@ def verify_user_face_by_image(
     return None, similarity, "below_threshold", metrics
 
 
-def enroll_user_faces(db: Session, user_id: int, image_paths_and_bytes: List[Tuple[str, bytes]]):
-    student = db.query(Student).filter(Student.user_id == user_id).first()
-    inserted = 0
+_INSERT_EMBEDDING = text(
+    "INSERT INTO facial_embeddings (student_id, user_id, image_path, image_hash, is_primary, "
+    "embedding, embedding_model, lighting_conditions) "
+    "VALUES (:student_id, :user_id, :image_path, :image_hash, :is_primary, "
+    "(:embedding)::halfvec, :embedding_model, :lighting)"
+)
+
+
+def _embedding_rows(
+    student_id: int | None, user_id: int, image_paths_and_bytes: List[Tuple[str, bytes]]
+) -> tuple[list[dict], list[str]]:
+    """Insert parameters for each usable image of one user, plus the failure reasons."""
+    rows: list[dict] = []
     failures: list[str] = []
 
     for idx, (path, bytes_) in enumerate(image_paths_and_bytes):
@@ -84,31 +103,30 @@ def enroll_user_faces(db: Session, user_id: int, image_paths_and_bytes: List[Tup
             failures.append("invalid_image")
             continue
 
-        emb = emb_np.astype(np.float32).tolist()
-        emb_str = _embedding_to_pgvector_str(emb)
-        hsh = hashlib.sha256(bytes_).hexdigest()
-
         lighting = (
             "dark" if metrics.brightness < 80 else "bright" if metrics.brightness > 170 else "normal"
         )
-
-        db.execute(
-            text(
-                "INSERT INTO facial_embeddings (student_id, user_id, image_path, image_hash, is_primary, embedding, embedding_model, lighting_conditions) "
-                "VALUES (:student_id, :user_id, :image_path, :image_hash, :is_primary, (:embedding)::vector, :embedding_model, :lighting)"
-            ),
+        rows.append(
             {
-                "student_id": student.id if student else None,
+                "student_id": student_id,
                 "user_id": user_id,
                 "image_path": path,
-                "image_hash": hsh,
+                "image_hash": hashlib.sha256(bytes_).digest(),
                 "is_primary": idx == 0,
-                "embedding": emb_str,
+                "embedding": emb_np.astype(np.float32).tolist(),
                 "embedding_model": "insightface",
                 "lighting": lighting,
-            },
+            }
         )
-        inserted += 1
+    return rows, failures
+
+
+def enroll_user_faces(db: Session, user_id: int, image_paths_and_bytes: List[Tuple[str, bytes]]):
+    student = db.query(Student).filter(Student.user_id == user_id).first()
+    rows, failures = _embedding_rows(
+        student.id if student else None, user_id, image_paths_and_bytes
+    )
+    inserted = len(rows)
 
     if inserted < 2:
         db.rollback()
@@ -116,14 +134,46 @@ def enroll_user_faces(db: Session, user_id: int, image_paths_and_bytes: List[Tup
             f"At least 2 usable face images are required (got {inserted}). Failures: {', '.join(failures) or 'unknown'}. Please ensure good lighting and hold the camera steady."
         )
 
-    db.commit()
+    db.execute(_INSERT_EMBEDDING, rows)
     if student:
         student.facial_data_encoded = True
-        db.add(student)
-        db.commit()
+    db.commit()
     return inserted
 
 
+def enroll_user_faces_batch(
+    db: Session, images_by_user: Dict[int, List[Tuple[str, bytes]]]
+) -> Dict[int, int]:
+    """Enroll several users at once; returns the embeddings stored per enrolled user.
+
+    Students are looked up with one query and every embedding is written with
+    one executemany INSERT and a single commit. Users with fewer than 2
+    usable images are skipped (nothing is stored for them) instead of
+    failing the whole batch.
+    """
+    students = {
+        st.user_id: st
+        for st in db.query(Student).filter(Student.user_id.in_(list(images_by_user)))
+    }
+
+    enrolled: Dict[int, int] = {}
+    all_rows: list[dict] = []
+    for user_id, images in images_by_user.items():
+        student = students.get(user_id)
+        rows, _ = _embedding_rows(student.id if student else None, user_id, images)
+        if len(rows) < 2:
+            continue
+        all_rows.extend(rows)
+        enrolled[user_id] = len(rows)
+        if student:
+            student.facial_data_encoded = True
+
+    if all_rows:
+        db.execute(_INSERT_EMBEDDING, all_rows)
+    db.commit()
+    return enrolled
+
+
 def match_user_by_image(
     db: Session, email: str, image_bytes: bytes, threshold: float = 0.85
 ) -> int | None:
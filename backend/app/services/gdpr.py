@@ -1,60 +1,11 @@
-"""GDPR compliance utilities: export and delete user data."""
-
-from __future__ import annotations
-
-from typing import Any, Dict
-
-from sqlalchemy.orm import Session
-
-from app.models import AttendanceRecord, AuditLog, Notification, Student, Trainer, User
-
-
-class GDPRService:
-    def __init__(self, db: Session):
-        self.db = db
-
-    def export_user_data(self, user_id: int) -> Dict[str, Any]:
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise ValueError("User not found")
-
-        student = self.db.query(Student).filter(Student.user_id == user_id).first()
-        trainer = self.db.query(Trainer).filter(Trainer.user_id == user_id).first()
-        attendance = self.db.query(AttendanceRecord).filter(AttendanceRecord.student_id == (student.id if student else None)).all() if student else []
-        audits = self.db.query(AuditLog).filter(AuditLog.user_id == user_id).all()
-        notifications = self.db.query(Notification).filter(Notification.user_id == user_id).all()
-
-        return {
-            "user": user.__dict__ if user else None,
-            "student": student.__dict__ if student else None,
-            "trainer": trainer.__dict__ if trainer else None,
-            "attendance": [a.__dict__ for a in attendance],
-            "audit_logs": [a.__dict__ for a in audits],
-            "notifications": [n.__dict__ for n in notifications],
-        }
-
-    def delete_user_data(self, user_id: int) -> None:
-        # Soft-delete approach: anonymize personal fields
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return
-        user.email = f"deleted_{user_id}@example.com"
-        user.full_name = "Deleted User"
-        self.db.commit()
-
-        # Anonymize related student/trainer
-        student = self.db.query(Student).filter(Student.user_id == user_id).first()
-        if student:
-            student.student_number = f"deleted_{student.id}"
-        trainer = self.db.query(Trainer).filter(Trainer.user_id == user_id).first()
-        if trainer:
-            trainer.employee_id = f"deleted_{trainer.id}"
-        self.db.commit()
 """
 GDPR Compliance Service - Data export, deletion, and retention policies
 """
 
 from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
 
 from app.models.attendance import AttendanceRecord
 from app.models.facial_embedding import FacialEmbedding
@@ -259,11 +210,25 @@ class GDPRService:
         """
         cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
         
-        # Delete old audit logs
+        # Drop whole audit log partitions past retention, then delete the
+        # remainder from the partition straddling the cutoff
+        from app.db.partitioning import drop_partitions_before
         from app.models.audit_log import AuditLog
+        dropped_audit_partitions = drop_partitions_before(
+            db.connection(), "audit_logs", cutoff_date
+        )
         deleted_audit_logs = db.query(AuditLog).filter(
             AuditLog.timestamp < cutoff_date
-        ).delete()
+        ).delete(synchronize_session=False)
+
+        # Webhook logs carry request payloads; retire them the same way
+        from app.models.webhook import WebhookLog
+        dropped_webhook_partitions = drop_partitions_before(
+            db.connection(), "webhook_logs", cutoff_date
+        )
+        deleted_webhook_logs = db.query(WebhookLog).filter(
+            WebhookLog.created_at < cutoff_date
+        ).delete(synchronize_session=False)
         
         # Anonymize old attendance records (keep statistics but remove personal identifiers)
         # This preserves historical data while protecting privacy
@@ -280,6 +245,9 @@ class GDPRService:
         db.commit()
         
         return {
+            "dropped_audit_partitions": len(dropped_audit_partitions),
             "deleted_audit_logs": deleted_audit_logs,
+            "dropped_webhook_partitions": len(dropped_webhook_partitions),
+            "deleted_webhook_logs": deleted_webhook_logs,
             "anonymized_attendance": len(old_attendance),
         }
@@ -0,0 +1,40 @@
+"""Classroom radius checks on integer microdegree coordinates.
+
+Check-in radii are at most a kilometre, so distances use the equirectangular
+approximation: the longitude delta is scaled by the cosine of the classroom
+latitude and the result is treated as a flat plane. At that range the error
+against the haversine distance is far below GPS accuracy.
+"""
+
+import math
+
+from app.db.types import MICRODEGREES
+
+EARTH_RADIUS_METERS = 6_371_000
+
+# Length of one microdegree of latitude
+METERS_PER_MICRODEGREE = 2 * math.pi * EARTH_RADIUS_METERS / 360 / MICRODEGREES
+
+# Fixed-point scale of the longitude cosine factor
+_COS_SHIFT = 16
+
+
+def to_microdegrees(degrees: float) -> int:
+    return round(float(degrees) * MICRODEGREES)
+
+
+def _cos_factor(lat_udeg: int) -> int:
+    return round(math.cos(math.radians(lat_udeg / MICRODEGREES)) * (1 << _COS_SHIFT))
+
+
+def _deltas(lat1_udeg: int, lng1_udeg: int, lat2_udeg: int, lng2_udeg: int) -> tuple[int, int]:
+    """North and east offsets in microdegrees of latitude; point 2 is the reference."""
+    dy = lat1_udeg - lat2_udeg
+    dx = ((lng1_udeg - lng2_udeg) * _cos_factor(lat2_udeg)) >> _COS_SHIFT
+    return dy, dx
+
+
+def distance_meters(lat1_udeg: int, lng1_udeg: int, lat2_udeg: int, lng2_udeg: int) -> float:
+    """Approximate distance in meters between two points."""
+    dy, dx = _deltas(lat1_udeg, lng1_udeg, lat2_udeg, lng2_udeg)
+    return math.hypot(dy, dx) * METERS_PER_MICRODEGREE
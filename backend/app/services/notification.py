@@ -1,5 +1,5 @@
 import smtplib
-from datetime import datetime
+from datetime import datetime, timezone
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import List, Optional
@@ -66,7 +66,7 @@ class NotificationService:
         notification = db.query(Notification).filter(Notification.id == notification_id).first()
         if notification:
             notification.read = True
-            notification.read_at = datetime.now()
+            notification.read_at = datetime.now(timezone.utc)
             db.commit()
             db.refresh(notification)
         return notification
@@ -76,7 +76,7 @@ class NotificationService:
         """Mark all notifications as read for a user."""
         db.query(Notification).filter(
             Notification.user_id == user_id, Notification.read == False
-        ).update({"read": True, "read_at": datetime.now()})
+        ).update({"read": True, "read_at": datetime.now(timezone.utc)})
         db.commit()
 
     @staticmethod
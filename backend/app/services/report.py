@@ -1,6 +1,7 @@
 import csv
 from datetime import datetime, timedelta
 from io import BytesIO, StringIO
+from typing import Iterator
 
 from openpyxl import Workbook
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
@@ -10,18 +11,35 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.attendance import AttendanceRecord
+from app.models.school_class import SchoolClass
 from app.models.student import Student
+from app.schemas.report import (
+    REPORT_SUMMARY_LIST_ADAPTER,
+    AttendanceReportOut,
+    StudentAnalyticsRow,
+)
+from app.services.student_counters import absence_hours_by_id, total_absence_hours
+
+# Rows per chunk (and server-side cursor batch) for streamed CSV exports
+CSV_CHUNK_ROWS = 1000
 
 
 class ReportService:
     """Service layer for report generation."""
 
     @staticmethod
-    def generate_attendance_csv(db: Session, class_name: str = None, days: int = 30) -> BytesIO:
-        """Generate CSV attendance report."""
+    def iter_attendance_csv(
+        db: Session, class_name: str = None, days: int = 30, chunk_rows: int = CSV_CHUNK_ROWS
+    ) -> Iterator[str]:
+        """Yield the CSV attendance report in chunks of ``chunk_rows`` rows.
+
+        Rows are read through a server-side cursor (``yield_per``), so memory
+        stays bounded by one chunk however large the export is.
+        """
         cutoff_date = datetime.now() - timedelta(days=days)
 
         query = (
@@ -29,7 +47,7 @@ class ReportService:
                 Student.student_code,
                 Student.first_name,
                 Student.last_name,
-                Student.class_name,
+                SchoolClass.name.label("class_name"),
                 AttendanceRecord.status,
                 AttendanceRecord.marked_at,
                 AttendanceRecord.late_minutes,
@@ -37,6 +55,7 @@ class ReportService:
                 AttendanceRecord.percentage,
             )
             .select_from(Student)
+            .join(SchoolClass, SchoolClass.id == Student.class_id)
             .join(AttendanceRecord, AttendanceRecord.student_id == Student.id)
             .filter(AttendanceRecord.marked_at >= cutoff_date)
         )
@@ -44,7 +63,7 @@ class ReportService:
         if class_name:
             query = query.filter(Student.class_name == class_name)
 
-        records = query.order_by(Student.student_code, AttendanceRecord.marked_at).all()
+        records = query.order_by(Student.student_code, AttendanceRecord.marked_at).yield_per(chunk_rows)
 
         output = StringIO()
         writer = csv.writer(output)
@@ -62,7 +81,7 @@ class ReportService:
             ]
         )
 
-        for record in records:
+        for count, record in enumerate(records, start=1):
             writer.writerow(
                 [
                     record.student_code,
@@ -76,69 +95,68 @@ class ReportService:
                     record.percentage or 0,
                 ]
             )
+            if count % chunk_rows == 0:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+
+        yield output.getvalue()
 
+    @staticmethod
+    def generate_attendance_csv(db: Session, class_name: str = None, days: int = 30) -> BytesIO:
+        """Generate CSV attendance report."""
         bytes_output = BytesIO()
-        bytes_output.write(output.getvalue().encode("utf-8"))
+        for chunk in ReportService.iter_attendance_csv(db, class_name, days):
+            bytes_output.write(chunk.encode("utf-8"))
         bytes_output.seek(0)
         return bytes_output
 
     @staticmethod
     def generate_attendance_summary(
         db: Session, student_id: int = None, class_name: str = None, days: int = 30
-    ) -> dict:
-        """Generate attendance summary statistics."""
+    ) -> AttendanceReportOut:
+        """Generate attendance summary statistics.
+
+        Status counts are aggregated in SQL, one row per student, and the rows
+        are validated into ``ReportSummary`` with a single adapter call.
+        """
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        query = db.query(
-            Student.id,
-            Student.student_code,
-            Student.first_name,
-            Student.last_name,
-            Student.class_name,
-            Student.attendance_rate,
-        ).distinct()
+        total = func.count(AttendanceRecord.id)
+        present = total.filter(AttendanceRecord.status == "present")
+        query = (
+            db.query(
+                Student.student_code,
+                func.concat(Student.first_name, " ", Student.last_name).label("name"),
+                SchoolClass.name.label("class_"),
+                total.label("total_sessions"),
+                present.label("present"),
+                total.filter(AttendanceRecord.status == "absent").label("absent"),
+                total.filter(AttendanceRecord.status == "late").label("late"),
+                total.filter(AttendanceRecord.status == "excused").label("excused"),
+                func.coalesce(func.round(present * 100.0 / func.nullif(total, 0), 2), 0).label(
+                    "attendance_rate"
+                ),
+            )
+            .join(SchoolClass, SchoolClass.id == Student.class_id)
+            .outerjoin(
+                AttendanceRecord,
+                (AttendanceRecord.student_id == Student.id)
+                & (AttendanceRecord.marked_at >= cutoff_date),
+            )
+            .group_by(Student.id, SchoolClass.name)
+        )
 
         if student_id:
             query = query.filter(Student.id == student_id)
         elif class_name:
             query = query.filter(Student.class_name == class_name)
 
-        students = query.all()
-
-        summary = []
-        for student in students:
-            records = (
-                db.query(AttendanceRecord)
-                .filter(
-                    AttendanceRecord.student_id == student.id,
-                    AttendanceRecord.marked_at >= cutoff_date,
-                )
-                .all()
-            )
-
-            total = len(records)
-            present = sum(1 for r in records if r.status == "present")
-            absent = sum(1 for r in records if r.status == "absent")
-            late = sum(1 for r in records if r.status == "late")
-            excused = sum(1 for r in records if r.status == "excused")
-
-            rate = (present / total * 100) if total > 0 else 0
-
-            summary.append(
-                {
-                    "student_code": student.student_code,
-                    "name": f"{student.first_name} {student.last_name}",
-                    "class": student[4],  # class column from query
-                    "total_sessions": total,
-                    "present": present,
-                    "absent": absent,
-                    "late": late,
-                    "excused": excused,
-                    "attendance_rate": round(rate, 2),
-                }
-            )
-
-        return {"report_date": datetime.now().isoformat(), "students": summary}
+        # Pydantic dataclasses validate from mappings, not attributes
+        rows = [row._asdict() for row in query]
+        students = REPORT_SUMMARY_LIST_ADAPTER.validate_python(rows)
+        # Rows are already validated; skip re-validating them in the outer model
+        return AttendanceReportOut.model_construct(report_date=datetime.now(), students=students)
 
     @staticmethod
     def generate_student_report(db: Session, student_id: int) -> dict:
@@ -165,7 +183,7 @@ class ReportService:
             "enrollment_date": (
                 student.enrollment_date.isoformat() if student.enrollment_date else None
             ),
-            "total_absence_hours": student.total_absence_hours,
+            "total_absence_hours": total_absence_hours(student),
             "total_late_minutes": student.total_late_minutes,
             "attendance_rate": student.attendance_rate,
             "alert_level": student.alert_level,
@@ -190,6 +208,7 @@ class ReportService:
         total_students = len(students)
         high_risk_count = sum(1 for s in students if s.alert_level in ["high", "critical"])
         avg_attendance = sum(s.attendance_rate for s in students) / total_students
+        absence_hours = absence_hours_by_id(students)
 
         return {
             "class": class_name,
@@ -197,13 +216,13 @@ class ReportService:
             "high_risk_students": high_risk_count,
             "average_attendance_rate": round(avg_attendance, 2),
             "students": [
-                {
-                    "code": s.student_code,
-                    "name": f"{s.first_name} {s.last_name}",
-                    "attendance_rate": s.attendance_rate,
-                    "alert_level": s.alert_level,
-                    "absence_hours": s.total_absence_hours,
-                }
+                StudentAnalyticsRow(
+                    code=s.student_code,
+                    name=f"{s.first_name} {s.last_name}",
+                    attendance_rate=s.attendance_rate,
+                    alert_level=s.alert_level,
+                    absence_hours=absence_hours[s.id],
+                )
                 for s in students
             ],
             "report_generated": datetime.now().isoformat(),
@@ -219,7 +238,7 @@ class ReportService:
                 Student.student_code,
                 Student.first_name,
                 Student.last_name,
-                Student.class_name,
+                SchoolClass.name.label("class_name"),
                 AttendanceRecord.status,
                 AttendanceRecord.marked_at,
                 AttendanceRecord.late_minutes,
@@ -227,6 +246,7 @@ class ReportService:
                 AttendanceRecord.percentage,
             )
             .select_from(Student)
+            .join(SchoolClass, SchoolClass.id == Student.class_id)
             .join(AttendanceRecord, AttendanceRecord.student_id == Student.id)
             .filter(AttendanceRecord.marked_at >= cutoff_date)
         )
@@ -21,6 +21,7 @@ from app.models.smart_attendance import (
     SmartAttendanceLog,
 )
 from app.models.student import Student
+from app.services import geo
 from app.services.facial import verify_user_face_by_image
 
 settings = get_settings()
@@ -93,7 +94,7 @@ class SelfCheckinService:
         
         # Step 4: Check for duplicate check-in
         existing_checkin = (
-            db.query(SelfCheckin)
+            db.query(SelfCheckin.id)
             .filter(
                 SelfCheckin.attendance_session_id == att_session.id,
                 SelfCheckin.student_id == student_id,
@@ -381,12 +382,19 @@ class SelfCheckinService:
     ) -> Tuple[bool, float]:
         """
         Verify student is within allowed radius of classroom.
-        
+
+        The distance is the equirectangular approximation on microdegree
+        coordinates (see ``app.services.geo``).
+
         Returns: (is_valid, distance_meters)
         """
-        distance = SelfCheckinService.calculate_distance_meters(
-            checkin_lat, checkin_lng, class_lat, class_lng
+        points = (
+            geo.to_microdegrees(checkin_lat),
+            geo.to_microdegrees(checkin_lng),
+            geo.to_microdegrees(class_lat),
+            geo.to_microdegrees(class_lng),
         )
+        distance = geo.distance_meters(*points)
         return distance <= max_distance_meters, distance
 
     @staticmethod
@@ -113,7 +113,7 @@ class SmartAlertsService:
                 .filter(
                     AttendanceAlert.student_id == student_id,
                     AttendanceAlert.alert_type == "consecutive_absences",
-                    AttendanceAlert.acknowledged == False,
+                    AttendanceAlert.is_acknowledged == False,
                 )
                 .first()
             )
@@ -143,7 +143,7 @@ class SmartAlertsService:
         db: Session, trainer_id: Optional[int] = None, severity: Optional[str] = None
     ) -> List[AttendanceAlert]:
         """Get unacknowledged alerts, optionally filtered by trainer or severity."""
-        query = db.query(AttendanceAlert).filter(AttendanceAlert.acknowledged == False)
+        query = db.query(AttendanceAlert).filter(AttendanceAlert.is_acknowledged == False)
         
         if trainer_id:
             # Get sessions taught by this trainer
@@ -0,0 +1,191 @@
+"""Redis-buffered running counters on the students row.
+
+Marking an absence used to add the session hours to
+``students.total_absence_hours`` straight away, so every attendance event
+took a row lock on the student. When Redis is configured the delta is added
+to the ``student_counters:absence_hours`` hash instead (HINCRBY on the
+student id field), and ``flush_student_counters`` folds all pending deltas
+into ``students`` with a single UPDATE ... FROM (VALUES ...) on a schedule.
+
+Readers go through ``absence_hours_by_id`` / ``total_absence_hours``, which
+add the pending deltas to the stored column (one HMGET per page of
+students), so every endpoint reports the same total between flushes.
+
+The HINCRBY is only sent once the session's transaction commits, so a
+rolled-back absence never reaches the counter. Without Redis the increment
+is applied to the row directly.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import Integer, bindparam, column, event, func, update, values
+from sqlalchemy.orm import Session, object_session
+
+from app.models.student import Student
+from app.utils.cache import redis_cache
+
+logger = logging.getLogger(__name__)
+
+# Counter -> students column it is flushed into
+COUNTER_COLUMNS = {"absence_hours": "total_absence_hours"}
+
+# Session.info key holding the absence hours added in the session's current
+# transaction, by student id
+_PENDING_KEY = "student_absence_hours"
+
+
+def _key(field: str) -> str:
+    """Hash of pending deltas for one counter, keyed by student id."""
+    return f"student_counters:{field}"
+
+
+def _client():
+    return redis_cache.client if redis_cache and redis_cache.available() else None
+
+
+def add_absence_hours(student: Student, hours: int) -> None:
+    """Add ``hours`` to the student's absence total (buffered in Redis when available)."""
+    db = object_session(student)
+    if _client() is not None and db is not None:
+        # Sent to Redis once the transaction commits (_buffer_committed_hours)
+        queued: Dict[int, int] = db.info.setdefault(_PENDING_KEY, {})
+        queued[student.id] = queued.get(student.id, 0) + hours
+        return
+    student.total_absence_hours = (student.total_absence_hours or 0) + hours
+
+
+@event.listens_for(Session, "after_commit")
+def _buffer_committed_hours(db) -> None:
+    queued = db.info.pop(_PENDING_KEY, None)
+    if not queued:
+        return
+    client = _client()
+    try:
+        if client is None:
+            raise RuntimeError("Redis is not available")
+        # MULTI/EXEC, so a failure leaves no partial increments behind
+        pipe = client.pipeline(transaction=True)
+        for student_id, hours in queued.items():
+            pipe.hincrby(_key("absence_hours"), student_id, hours)
+        pipe.execute()
+        return
+    except Exception:
+        logger.warning("Redis unavailable, writing absence hours directly", exc_info=True)
+    students = Student.__table__
+    statement = (
+        update(students)
+        .where(students.c.id == bindparam("student_id"))
+        .values(total_absence_hours=func.coalesce(students.c.total_absence_hours, 0) + bindparam("hours"))
+    )
+    rows = [{"student_id": student_id, "hours": hours} for student_id, hours in queued.items()]
+    try:
+        # The session's transaction is over, so apply them on a connection of their own
+        with db.get_bind().begin() as connection:
+            connection.execute(statement, rows)
+    except Exception:
+        logger.exception("Lost committed absence hours %s", rows)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_queued_hours(db, previous_transaction) -> None:
+    db.info.pop(_PENDING_KEY, None)
+
+
+def pending_absence_hours(student_ids: Optional[Iterable[int]] = None) -> Dict[int, int]:
+    """Absence hours buffered in Redis and not yet flushed, by student id.
+
+    One HMGET for ``student_ids``, or one HGETALL for every student when None.
+    """
+    client = _client()
+    if client is None:
+        return {}
+    try:
+        if student_ids is None:
+            raw = client.hgetall(_key("absence_hours"))
+        else:
+            ids = list(student_ids)
+            if not ids:
+                return {}
+            raw = dict(zip(ids, client.hmget(_key("absence_hours"), ids)))
+    except Exception:
+        return {}
+    return {int(student_id): int(value) for student_id, value in raw.items() if value is not None}
+
+
+def absence_hours_by_id(students: Sequence[Student]) -> Dict[int, int]:
+    """Stored absence hours of ``students`` plus deltas still queued or buffered in Redis."""
+    buffered = pending_absence_hours(student.id for student in students)
+    totals = {}
+    for student in students:
+        db = object_session(student)
+        queued = db.info.get(_PENDING_KEY, {}).get(student.id, 0) if db is not None else 0
+        totals[student.id] = (
+            (student.total_absence_hours or 0) + queued + buffered.get(student.id, 0)
+        )
+    return totals
+
+
+def total_absence_hours(student: Student) -> int:
+    """Stored absence hours plus any delta still queued or buffered in Redis."""
+    return absence_hours_by_id([student])[student.id]
+
+
+def _flush_statement(rows: List[Dict[str, int]]):
+    """UPDATE students ... FROM (VALUES ...) adding each row's deltas."""
+    deltas = values(
+        column("id", Integer),
+        *(column(field, Integer) for field in COUNTER_COLUMNS),
+        name="deltas",
+    ).data([tuple(row[name] for name in ("id", *COUNTER_COLUMNS)) for row in rows])
+    return (
+        update(Student)
+        .where(Student.id == deltas.c.id)
+        .values(
+            {
+                getattr(Student, target): func.coalesce(getattr(Student, target), 0) + deltas.c[field]
+                for field, target in COUNTER_COLUMNS.items()
+            }
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def flush_student_counters(db: Session) -> int:
+    """Apply all buffered deltas to ``students`` in one statement; returns students updated."""
+    client = _client()
+    if client is None:
+        return 0
+
+    deltas: Dict[int, Dict[str, int]] = {}
+    for field in COUNTER_COLUMNS:
+        # Read and clear atomically so increments arriving meanwhile land in a fresh hash
+        pipe = client.pipeline(transaction=True)
+        pipe.hgetall(_key(field))
+        pipe.delete(_key(field))
+        raw, _ = pipe.execute()
+        for student_id, value in raw.items():
+            deltas.setdefault(int(student_id), {})[field] = int(value)
+
+    rows: List[Dict[str, int]] = [
+        {"id": student_id, **{field: counters.get(field, 0) for field in COUNTER_COLUMNS}}
+        for student_id, counters in deltas.items()
+    ]
+    if not rows:
+        return 0
+
+    statement = _flush_statement(rows)
+    try:
+        db.execute(statement)
+        db.commit()
+    except Exception:
+        db.rollback()
+        # Put the deltas back so the next flush retries them
+        pipe = client.pipeline()
+        for row in rows:
+            for field in COUNTER_COLUMNS:
+                if row[field]:
+                    pipe.hincrby(_key(field), row["id"], row[field])
+        pipe.execute()
+        raise
+    return len(rows)
@@ -1,11 +1,13 @@
 """Teams Integration Service - Microsoft Teams attendance tracking."""
 
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.db.bulk import bulk_insert
 from app.models.attendance import AttendanceRecord
 from app.models.session import Session as CourseSession
 from app.models.smart_attendance import (
@@ -14,10 +16,18 @@ from app.models.smart_attendance import (
     TeamsParticipation,
 )
 from app.models.student import Student
+from app.services.engagement import ENGAGEMENT_COLUMNS, engagement_scores
 
 settings = get_settings()
 
 
+def _utc_naive(value: datetime) -> datetime:
+    """``value`` as a naive UTC datetime, the convention of the participation columns."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 class TeamsIntegrationService:
     """
     Handle Microsoft Teams meeting integration for remote attendance.
@@ -33,34 +43,107 @@ class TeamsIntegrationService:
         """
         Calculate 0-100 engagement score based on participation metrics.
         
-        Weighted formula:
+        Weighted formula (see app.services.engagement):
         - Presence duration: 40%
         - Camera on time: 25%
         - Mic usage: 15%
         - Chat activity: 10%
         - Reactions: 10%
         """
-        if not participation.duration_minutes or participation.duration_minutes == 0:
-            return 0
-        
-        # Presence score (max 40 points)
-        presence_score = min(40, (participation.presence_percentage / 100) * 40)
-        
-        # Camera score (max 25 points)
-        camera_ratio = participation.camera_on_minutes / participation.duration_minutes
-        camera_score = min(25, camera_ratio * 25)
-        
-        # Mic score (max 15 points) - based on number of activations
-        mic_score = min(15, participation.mic_used_count * 2)
-        
-        # Chat score (max 10 points)
-        chat_score = min(10, participation.chat_messages_count * 2)
-        
-        # Reactions score (max 10 points)
-        reactions_score = min(10, participation.reactions_count * 2)
-        
-        total = int(presence_score + camera_score + mic_score + chat_score + reactions_score)
-        return min(100, total)
+        row = [getattr(participation, column) or 0 for column in ENGAGEMENT_COLUMNS]
+        return int(engagement_scores(np.array([row], dtype=np.float64))[0])
+
+    @staticmethod
+    def participation_rows(
+        attendance_session: AttendanceSession,
+        participants: Sequence[Dict[str, Any]],
+        session_minutes: int,
+        now: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Build scored ``teams_participation`` rows from an attendance report.
+
+        Each participant dict carries ``student_id``, ``teams_participant_id``,
+        ``join_time`` and optionally ``leave_time`` and the activity counters.
+        Presence is the time attended out of ``session_minutes``; engagement
+        scores are computed for the whole report in one pass.
+        """
+        now = _utc_naive(now or datetime.now(timezone.utc))
+        counters = ENGAGEMENT_COLUMNS[2:]
+        rows = []
+        durations = []
+        for participant in participants:
+            # Teams sends zoned timestamps; stored and compared as naive UTC
+            join_time = _utc_naive(participant["join_time"])
+            leave_time = participant.get("leave_time")
+            leave_time = _utc_naive(leave_time) if leave_time else None
+            duration = ((leave_time or now) - join_time).total_seconds() / 60
+            durations.append(duration)
+            row = {
+                "attendance_session_id": attendance_session.id,
+                "student_id": participant["student_id"],
+                "teams_meeting_id": attendance_session.teams_meeting_id or "",
+                "teams_participant_id": participant["teams_participant_id"],
+                "join_time": join_time,
+                "leave_time": leave_time,
+                "presence_percentage": min(100.0, round(duration / session_minutes * 100, 2)),
+            }
+            row.update({column: participant.get(column) or 0 for column in counters})
+            rows.append(row)
+
+        if rows:
+            metrics = np.array(
+                [
+                    [duration, row["presence_percentage"], *(row[column] for column in counters)]
+                    for duration, row in zip(durations, rows)
+                ],
+                dtype=np.float64,
+            )
+            for row, score in zip(rows, engagement_scores(metrics)):
+                row["engagement_score"] = int(score)
+        return rows
+
+    @staticmethod
+    def ingest_attendance_report(
+        db: Session,
+        attendance_session_id: int,
+        participants: Sequence[Dict[str, Any]],
+    ) -> Dict:
+        """Store the end-of-meeting attendance report for an attendance session.
+
+        The whole report is written with one ``bulk_insert`` (a single COPY for
+        large meetings) instead of one INSERT per participant. Rows already
+        stored for the session are replaced, so a redelivered report does not
+        duplicate them. Participants whose student does not exist are skipped
+        and their ids returned as ``skipped_student_ids``. The caller commits.
+        """
+        att_session = db.get(AttendanceSession, attendance_session_id)
+        if not att_session:
+            return {"success": False, "error": "Attendance session not found"}
+
+        course_session = db.get(CourseSession, att_session.session_id)
+        session_minutes = (course_session.duration_minutes if course_session else None) or 90
+
+        requested = {participant["student_id"] for participant in participants}
+        known = {
+            student_id
+            for (student_id,) in db.query(Student.id).filter(Student.id.in_(requested))
+        }
+        rows = TeamsIntegrationService.participation_rows(
+            att_session,
+            [participant for participant in participants if participant["student_id"] in known],
+            session_minutes,
+        )
+
+        db.query(TeamsParticipation).filter(
+            TeamsParticipation.attendance_session_id == attendance_session_id
+        ).delete(synchronize_session=False)
+        count = bulk_insert(db, TeamsParticipation, rows)
+
+        return {
+            "success": True,
+            "participants": count,
+            "skipped_student_ids": sorted(requested - known),
+        }
 
     @staticmethod
     def sync_teams_participant(
@@ -7,6 +7,7 @@ from app.models.trainer import Trainer
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.services.auth import get_password_hash
+from app.services.student_counters import total_absence_hours
 
 
 class UserService:
@@ -113,11 +114,12 @@ class UserService:
         if not student:
             return None
 
-        if student.total_absence_hours >= 20:
+        absence_hours = total_absence_hours(student)
+        if absence_hours >= 20:
             student.alert_level = "critical"
-        elif student.total_absence_hours >= 10:
+        elif absence_hours >= 10:
             student.alert_level = "high"
-        elif student.total_absence_hours >= 5:
+        elif absence_hours >= 5:
             student.alert_level = "medium"
         else:
             student.alert_level = "low"
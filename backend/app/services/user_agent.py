@@ -0,0 +1,78 @@
+"""Resolve User-Agent strings to rows of the ``user_agents`` lookup table."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+# Recently resolved hash -> id, so repeat clients skip the lookup round trip.
+# Only ids whose transaction committed are cached: an id inserted by a
+# transaction that later rolls back no longer exists.
+_CACHE_SIZE = 1024
+_ids: "OrderedDict[bytes, int]" = OrderedDict()
+# Sync routes run in a threadpool; eviction can race a lookup's move_to_end
+_ids_lock = threading.Lock()
+
+# Session.info key holding the ids resolved in the session's current transaction
+_PENDING_KEY = "user_agent_ids"
+
+
+def user_agent_hash(ua: str) -> bytes:
+    """16-byte key for ``ua`` (matches the backfill in the user_agents migration)."""
+    return hashlib.sha256(ua.encode("utf-8")).digest()[:16]
+
+
+def get_user_agent_id(db: Session, ua: Optional[str]) -> Optional[int]:
+    """Return the ``user_agents.id`` for ``ua``, inserting it if new."""
+    if not ua:
+        return None
+
+    key = user_agent_hash(ua)
+    with _ids_lock:
+        ua_id = _ids.get(key)
+        if ua_id is not None:
+            _ids.move_to_end(key)
+    if ua_id is not None:
+        return ua_id
+
+    pending: Dict[bytes, int] = db.info.setdefault(_PENDING_KEY, {})
+    ua_id = pending.get(key)
+    if ua_id is not None:
+        return ua_id
+
+    ua_id = db.execute(
+        text(
+            "INSERT INTO user_agents (ua_hash, ua_text) VALUES (:hash, :ua) "
+            "ON CONFLICT (ua_hash) DO NOTHING RETURNING id"
+        ),
+        {"hash": key, "ua": ua},
+    ).scalar()
+    if ua_id is None:
+        ua_id = db.execute(
+            text("SELECT id FROM user_agents WHERE ua_hash = :hash"), {"hash": key}
+        ).scalar_one()
+
+    # Cached process-wide once the transaction commits
+    pending[key] = ua_id
+    return ua_id
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_committed_ids(db) -> None:
+    committed = db.info.pop(_PENDING_KEY, {})
+    if not committed:
+        return
+    with _ids_lock:
+        for key, ua_id in committed.items():
+            _ids[key] = ua_id
+            _ids.move_to_end(key)
+            if len(_ids) > _CACHE_SIZE:
+                _ids.popitem(last=False)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending_ids(db, previous_transaction) -> None:
+    db.info.pop(_PENDING_KEY, None)
@@ -4,14 +4,15 @@ Webhook Service - Trigger external webhooks for events
 
 import hashlib
 import hmac
-import json
 import time
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import httpx
+import orjson
 from sqlalchemy.orm import Session
 
+from app.db.bulk import BatchInserter
 from app.models.webhook import Webhook, WebhookLog
 
 
@@ -42,17 +43,35 @@ class WebhookService:
             Webhook.is_active == True,
         ).all()
         
+        # Deliveries and retry delays can take minutes: detach the webhooks and
+        # end the transaction so no connection is held while they run
         for webhook in webhooks:
-            await WebhookService._execute_webhook(db, webhook, payload)
+            db.expunge(webhook)
+        db.commit()
+        
+        logs: List[Dict[str, Any]] = []
+        try:
+            for webhook in webhooks:
+                await WebhookService._execute_webhook(db, webhook, payload, logs)
+        finally:
+            # One short transaction for the delivery logs (including retries)
+            # and the updated webhook statistics, even if a delivery raised
+            with BatchInserter(db, WebhookLog) as inserter:
+                for row in logs:
+                    inserter.add(row)
+            for webhook in webhooks:
+                db.merge(webhook)
+            db.commit()
     
     @staticmethod
     async def _execute_webhook(
         db: Session,
         webhook: Webhook,
         payload: Dict[str, Any],
+        logs: List[Dict[str, Any]],
         retry_count: int = 0,
     ):
-        """Execute a single webhook."""
+        """Execute a single webhook, appending a WebhookLog row per attempt to ``logs``."""
         
         start_time = time.time()
         
@@ -70,12 +89,16 @@ class WebhookService:
             if webhook.custom_headers:
                 headers.update(webhook.custom_headers)
             
-            # Add HMAC signature if secret key is configured
+            # Serialize once: the signature covers the exact bytes sent
+            body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            
+            # Add body signature if secret key is configured
             if webhook.secret_key:
                 signature = WebhookService._generate_signature(
-                    payload, webhook.secret_key
+                    body, webhook.secret_key, webhook.signature_algo
                 )
                 headers["X-Webhook-Signature"] = signature
+                headers["X-Webhook-Signature-Algorithm"] = webhook.signature_algo
             
             # Add custom auth header if configured
             if webhook.auth_header:
@@ -85,7 +108,7 @@ class WebhookService:
             async with httpx.AsyncClient(timeout=30.0) as client:
                 response = await client.post(
                     webhook.url,
-                    json=payload,
+                    content=body,
                     headers=headers,
                 )
             
@@ -94,18 +117,18 @@ class WebhookService:
             # Log success
             success = 200 <= response.status_code < 300
             
-            log = WebhookLog(
-                webhook_id=webhook.id,
-                event_type=webhook.event_type,
-                request_payload=payload,
-                request_headers=headers,
-                response_status_code=response.status_code,
-                response_body=response.text[:1000],  # Limit to 1000 chars
-                response_time_ms=response_time_ms,
-                success=success,
-                retry_count=retry_count,
-            )
-            db.add(log)
+            logs.append({
+                "webhook_id": webhook.id,
+                "event_type": webhook.event_type,
+                "request_payload": payload,
+                "request_headers": headers,
+                "response_status_code": response.status_code,
+                "response_body": response.text[:1000],  # Limit to 1000 chars
+                "response_time_ms": response_time_ms,
+                "success": success,
+                "error_message": None,
+                "retry_count": retry_count,
+            })
             
             # Update webhook statistics
             webhook.total_calls += 1
@@ -116,55 +139,54 @@ class WebhookService:
             webhook.last_called_at = datetime.utcnow()
             webhook.last_status_code = response.status_code
             
-            db.commit()
-            
             # Retry on failure
             if not success and retry_count < webhook.max_retries:
                 import asyncio
                 await asyncio.sleep(webhook.retry_delay_seconds)
                 await WebhookService._execute_webhook(
-                    db, webhook, payload, retry_count + 1
+                    db, webhook, payload, logs, retry_count + 1
                 )
         
         except Exception as e:
             response_time_ms = int((time.time() - start_time) * 1000)
             
             # Log error
-            log = WebhookLog(
-                webhook_id=webhook.id,
-                event_type=webhook.event_type,
-                request_payload=payload,
-                response_time_ms=response_time_ms,
-                success=False,
-                error_message=str(e),
-                retry_count=retry_count,
-            )
-            db.add(log)
+            logs.append({
+                "webhook_id": webhook.id,
+                "event_type": webhook.event_type,
+                "request_payload": payload,
+                "request_headers": None,
+                "response_status_code": None,
+                "response_body": None,
+                "response_time_ms": response_time_ms,
+                "success": False,
+                "error_message": str(e),
+                "retry_count": retry_count,
+            })
             
             webhook.total_calls += 1
             webhook.failed_calls += 1
             webhook.last_called_at = datetime.utcnow()
             
-            db.commit()
-            
             # Retry on error
             if retry_count < webhook.max_retries:
                 import asyncio
                 await asyncio.sleep(webhook.retry_delay_seconds)
                 await WebhookService._execute_webhook(
-                    db, webhook, payload, retry_count + 1
+                    db, webhook, payload, logs, retry_count + 1
                 )
     
     @staticmethod
-    def _generate_signature(payload: Dict[str, Any], secret: str) -> str:
-        """Generate HMAC signature for webhook verification."""
-        payload_str = json.dumps(payload, sort_keys=True)
-        signature = hmac.new(
-            secret.encode('utf-8'),
-            payload_str.encode('utf-8'),
-            hashlib.sha256,
-        ).hexdigest()
-        return signature
+    def _generate_signature(body: bytes, secret: str, algo: str = "hmac-sha256") -> str:
+        """Generate the hex body signature for webhook verification.
+        
+        ``blake2b`` is keyed BLAKE2b (a single-pass MAC, no HMAC wrapper);
+        anything else is HMAC-SHA256.
+        """
+        key = secret.encode('utf-8')
+        if algo == "blake2b":
+            return hashlib.blake2b(body, key=key, digest_size=32).hexdigest()
+        return hmac.digest(key, body, "sha256").hex()
     
     @staticmethod
     def _apply_template(
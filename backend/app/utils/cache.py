@@ -59,6 +59,11 @@ class RedisCache:
     def available(self) -> bool:
         return self._client is not None
 
+    @property
+    def client(self):
+        """Underlying redis client (None when redis is unavailable)."""
+        return self._client
+
     def get(self, key: str) -> Any:
         if not self._client:
             return None
@@ -2,10 +2,13 @@
 Uses simple threading; consider APScheduler or Celery for production.
 """
 
+import logging
 import threading
 import time
 from typing import Callable, Dict
 
+logger = logging.getLogger(__name__)
+
 
 class SimpleScheduler:
     def __init__(self):
@@ -39,8 +42,8 @@ class SimpleScheduler:
                     try:
                         job["func"]()
                     except Exception:
-                        # log or handle errors in production
-                        pass
+                        # Keep the loop alive for the other jobs; the job retries next interval
+                        logger.exception("Scheduled job %s failed", job_id)
                     job["last_run"] = now
             time.sleep(1)
 
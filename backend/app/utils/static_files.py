@@ -0,0 +1,60 @@
+"""StaticFiles variant that keeps small files (face thumbnails) in memory.
+
+Starlette's FileResponse streams every file through the thread pool in
+chunks. Face images served from /storage are small and requested repeatedly,
+so their bytes are cached in an LRU keyed by (path, mtime, size); a changed
+file gets a new key and the stale entry ages out. ETag/If-None-Match handling
+still comes from StaticFiles, which answers 304 before any bytes are read.
+
+In production, serving /storage directly from the reverse proxy (e.g. an
+nginx ``alias /app/storage/``) avoids the ASGI app entirely.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Tuple
+
+import anyio
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+CacheKey = Tuple[str, int, int]
+
+
+class CachedStaticFiles(StaticFiles):
+    """Serve static files, caching small ones in an in-memory LRU."""
+
+    def __init__(self, *args, max_entries: int = 1024, max_file_size: int = 64 * 1024, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_entries = max_entries
+        self.max_file_size = max_file_size
+        self._cache: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if (
+            not isinstance(response, FileResponse)
+            or scope["method"] != "GET"
+            or response.stat_result is None
+            or response.stat_result.st_size > self.max_file_size
+            or any(name == b"range" for name, _ in scope.get("headers", []))
+        ):
+            return response
+
+        stat_result = response.stat_result
+        key = (str(response.path), stat_result.st_mtime_ns, stat_result.st_size)
+        content = self._cache.get(key)
+        if content is None:
+            content = await anyio.to_thread.run_sync(Path(response.path).read_bytes)
+            self._cache[key] = content
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+
+        return Response(
+            content=content,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+        )
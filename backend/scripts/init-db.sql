@@ -1,7 +1,8 @@
--- Initialize pgvector extension
+-- Initialize pgvector and trigram search extensions
 CREATE EXTENSION IF NOT EXISTS vector;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
--- Verify extension is installed
-SELECT * FROM pg_extension WHERE extname = 'vector';
+-- Verify extensions are installed
+SELECT * FROM pg_extension WHERE extname IN ('vector', 'pg_trgm');
 
 -- Create initial database schema will be handled by Alembic migrations
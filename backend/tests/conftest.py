@@ -17,6 +17,7 @@ def db_session():
     # cannot compile.
     from app.models.attendance import AttendanceRecord
     from app.models.notification import Notification
+    from app.models.school_class import SchoolClass
     from app.models.session import Session
     from app.models.student import Student
     from app.models.trainer import Trainer
@@ -25,6 +26,7 @@ def db_session():
     tables = [
         User.__table__,
         Trainer.__table__,
+        SchoolClass.__table__,
         Student.__table__,
         Session.__table__,
         AttendanceRecord.__table__,
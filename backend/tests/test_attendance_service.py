@@ -52,6 +52,10 @@ def test_mark_attendance_creates_record(db_session, test_student):
     assert record.status == "present"
     assert record.marked_via == "facial"
 
+    # Stored as basis points, read back as a float
+    db_session.refresh(record)
+    assert record.facial_confidence == 0.95
+
 
 def test_mark_attendance_returns_existing(db_session, test_student):
     """Test marking attendance returns existing record if already marked."""
@@ -59,3 +59,12 @@ async def test_root_endpoint():
     data = response.json()
     assert "message" in data
     assert "version" in data
+
+
+def test_health_reports_ready_after_startup():
+    """Startup schedules subscriber init; /health is healthy once it completes"""
+    from app.main import app
+
+    with TestClient(app) as client:
+        data = client.get("/health").json()
+        assert data["event_subscribers"] == "ready"
@@ -0,0 +1,88 @@
+"""Tests for bulk log inserts."""
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+
+from app.db.bulk import BatchInserter, bulk_insert, copy_rows, rows_per_statement
+from app.models.attendance import AttendanceRecord
+from app.models.notification import Notification
+
+
+def test_bulk_insert_small_batch_uses_executemany(db_session):
+    rows = [
+        {"user_id": 1, "user_type": "student", "title": f"t{i}", "message": "m", "notification_type": "system"}
+        for i in range(3)
+    ]
+
+    assert bulk_insert(db_session, Notification, rows) == 3
+    db_session.commit()
+
+    stored = db_session.query(Notification).order_by(Notification.id).all()
+    assert [n.title for n in stored] == ["t0", "t1", "t2"]
+    assert stored[0].priority == "medium"
+
+
+def test_bulk_insert_empty_batch(db_session):
+    assert bulk_insert(db_session, Notification, []) == 0
+
+
+def test_rows_per_statement_respects_bind_limit():
+    columns = len(Notification.__table__.columns)
+    assert rows_per_statement(Notification) == min(10_000, 65535 // columns)
+
+
+def test_batch_inserter_flushes_full_batches_and_remainder(db_session):
+    with BatchInserter(db_session, Notification, batch_size=2) as batch:
+        for i in range(5):
+            batch.add(
+                {"user_id": 1, "user_type": "student", "title": f"t{i}", "message": "m", "notification_type": "system"}
+            )
+        assert batch.written == 4
+    db_session.commit()
+
+    assert batch.written == 5
+    assert db_session.query(Notification).count() == 5
+
+
+def test_bulk_insert_stamps_created_at_once_per_batch(db_session):
+    rows = [
+        {"user_id": 1, "user_type": "student", "title": f"t{i}", "message": "m", "notification_type": "system"}
+        for i in range(3)
+    ]
+
+    bulk_insert(db_session, Notification, rows)
+    db_session.commit()
+
+    stamps = {n.created_at for n in db_session.query(Notification).all()}
+    assert len(stamps) == 1 and None not in stamps
+    assert "created_at" not in rows[0]
+
+
+def test_copy_rows_apply_column_bind_processing():
+    table = AttendanceRecord.__table__
+    names = ["session_id", "student_id", "status", "facial_confidence", "location_data"]
+    rows = [
+        {"session_id": 1, "student_id": 2, "facial_confidence": 0.87, "location_data": {"lat": 33.5}},
+        {"session_id": 1, "student_id": 3, "status": "absent"},
+    ]
+
+    copied = list(copy_rows(table, names, rows, {"status": "present"}, PGDialect_psycopg()))
+
+    # BasisPoints stores the 0..1 ratio as SMALLINT basis points; JSON is encoded text
+    assert copied == [
+        [1, 2, "present", 8700, '{"lat":33.5}'],
+        [1, 3, "absent", None, None],
+    ]
+
+
+def test_copy_rows_match_executemany_values(db_session):
+    rows = [
+        {"session_id": 1, "student_id": i, "status": "present", "facial_confidence": 0.8765}
+        for i in range(3)
+    ]
+
+    bulk_insert(db_session, AttendanceRecord, rows)
+    db_session.commit()
+
+    stored = db_session.execute(text("SELECT facial_confidence FROM attendance_records")).scalars()
+    copied = copy_rows(AttendanceRecord.__table__, ["facial_confidence"], rows, {}, PGDialect_psycopg())
+    assert list(stored) == [values[0] for values in copied] == [8765, 8765, 8765]
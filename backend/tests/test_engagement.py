@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.services.engagement import engagement_scores
+from app.services.teams_integration import TeamsIntegrationService
+
+
+def test_engagement_scores_batch():
+    metrics = np.array(
+        [
+            # duration, presence %, camera, mic, chat, reactions
+            [90, 100, 90, 10, 10, 10],
+            [90, 50, 45, 1, 2, 0],
+            [0, 100, 90, 10, 10, 10],
+            [60, np.nan, 0, 0, 0, 3],
+        ]
+    )
+
+    assert engagement_scores(metrics).tolist() == [100, 38, 0, 6]
+
+
+def test_calculate_engagement_score_matches_batch():
+    participation = SimpleNamespace(
+        duration_minutes=90,
+        presence_percentage=Decimal("50.00"),
+        camera_on_minutes=45,
+        mic_used_count=1,
+        chat_messages_count=2,
+        reactions_count=None,
+    )
+
+    assert TeamsIntegrationService.calculate_engagement_score(participation) == 38
+
+
+def test_participation_rows_scores_report():
+    attendance_session = SimpleNamespace(id=7, teams_meeting_id="meeting-1")
+    joined = datetime(2026, 10, 17, 9, 0)
+    participants = [
+        {
+            "student_id": 1,
+            "teams_participant_id": "p1",
+            "join_time": joined,
+            "leave_time": joined + timedelta(minutes=90),
+            "camera_on_minutes": 90,
+            "mic_used_count": 10,
+            "chat_messages_count": 10,
+            "reactions_count": 10,
+        },
+        {
+            "student_id": 2,
+            "teams_participant_id": "p2",
+            "join_time": joined,
+            "leave_time": joined + timedelta(minutes=45),
+            "camera_on_minutes": 45,
+            "mic_used_count": 1,
+            "chat_messages_count": 2,
+        },
+    ]
+
+    rows = TeamsIntegrationService.participation_rows(attendance_session, participants, session_minutes=90)
+
+    assert [row["presence_percentage"] for row in rows] == [100.0, 50.0]
+    assert [row["engagement_score"] for row in rows] == [100, 51]
+    assert rows[1]["reactions_count"] == 0
+    assert rows[0]["teams_meeting_id"] == "meeting-1"
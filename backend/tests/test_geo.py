@@ -0,0 +1,38 @@
+import math
+
+from app.db.types import Microdegrees
+from app.services import geo
+from app.services.self_checkin import SelfCheckinService
+
+
+def _haversine(lat1, lng1, lat2, lng2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin(math.radians(lat2 - lat1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2
+    )
+    return 2 * geo.EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
+
+
+def test_distance_matches_haversine_at_classroom_scale():
+    classroom = (33.589886, -7.603869)
+    for checkin in [(33.590786, -7.603869), (33.589886, -7.601869), (33.592886, -7.596869)]:
+        points = [geo.to_microdegrees(v) for v in (*checkin, *classroom)]
+        assert abs(geo.distance_meters(*points) - _haversine(*checkin, *classroom)) < 1.0
+
+
+def test_verify_location_radius():
+    classroom = (33.589886, -7.603869)
+    # ~100 m north
+    north = (33.590786, -7.603869)
+
+    assert SelfCheckinService.verify_location(*north, *classroom, 101)[0]
+    assert not SelfCheckinService.verify_location(*north, *classroom, 99)[0]
+
+
+def test_microdegrees_round_trip():
+    column = Microdegrees()
+
+    assert column.process_bind_param(-7.6038694, None) == -7603869
+    assert column.process_result_value(-7603869, None) == -7.603869
+    assert column.process_bind_param(None, None) is None
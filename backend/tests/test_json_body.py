@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.utils.deps import get_current_user, get_db
+
+SESSIONS = "/api/smart-attendance/sessions"
+TEAMS_REPORT = "/api/smart-attendance/teams/{attendance_session_id}/attendance-report"
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1, role="trainer")
+    app.dependency_overrides[get_db] = lambda: None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _fields(response):
+    # The app's validation handler reports each error location as "body -> ..."
+    return [error["field"] for error in response.json()["details"]]
+
+
+def test_invalid_field_is_reported_under_body(client):
+    response = client.post(SESSIONS, json={"session_id": "abc", "mode": "self_checkin"})
+
+    assert response.status_code == 422
+    assert _fields(response) == ["body -> self_checkin -> session_id"]
+
+
+def test_missing_variant_field_is_reported_under_body(client):
+    response = client.post(SESSIONS, json={"session_id": 1, "mode": "teams_auto"})
+
+    assert response.status_code == 422
+    assert _fields(response) == ["body -> teams_auto -> teams_meeting_id"]
+
+
+def test_malformed_json_is_reported_under_body(client):
+    response = client.patch(
+        f"{SESSIONS}/1", content=b"{not json", headers={"content-type": "application/json"}
+    )
+
+    assert response.status_code == 422
+    assert [field.split(" -> ")[0] for field in _fields(response)] == ["body"]
+
+
+def test_list_body_item_errors_carry_the_index(client):
+    response = client.post(TEAMS_REPORT.format(attendance_session_id=1), json=[{"student_id": 1}])
+
+    assert response.status_code == 422
+    fields = _fields(response)
+    assert fields and all(field.startswith("body -> 0 -> ") for field in fields)
+
+
+def test_json_body_routes_document_their_request_body():
+    schema = app.openapi()
+    paths = schema["paths"]
+    components = schema["components"]["schemas"]
+
+    create = paths[SESSIONS]["post"]["requestBody"]
+    assert create["required"] is True
+    mapping = create["content"]["application/json"]["schema"]["discriminator"]["mapping"]
+    assert mapping["teams_auto"] == "#/components/schemas/TeamsAutoModeCreate"
+    assert "teams_meeting_id" in components["TeamsAutoModeCreate"]["required"]
+
+    update = paths[f"{SESSIONS}/{{session_id}}"]["patch"]["requestBody"]
+    assert "checkin_window_minutes" in update["content"]["application/json"]["schema"]["properties"]
+
+    report = paths[TEAMS_REPORT]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    assert report == {"type": "array", "items": {"$ref": "#/components/schemas/TeamsParticipantReport"}}
+    assert "TeamsParticipantReport" in components
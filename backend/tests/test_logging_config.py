@@ -0,0 +1,83 @@
+"""Tests for logging handlers and formatters."""
+import json
+import logging
+import re
+
+from app.core.logging_config import BatchedRotatingFileHandler, JsonFormatter
+
+
+def _record(msg, level=logging.INFO, **extra):
+    record = logging.LogRecord("api", level, __file__, 1, msg, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_batched_handler_buffers_until_batch_size(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BatchedRotatingFileHandler(path, batch_size=3, flush_interval=60)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    handler.handle(_record("one"))
+    handler.handle(_record("two"))
+    assert path.read_text() == ""
+
+    handler.handle(_record("three"))
+    assert path.read_text().splitlines() == ["one", "two", "three"]
+    handler.close()
+
+
+def test_batched_handler_flushes_errors_and_on_close(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BatchedRotatingFileHandler(path, batch_size=100, flush_interval=60)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    handler.handle(_record("info"))
+    handler.handle(_record("boom", level=logging.ERROR))
+    assert path.read_text().splitlines() == ["info", "boom"]
+
+    handler.handle(_record("tail"))
+    handler.close()
+    assert path.read_text().splitlines()[-1] == "tail"
+
+
+def test_batched_handler_rotates(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BatchedRotatingFileHandler(
+        path, maxBytes=64, backupCount=2, batch_size=2, flush_interval=60
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    for i in range(8):
+        handler.handle(_record(f"line-{i:02d}-" + "x" * 10))
+    handler.close()
+
+    assert (tmp_path / "app.log.1").exists()
+
+
+def test_json_formatter_includes_extra_fields():
+    record = _record("hello", endpoint="/api/x", status_code=200)
+    data = json.loads(JsonFormatter().format(record))
+
+    assert data["message"] == "hello"
+    assert data["endpoint"] == "/api/x"
+    assert data["status_code"] == 200
+    assert "user_id" not in data
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}", data["timestamp"])
+
+
+def test_setup_logging_buffers_file_output(tmp_path, monkeypatch):
+    from app.core import logging_config
+
+    monkeypatch.setattr(logging_config, "LOGS_DIR", tmp_path)
+    logging_config.setup_logging(include_console=False, include_file=True)
+    try:
+        logging.getLogger("app").info("buffered line")
+        assert "buffered line" not in (tmp_path / "app.log").read_text()
+
+        logging_config.flush_logging()
+        assert "buffered line" in (tmp_path / "app.log").read_text()
+    finally:
+        logging_config.stop_logging()
+        for handler in logging.getLogger().handlers[:]:
+            logging.getLogger().removeHandler(handler)
+            handler.close()
@@ -0,0 +1,146 @@
+"""Tests for the messages routes and who may open a thread."""
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.api.routes.messages import get_message_threads, get_thread_messages, send_message
+from app.models.message import Message
+from app.models.user import User
+
+# SQLite stand-in for the partitioned messages table: the model's generated
+# column uses PostgreSQL syntax. created_at defaults to the format SQLAlchemy
+# binds, so the (id, created_at) identity can be refreshed after an insert.
+MESSAGES_DDL = """
+CREATE TABLE messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sender_id INTEGER NOT NULL,
+    recipient_id INTEGER NOT NULL,
+    participants VARCHAR(32) GENERATED ALWAYS AS (
+        min(sender_id, recipient_id) || '-' || max(sender_id, recipient_id)
+    ) STORED,
+    content TEXT NOT NULL,
+    read BOOLEAN NOT NULL DEFAULT 0,
+    created_at DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f000', 'now'))
+)
+"""
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    User.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(text(MESSAGES_DDL))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def users(db):
+    users = {
+        name: User(username=name, email=f"{name}@test.com", password_hash="x", role=role)
+        for name, role in [
+            ("support", "admin"),
+            ("other_admin", "admin"),
+            ("trainer", "trainer"),
+            ("student", "student"),
+            ("classmate", "student"),
+        ]
+    }
+    db.add_all(users.values())
+    db.commit()
+    return users
+
+
+def _message(db, sender, recipient, content, minute, read=False):
+    db.add(
+        Message(
+            sender_id=sender.id,
+            recipient_id=recipient.id,
+            content=content,
+            read=read,
+            created_at=datetime(2026, 10, 17, 9, minute),
+        )
+    )
+    db.commit()
+
+
+def test_threads_offer_the_support_admin_before_any_message(db, users):
+    threads = get_message_threads(db=db, current_user=users["student"])
+
+    assert [(t["id"], t["participant_role"]) for t in threads] == [(users["support"].id, "admin")]
+
+
+def test_threads_group_messages_by_partner(db, users):
+    student, trainer, classmate = users["student"], users["trainer"], users["classmate"]
+    _message(db, trainer, student, "Bonjour", 0)
+    _message(db, student, trainer, "Merci", 1, read=True)
+    _message(db, classmate, student, "Salut", 2)
+    _message(db, classmate, student, "Tu viens ?", 3)
+
+    threads = get_message_threads(db=db, current_user=student)
+
+    assert [(t["id"], t["last_message"], t["unread_count"]) for t in threads] == [
+        (classmate.id, "Tu viens ?", 2),
+        (trainer.id, "Merci", 1),
+    ]
+
+
+def test_reading_a_thread_marks_incoming_messages_read(db, users):
+    student, trainer = users["student"], users["trainer"]
+    _message(db, trainer, student, "Bonjour", 0)
+    _message(db, student, trainer, "Merci", 1)
+
+    messages = get_thread_messages(trainer.id, db=db, current_user=student)
+
+    assert [(m["sender_name"], m["content"]) for m in messages] == [
+        ("trainer", "Bonjour"),
+        ("student", "Merci"),
+    ]
+    assert db.query(Message).filter(Message.read.is_(False)).count() == 1
+    assert get_message_threads(db=db, current_user=student)[0]["unread_count"] == 0
+
+
+def test_send_replies_in_an_existing_thread(db, users):
+    student, trainer = users["student"], users["trainer"]
+    _message(db, trainer, student, "Bonjour", 0)
+
+    sent = send_message({"thread_id": trainer.id, "content": " Merci "}, db=db, current_user=student)
+
+    msg = db.query(Message).filter(Message.id == sent["id"]).one()
+    assert (msg.sender_id, msg.recipient_id, msg.content) == (student.id, trainer.id, "Merci")
+    assert msg.participants == f"{trainer.id}-{student.id}"
+
+
+def test_send_opens_the_support_thread(db, users):
+    student, support = users["student"], users["support"]
+
+    send_message({"thread_id": support.id, "content": "Aide"}, db=db, current_user=student)
+
+    messages = get_thread_messages(support.id, db=db, current_user=student)
+    assert [m["content"] for m in messages] == ["Aide"]
+
+
+@pytest.mark.parametrize("partner", ["trainer", "classmate", "other_admin", "student", "missing"])
+def test_threads_without_messages_are_not_found(db, users, partner):
+    student = users["student"]
+    thread_id = users[partner].id if partner in users else 999
+
+    with pytest.raises(HTTPException) as read:
+        get_thread_messages(thread_id, db=db, current_user=student)
+    with pytest.raises(HTTPException) as send:
+        send_message({"thread_id": thread_id, "content": "Bonjour"}, db=db, current_user=student)
+
+    assert read.value.status_code == send.value.status_code == 404
+    assert db.query(Message).count() == 0
+
+
+def test_send_requires_thread_and_content(db, users):
+    with pytest.raises(HTTPException) as exc:
+        send_message({"thread_id": users["support"].id, "content": "  "}, db=db, current_user=users["student"])
+
+    assert exc.value.status_code == 400
@@ -0,0 +1,121 @@
+"""Tests for the in-process metrics collector."""
+import time
+from datetime import timedelta
+
+from app.core.monitoring import MetricsCollector, RequestMetric
+
+
+def _metric(endpoint, status_code, duration_ms, age=timedelta(0)):
+    return RequestMetric(
+        timestamp_ns=time.time_ns() - int(age.total_seconds() * 1_000_000_000),
+        endpoint=endpoint,
+        method="GET",
+        status_code=status_code,
+        duration_ms=duration_ms,
+    )
+
+
+def test_request_stats_aggregates_by_endpoint():
+    collector = MetricsCollector()
+    collector.record_request(_metric("/a", 200, 10.0))
+    collector.record_request(_metric("/a", 200, 30.0))
+    collector.record_request(_metric("/b", 404, 5.0))
+    collector.record_request(_metric("/old", 200, 99.0, age=timedelta(hours=3)))
+    collector.flush()
+
+    stats = collector.get_request_stats(hours=1)
+
+    assert stats["total_requests"] == 3
+    assert stats["status_codes"] == {200: 2, 404: 1}
+    assert stats["endpoints"]["/a"] == {"count": 2, "avg_duration": 20.0}
+    assert "/old" not in stats["endpoints"]
+    assert stats["min_duration_ms"] == 5.0
+    assert stats["max_duration_ms"] == 30.0
+
+
+def test_request_stats_empty_window():
+    collector = MetricsCollector()
+    collector.record_request(_metric("/old", 200, 1.0, age=timedelta(hours=3)))
+    collector.flush()
+
+    assert collector.get_request_stats(hours=1) == {}
+
+
+def test_error_stats_and_cleanup():
+    collector = MetricsCollector(retention_days=1)
+    for _ in range(3):
+        collector.record_request(_metric("/fail", 500, 1.0))
+    collector.record_request(_metric("/ok", 200, 1.0))
+    collector.record_request(_metric("/stale", 500, 1.0, age=timedelta(days=2)))
+    collector.flush()
+
+    errors = collector.get_error_stats(hours=24)
+    assert errors["total_errors"] == 3
+    assert errors["error_endpoints"] == {"/fail": 3}
+    assert sum(errors["errors_by_hour"].values()) == 3
+
+    collector.cleanup_old_metrics()
+    assert len(collector.requests) == 4
+
+
+def test_buffer_grows_past_initial_capacity():
+    collector = MetricsCollector()
+    for i in range(3000):
+        collector.record_request(_metric(f"/e{i % 7}", 200, float(i)))
+    collector.flush()
+
+    stats = collector.get_request_stats(hours=1)
+    assert stats["total_requests"] == 3000
+    assert len(stats["endpoints"]) == 7
+
+
+def test_metric_to_dict_matches_fields():
+    metric = _metric("/a", 200, 1.5)
+
+    data = metric.to_dict()
+    assert data["endpoint"] == "/a"
+    assert data["timestamp"] == metric.timestamp
+    assert set(data) == {f for f in RequestMetric.__slots__ if f != "timestamp_ns"} | {"timestamp"}
+
+
+def test_health_status_flags():
+    from app.core.monitoring import HealthStatus
+
+    status = HealthStatus()
+    assert status.is_healthy
+
+    status.redis_healthy = False
+    assert status.is_healthy
+    assert status.to_dict()["redis"] == "unhealthy"
+
+    status.database_healthy = False
+    assert not status.is_healthy
+    assert status.to_dict()["status"] == "degraded"
+
+    status.database_healthy = True
+    assert status.is_healthy
+    assert status.to_dict()["database"] == "healthy"
+
+
+def test_cleanup_trims_old_service_metrics():
+    from app.core.monitoring import ServiceMetric
+
+    collector = MetricsCollector(retention_days=1)
+    now_ns = time.time_ns()
+    for age_hours in (48, 30, 1):
+        collector.record_service_metric(
+            ServiceMetric(
+                timestamp_ns=now_ns - age_hours * 3600 * 1_000_000_000,
+                service="facial",
+                operation="verify",
+                success=True,
+                duration_ms=2.0,
+            )
+        )
+    collector.flush()
+
+    collector.cleanup_old_metrics()
+
+    assert [m.timestamp_ns for m in collector.metrics["services"]] == [
+        now_ns - 3600 * 1_000_000_000
+    ]
@@ -0,0 +1,65 @@
+"""Tests for time-range partition helpers."""
+from datetime import date, datetime, timezone
+
+from app.db.partitioning import (
+    PARTITION_PREMAKE,
+    attach_partition_statements,
+    create_partition_statements,
+    default_partition_statement,
+    next_partition_start,
+    partition_name,
+    premake_starts,
+)
+
+
+def test_partition_bounds_roll_over_month_and_year():
+    assert next_partition_start(date(2026, 1, 31), "day") == date(2026, 2, 1)
+    assert next_partition_start(date(2026, 12, 1), "month") == date(2027, 1, 1)
+    assert partition_name("audit_logs", date(2026, 10, 17), "day") == "audit_logs_p20261017"
+
+
+def test_create_partition_statements_cover_range():
+    statements = create_partition_statements("audit_logs", date(2026, 10, 17), date(2026, 10, 19), "day")
+
+    assert len(statements) == 3
+    assert statements[0] == (
+        "CREATE TABLE IF NOT EXISTS audit_logs_p20261017 PARTITION OF audit_logs "
+        "FOR VALUES FROM ('2026-10-17 00:00:00+00') TO ('2026-10-18 00:00:00+00')"
+    )
+
+
+def test_premake_starts_reach_the_horizon():
+    today = datetime.now(timezone.utc).date()
+
+    starts = premake_starts("day")
+
+    assert starts[0] == today
+    assert len(starts) == PARTITION_PREMAKE + 1
+    assert premake_starts("month", since=date(2026, 1, 15))[0] == date(2026, 1, 1)
+
+
+def test_default_partition_statement():
+    assert default_partition_statement("messages") == (
+        "CREATE TABLE IF NOT EXISTS messages_default PARTITION OF messages DEFAULT"
+    )
+
+
+def test_attach_partition_moves_rows_out_of_default():
+    create, move, attach = attach_partition_statements(
+        "messages", date(2026, 10, 1), ["id", "sender_id", "created_at"]
+    )
+
+    assert create == (
+        "CREATE TABLE messages_p202610 "
+        "(LIKE messages INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)"
+    )
+    assert move == (
+        "WITH moved AS (DELETE FROM messages_default WHERE created_at >= '2026-10-01 00:00:00+00' "
+        "AND created_at < '2026-11-01 00:00:00+00' RETURNING *) "
+        "INSERT INTO messages_p202610 (id, sender_id, created_at) "
+        "SELECT id, sender_id, created_at FROM moved"
+    )
+    assert attach == (
+        "ALTER TABLE messages ATTACH PARTITION messages_p202610 "
+        "FOR VALUES FROM ('2026-10-01 00:00:00+00') TO ('2026-11-01 00:00:00+00')"
+    )
@@ -0,0 +1,35 @@
+"""Tests for the dictionary-encoded Student.class_name."""
+from app.models.school_class import SchoolClass
+from app.models.student import Student
+
+
+def _student(i, class_name):
+    return Student(
+        user_id=i,
+        student_code=f"S{i}",
+        first_name="A",
+        last_name="B",
+        email=f"s{i}@example.com",
+        class_name=class_name,
+    )
+
+
+def test_class_names_share_one_lookup_row(db_session):
+    db_session.add_all([_student(1, "DEV101"), _student(2, "DEV101"), _student(3, "DEV102")])
+    db_session.commit()
+
+    assert db_session.query(SchoolClass).count() == 2
+    assert db_session.query(Student).filter(Student.class_name == "DEV101").count() == 2
+    assert db_session.query(Student).filter(Student.class_name.in_(["DEV102"])).one().student_code == "S3"
+
+
+def test_reassigning_class_name(db_session):
+    student = _student(1, "DEV101")
+    db_session.add(student)
+    db_session.commit()
+
+    student.class_name = "DEV102"
+    db_session.commit()
+
+    assert student.class_name == "DEV102"
+    assert db_session.query(Student.class_name).scalar() == "DEV102"
@@ -0,0 +1,65 @@
+from datetime import date, datetime, time
+from types import SimpleNamespace
+
+import orjson
+
+from app.schemas.session_request import SessionRequestListOut
+
+
+def _row(**stored):
+    return SimpleNamespace(
+        id=1,
+        trainer_id=2,
+        trainer_name="Trainer",
+        trainer_email="trainer@smartpresence.com",
+        title="Rattrapage",
+        class_name="DEV101",
+        session_type=None,
+        notes=None,
+        status="pending",
+        admin_response=None,
+        reviewed_by=None,
+        reviewed_at=None,
+        created_at=datetime(2026, 1, 1),
+        updated_at=datetime(2026, 1, 1),
+        **stored,
+    )
+
+
+def test_stored_values_are_parsed_and_emitted_as_hh_mm():
+    listing = SessionRequestListOut(
+        requests=[_row(session_date="2026-10-20", start_time="09:00", end_time="10:30:00")],
+        total=1,
+        unread_count=1,
+    )
+
+    out = listing.requests[0]
+    assert (out.session_date, out.start_time, out.end_time) == (
+        date(2026, 10, 20),
+        time(9, 0),
+        time(10, 30),
+    )
+    body = orjson.loads(listing.model_dump_json())["requests"][0]
+    assert (body["session_date"], body["start_time"], body["end_time"]) == (
+        "2026-10-20",
+        "09:00",
+        "10:30",
+    )
+
+
+def test_legacy_free_form_values_do_not_fail_the_listing():
+    listing = SessionRequestListOut(
+        requests=[
+            _row(session_date="2026-10-20", start_time="09:00", end_time="10:30"),
+            _row(session_date="lundi prochain", start_time="9h", end_time="10h30"),
+        ],
+        total=2,
+        unread_count=2,
+    )
+
+    body = orjson.loads(listing.model_dump_json())["requests"][1]
+    assert (body["session_date"], body["start_time"], body["end_time"]) == (
+        "lundi prochain",
+        "9h",
+        "10h30",
+    )
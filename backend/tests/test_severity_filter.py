@@ -0,0 +1,31 @@
+"""Tests for severity query filters on the smart attendance routes."""
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.utils.deps import get_current_user, get_db
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1, role="admin")
+    app.dependency_overrides[get_db] = lambda: None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("path", ["/api/smart-attendance/alerts", "/api/smart-attendance/fraud-detections"])
+def test_unknown_severity_is_rejected_before_the_query(client, path):
+    response = client.get(path, params={"severity": "warning"})
+
+    assert response.status_code == 422
+    assert [error["field"] for error in response.json()["details"]] == ["query -> severity"]
+
+
+def test_severity_filter_is_documented_as_enum():
+    parameters = app.openapi()["paths"]["/api/smart-attendance/alerts"]["get"]["parameters"]
+    (severity,) = [p for p in parameters if p["name"] == "severity"]
+
+    assert severity["schema"]["anyOf"][0]["enum"] == ["low", "medium", "high", "critical"]
@@ -0,0 +1,42 @@
+"""Tests for the cached /storage static file mount."""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils.static_files import CachedStaticFiles
+
+
+def _client(directory, **kwargs):
+    app = FastAPI()
+    static = CachedStaticFiles(directory=str(directory), **kwargs)
+    app.mount("/storage", static, name="storage")
+    return TestClient(app), static
+
+
+def test_small_files_are_cached_and_refreshed_on_change(tmp_path):
+    image = tmp_path / "face.jpg"
+    image.write_bytes(b"v1")
+    client, static = _client(tmp_path)
+
+    first = client.get("/storage/face.jpg")
+    assert first.status_code == 200
+    assert first.content == b"v1"
+    assert first.headers["content-type"] == "image/jpeg"
+    assert len(static._cache) == 1
+
+    assert client.get("/storage/face.jpg").content == b"v1"
+    assert len(static._cache) == 1
+
+    image.write_bytes(b"version-2")
+    assert client.get("/storage/face.jpg").content == b"version-2"
+
+
+def test_etag_short_circuits_and_large_files_bypass_cache(tmp_path):
+    (tmp_path / "big.bin").write_bytes(b"x" * 100)
+    client, static = _client(tmp_path, max_file_size=10)
+
+    response = client.get("/storage/big.bin")
+    assert response.content == b"x" * 100
+    assert static._cache == {}
+
+    etag = response.headers["etag"]
+    assert client.get("/storage/big.bin", headers={"if-none-match": etag}).status_code == 304
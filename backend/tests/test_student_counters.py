@@ -0,0 +1,217 @@
+"""Tests for Redis-buffered student counters."""
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes.analytics import _compute_top_absences
+from app.api.routes.students import list_students
+from app.models.student import Student
+from app.services import student_counters
+
+
+class FakeRedis:
+    """Hashes with the reply types of redis-py: field names and values come back as bytes."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.commands = []
+
+    def hincrby(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[str(field)] = bucket.get(str(field), 0) + amount
+        return bucket[str(field)]
+
+    def hgetall(self, key):
+        self.commands.append("HGETALL")
+        return {field.encode(): str(value).encode() for field, value in self.hashes.get(key, {}).items()}
+
+    def hmget(self, key, fields):
+        self.commands.append("HMGET")
+        bucket = self.hashes.get(key, {})
+        return [str(bucket[str(f)]).encode() if str(f) in bucket else None for f in fields]
+
+    def delete(self, key):
+        return 1 if self.hashes.pop(key, None) is not None else 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((getattr(self.redis, name), args))
+
+    def execute(self):
+        return [call(*(a.decode() if isinstance(a, bytes) else a for a in args)) for call, args in self.calls]
+
+
+class FakeCache:
+    def __init__(self):
+        self.client = FakeRedis()
+
+    def available(self):
+        return True
+
+
+@pytest.fixture
+def student(db_session):
+    student = Student(
+        user_id=1,
+        student_code="S1",
+        first_name="A",
+        last_name="B",
+        email="a@b.c",
+        class_name="DEV101",
+        total_absence_hours=2,
+    )
+    db_session.add(student)
+    db_session.commit()
+    return student
+
+
+def test_without_redis_updates_row(monkeypatch, student):
+    monkeypatch.setattr(student_counters, "redis_cache", None)
+
+    student_counters.add_absence_hours(student, 3)
+
+    assert student.total_absence_hours == 5
+    assert student_counters.total_absence_hours(student) == 5
+
+
+def test_buffered_hours_are_read_until_flushed(monkeypatch, db_session, student):
+    monkeypatch.setattr(student_counters, "redis_cache", FakeCache())
+
+    student_counters.add_absence_hours(student, 3)
+    student_counters.add_absence_hours(student, 1)
+    db_session.commit()
+    assert student.total_absence_hours == 2
+    assert student_counters.total_absence_hours(student) == 6
+
+    execute = db_session.execute
+
+    def failing_execute(statement, *args, **kwargs):
+        if statement.is_dml:
+            raise RuntimeError("database unavailable")
+        return execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db_session, "execute", failing_execute)
+    with pytest.raises(RuntimeError):
+        student_counters.flush_student_counters(db_session)
+
+    # Deltas are put back for the next flush
+    assert student_counters.total_absence_hours(student) == 6
+
+
+def test_hours_reach_redis_only_on_commit(monkeypatch, db_session, student):
+    cache = FakeCache()
+    monkeypatch.setattr(student_counters, "redis_cache", cache)
+
+    student_counters.add_absence_hours(student, 3)
+    assert cache.client.hashes == {}
+    # Visible to readers in the same transaction
+    assert student_counters.total_absence_hours(student) == 5
+
+    db_session.commit()
+    assert cache.client.hashes == {"student_counters:absence_hours": {str(student.id): 3}}
+    assert student_counters.total_absence_hours(student) == 5
+
+
+def test_rolled_back_hours_are_dropped(monkeypatch, db_session, student):
+    cache = FakeCache()
+    monkeypatch.setattr(student_counters, "redis_cache", cache)
+
+    student_counters.add_absence_hours(student, 3)
+    db_session.rollback()
+    db_session.commit()
+
+    assert cache.client.hashes == {}
+    assert student_counters.total_absence_hours(student) == 2
+
+
+def test_hours_are_written_directly_when_redis_fails_at_commit(monkeypatch, db_session, student):
+    cache = FakeCache()
+    monkeypatch.setattr(student_counters, "redis_cache", cache)
+    student_counters.add_absence_hours(student, 3)
+
+    def failing_hincrby(key, field, amount):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(cache.client, "hincrby", failing_hincrby)
+    db_session.commit()
+
+    assert cache.client.hashes == {}
+    db_session.expire(student)
+    assert student.total_absence_hours == 5
+
+
+def _students(db_session, stored_hours):
+    students = [
+        Student(
+            user_id=index,
+            student_code=f"S{index}",
+            first_name="Student",
+            last_name=str(index),
+            email=f"s{index}@b.c",
+            class_name="DEV101",
+            total_absence_hours=hours,
+        )
+        for index, hours in enumerate(stored_hours, start=1)
+    ]
+    db_session.add_all(students)
+    db_session.commit()
+    return students
+
+
+def test_totals_for_a_page_take_one_hmget(monkeypatch, db_session):
+    cache = FakeCache()
+    monkeypatch.setattr(student_counters, "redis_cache", cache)
+    students = _students(db_session, [2, 0, 5])
+    cache.client.hincrby("student_counters:absence_hours", students[1].id, 4)
+
+    totals = student_counters.absence_hours_by_id(students)
+
+    assert [totals[s.id] for s in students] == [2, 4, 5]
+    assert cache.client.commands == ["HMGET"]
+
+
+def test_top_absences_include_buffered_hours(monkeypatch, db_session):
+    cache = FakeCache()
+    monkeypatch.setattr(student_counters, "redis_cache", cache)
+    first, second, third = _students(db_session, [3, 2, 0])
+    # Only buffered so far: outside the stored top 2
+    cache.client.hincrby("student_counters:absence_hours", third.id, 6)
+
+    top = _compute_top_absences(db_session, limit=2)
+
+    assert top == [
+        {"student_name": "Student 3", "absences": 6},
+        {"student_name": "Student 1", "absences": 3},
+    ]
+
+
+def test_flush_statement_updates_from_values():
+    statement = student_counters._flush_statement([{"id": 1, "absence_hours": 3}, {"id": 2, "absence_hours": 4}])
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "FROM (VALUES" in sql
+    assert "AS deltas (id, absence_hours)" in sql
+    assert "total_absence_hours=(coalesce(students.total_absence_hours" in sql
+
+
+def test_student_listing_reports_buffered_hours(monkeypatch, db_session):
+    cache = FakeCache()
+    monkeypatch.setattr(student_counters, "redis_cache", cache)
+    (student,) = _students(db_session, [2])
+    cache.client.hincrby("student_counters:absence_hours", student.id, 3)
+
+    response = list_students(
+        page=1, page_size=50, class_name=None, db=db_session, current_user=SimpleNamespace(role="admin")
+    )
+
+    assert [s["total_absence_hours"] for s in orjson.loads(response.body)["students"]] == [5]
@@ -0,0 +1,116 @@
+"""Tests for the Teams attendance report endpoint."""
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.models.school_class import SchoolClass
+from app.models.session import Session as CourseSession
+from app.models.smart_attendance import AttendanceSession, TeamsParticipation
+from app.models.student import Student
+from app.models.user import User
+from app.utils.deps import get_current_user, get_db
+
+REPORT = "/api/smart-attendance/teams/{attendance_session_id}/attendance-report"
+
+# SQLite stand-in for teams_participation: engagement_details is JSONB
+TEAMS_PARTICIPATION_DDL = """
+CREATE TABLE teams_participation (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    attendance_session_id INTEGER NOT NULL,
+    student_id INTEGER NOT NULL REFERENCES students (id),
+    teams_meeting_id VARCHAR(255) NOT NULL,
+    teams_participant_id VARCHAR(255) NOT NULL,
+    join_time DATETIME NOT NULL,
+    leave_time DATETIME,
+    presence_percentage NUMERIC(5, 2),
+    engagement_score INTEGER,
+    camera_on_minutes INTEGER,
+    mic_used_count INTEGER,
+    chat_messages_count INTEGER,
+    reactions_count INTEGER,
+    engagement_details TEXT,
+    created_at DATETIME,
+    updated_at DATETIME
+)
+"""
+
+
+@pytest.fixture
+def db():
+    # One connection shared by the test and the app's threadpool
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    for model in (User, SchoolClass, Student, CourseSession, AttendanceSession):
+        model.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(text(TEAMS_PARTICIPATION_DDL))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def attendance_session(db):
+    course = CourseSession(
+        title="Remote",
+        module_id=1,
+        trainer_id=1,
+        classroom_id=1,
+        session_date=date(2026, 10, 17),
+        start_time=time(8, 0),
+        end_time=time(9, 30),
+        duration_minutes=90,
+    )
+    student = Student(
+        user_id=1,
+        student_code="S1",
+        first_name="A",
+        last_name="B",
+        email="a@b.c",
+        class_name="DEV101",
+    )
+    db.add_all([course, student])
+    db.flush()
+    attendance = AttendanceSession(session_id=course.id, mode="teams_auto", teams_meeting_id="m-1")
+    db.add(attendance)
+    db.commit()
+    return SimpleNamespace(id=attendance.id, student_id=student.id)
+
+
+@pytest.fixture
+def client(db):
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1, role="trainer")
+    app.dependency_overrides[get_db] = lambda: db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_zoned_join_time_without_leave_time(client, db, attendance_session):
+    joined = datetime.utcnow().replace(microsecond=0) - timedelta(minutes=45)
+    report = [
+        {
+            "student_id": attendance_session.student_id,
+            "teams_participant_id": "p1",
+            "join_time": joined.isoformat() + "Z",
+        },
+        {"student_id": 999, "teams_participant_id": "p2", "join_time": joined.isoformat() + "Z"},
+    ]
+
+    response = client.post(REPORT.format(attendance_session_id=attendance_session.id), json=report)
+
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "participants": 1, "skipped_student_ids": [999]}
+    (row,) = db.query(TeamsParticipation).all()
+    assert (row.student_id, row.join_time, row.leave_time) == (
+        attendance_session.student_id,
+        joined,
+        None,
+    )
+    assert 49 <= float(row.presence_percentage) <= 51
@@ -0,0 +1,71 @@
+"""Tests for User-Agent id resolution and its committed-id cache."""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models.user_agent import UserAgent
+from app.services import user_agent
+from app.services.user_agent import get_user_agent_id, user_agent_hash
+
+UA = "Mozilla/5.0 (X11; Linux x86_64) Firefox/131.0"
+
+
+@pytest.fixture
+def sessions():
+    engine = create_engine("sqlite:///:memory:")
+    UserAgent.__table__.create(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    user_agent._ids.clear()
+    yield sessionmaker(bind=engine), statements
+    user_agent._ids.clear()
+
+
+def test_inserts_new_user_agent(sessions):
+    Session, _ = sessions
+    db = Session()
+
+    ua_id = get_user_agent_id(db, UA)
+    db.commit()
+
+    row = db.get(UserAgent, ua_id)
+    assert (row.ua_hash, row.ua_text) == (user_agent_hash(UA), UA)
+    assert get_user_agent_id(db, None) is None
+
+
+def test_existing_user_agent_resolves_through_conflict(sessions):
+    Session, statements = sessions
+    db = Session()
+    ua_id = get_user_agent_id(db, UA)
+    db.commit()
+    user_agent._ids.clear()
+    statements.clear()
+
+    assert get_user_agent_id(db, UA) == ua_id
+    assert [s.split()[0] for s in statements] == ["INSERT", "SELECT"]
+    assert db.query(UserAgent).count() == 1
+
+
+def test_committed_id_is_served_from_cache(sessions):
+    Session, statements = sessions
+    db = Session()
+    ua_id = get_user_agent_id(db, UA)
+    assert user_agent_hash(UA) not in user_agent._ids
+    db.commit()
+    statements.clear()
+
+    other = Session()
+    assert get_user_agent_id(other, UA) == ua_id
+    assert statements == []
+
+
+def test_rolled_back_id_is_not_cached(sessions):
+    Session, _ = sessions
+    db = Session()
+    get_user_agent_id(db, UA)
+    db.rollback()
+
+    assert user_agent._ids == {}
+    ua_id = get_user_agent_id(db, UA)
+    db.commit()
+    assert db.get(UserAgent, ua_id).ua_text == UA
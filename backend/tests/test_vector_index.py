@@ -0,0 +1,16 @@
+"""Tests for HNSW parameter selection."""
+from app.db.vector_index import configure_hnsw_params, hnsw_rebuild_statements
+
+
+def test_hnsw_params_scale_with_embedding_count():
+    assert configure_hnsw_params(0) == {"m": 16, "ef_construction": 64, "ef_search": 40}
+    assert configure_hnsw_params(250_000)["m"] == 24
+    assert configure_hnsw_params(5_000_000)["ef_search"] == 200
+
+
+def test_rebuild_statements_use_selected_params():
+    statements = hnsw_rebuild_statements(500_000)
+
+    assert statements[0].startswith("DROP INDEX CONCURRENTLY")
+    assert "WITH (m = 24, ef_construction = 100)" in statements[1]
+    assert "hnsw.ef_search = %s', current_database(), 100" in statements[2]
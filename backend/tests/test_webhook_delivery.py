@@ -0,0 +1,84 @@
+"""Tests for webhook delivery and its log/statistics writes."""
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.webhook import Webhook, WebhookLog
+from app.services.webhook_service import WebhookService
+
+# SQLite stand-in for the partitioned webhook_logs table: SQLite cannot
+# autoincrement the (id, created_at) primary key
+WEBHOOK_LOGS_DDL = """
+CREATE TABLE webhook_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    webhook_id INTEGER NOT NULL,
+    event_type VARCHAR(50),
+    request_payload JSON,
+    request_headers JSON,
+    response_status_code INTEGER,
+    response_body TEXT,
+    response_time_ms INTEGER,
+    success BOOLEAN,
+    error_message TEXT,
+    retry_count INTEGER DEFAULT 0,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Webhook.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(text(WEBHOOK_LOGS_DDL))
+    session = sessionmaker(bind=engine)()
+    session.add_all(
+        [
+            Webhook(name=name, url=f"https://receiver.example/{name}", event_type="checkin", max_retries=0)
+            for name in ("first", "second")
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def _deliver(db, handler):
+    real_client = httpx.AsyncClient
+    transport = httpx.MockTransport(handler)
+    with patch("httpx.AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs)):
+        return asyncio.run(WebhookService.trigger_event(db, "checkin", {"student_id": 42}))
+
+
+def test_no_transaction_is_held_during_delivery(db):
+    in_transaction = []
+
+    def handler(request):
+        in_transaction.append(db.in_transaction())
+        return httpx.Response(200 if request.url.path == "/first" else 500, text="ok")
+
+    _deliver(db, handler)
+
+    assert in_transaction == [False, False]
+    logs = db.query(WebhookLog.webhook_id, WebhookLog.success).order_by(WebhookLog.webhook_id).all()
+    assert logs == [(1, True), (2, False)]
+    stats = db.query(Webhook.total_calls, Webhook.successful_calls, Webhook.failed_calls).order_by(Webhook.id)
+    assert stats.all() == [(1, 1, 0), (1, 0, 1)]
+
+
+def test_logs_are_written_when_delivery_is_interrupted(db):
+    def handler(request):
+        if request.url.path == "/second":
+            raise asyncio.CancelledError()
+        return httpx.Response(200, text="ok")
+
+    with pytest.raises(asyncio.CancelledError):
+        _deliver(db, handler)
+
+    assert db.query(WebhookLog.webhook_id, WebhookLog.success).all() == [(1, True)]
+    assert db.get(Webhook, 1).successful_calls == 1
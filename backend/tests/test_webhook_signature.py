@@ -0,0 +1,70 @@
+"""Tests for webhook body signatures and the signature header."""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.services.webhook_service import WebhookService
+
+BODY = b'{"event":"checkin","student_id":42}'
+SECRET = "s3cret"
+
+# Reference digests from `openssl dgst -sha256 -hmac s3cret` and
+# `openssl mac -macopt key:s3cret -macopt size:32 BLAKE2BMAC` over BODY
+HMAC_SHA256 = "c6ec55204441cc9dcffb1f43596f392a808e71ef5f7e1eafc048ee33a671d18c"
+BLAKE2B = "2bbe4072d5bee23898b9985e39f8e4e94f62680c4727061393da6b6ae298b3f1"
+
+
+def test_hmac_sha256_signature():
+    assert WebhookService._generate_signature(BODY, SECRET) == HMAC_SHA256
+    assert WebhookService._generate_signature(BODY, SECRET, "hmac-sha256") == HMAC_SHA256
+    # RFC 4231 test case 2
+    assert WebhookService._generate_signature(b"what do ya want for nothing?", "Jefe") == (
+        "5bdcc146bf60754e6a042426089575c75a003f089d2739839dec58b964ec3843"
+    )
+
+
+def test_blake2b_signature():
+    assert WebhookService._generate_signature(BODY, SECRET, "blake2b") == BLAKE2B
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algo, digest", [("hmac-sha256", HMAC_SHA256), ("blake2b", BLAKE2B)])
+async def test_signature_header_covers_sent_body(algo, digest):
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, text="ok")
+
+    transport = httpx.MockTransport(handler)
+    webhook = SimpleNamespace(
+        id=1,
+        url="https://receiver.example/hook",
+        event_type="checkin",
+        payload_template=None,
+        custom_headers=None,
+        secret_key=SECRET,
+        signature_algo=algo,
+        auth_header=None,
+        total_calls=0,
+        successful_calls=0,
+        failed_calls=0,
+        last_called_at=None,
+        last_status_code=None,
+        max_retries=0,
+    )
+    logs = []
+
+    real_client = httpx.AsyncClient
+    with patch("httpx.AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs)):
+        await WebhookService._execute_webhook(
+            None, webhook, {"student_id": 42, "event": "checkin"}, logs
+        )
+
+    (request,) = sent
+    assert request.content == BODY
+    assert request.headers["X-Webhook-Signature"] == digest
+    assert request.headers["X-Webhook-Signature-Algorithm"] == algo
+    assert logs[0]["success"] is True